@@ -0,0 +1,15 @@
+import sys
+
+from kronosparser import adversarial
+
+
+def main():
+    failures = adversarial.check()
+    for name, exponent in failures:
+        print('{} grows super-linearly (exponent {:.2f} > {})'.format(name, exponent,
+                                                                      adversarial.MAX_EXPONENT))
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
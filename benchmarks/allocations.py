@@ -0,0 +1,76 @@
+import gc
+import time
+import tracemalloc
+
+from kronosparser import parse_dates
+from kronosparser.locales import freeze_grammars
+
+TEXTS = [
+    'good morning! I need the report now, by tomorrow noon, or next week',
+    'can we meet next friday at 3pm or the week after, good evening',
+    'the invoice 2020-31-03 was wrong, please resend it by the end of the month',
+    'nothing to see in this message at all, just a regular chat line',
+]
+
+
+class GCPauses:
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self._start = None
+
+    def __call__(self, phase, info):
+        if phase == 'start':
+            self._start = time.perf_counter()
+        else:
+            self.count += 1
+            self.total += time.perf_counter() - self._start
+
+
+def allocations_per_call(calls):
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for index in range(calls):
+        parse_dates(TEXTS[index % len(TEXTS)])
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, 'filename')
+    blocks = sum(max(stat.count_diff, 0) for stat in stats)
+    return blocks / calls
+
+
+def gc_pauses(calls):
+    pauses = GCPauses()
+    gc.callbacks.append(pauses)
+    try:
+        start = time.perf_counter()
+        for index in range(calls):
+            parse_dates(TEXTS[index % len(TEXTS)])
+        elapsed = time.perf_counter() - start
+    finally:
+        gc.callbacks.remove(pauses)
+    return pauses, elapsed
+
+
+def main(calls=2000, freeze=True):
+    for text in TEXTS:
+        parse_dates(text)
+    peaks = []
+    for text in TEXTS:
+        tracemalloc.start()
+        parse_dates(text)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    print('retained blocks per call: {:.2f}'.format(allocations_per_call(calls // 10)))
+    print('peak traced memory per call: {:.0f} KiB'.format(max(peaks) / 1024))
+    for frozen in ([False, True] if freeze else [False]):
+        if frozen:
+            freeze_grammars()
+        pauses, elapsed = gc_pauses(calls)
+        print('{}: {} calls in {:.2f} s, {} collections, {:.1f} ms in GC'.format(
+            'frozen grammars' if frozen else 'default', calls, elapsed, pauses.count,
+            pauses.total * 1000))
+
+
+if __name__ == '__main__':
+    main()
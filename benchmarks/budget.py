@@ -0,0 +1,51 @@
+import random
+import time
+
+from kronosparser import parse_dates
+
+
+def adversarial_corpus(rng, size):
+    units = ['1:2:', '1.2.', '1/', '12-', '2020-03-11 12:16:02,123 INFO took 15 ms at 10:22\n']
+    corpus = []
+    for _ in range(size):
+        if rng.random() < 0.2:
+            corpus.append(''.join(
+                rng.choice('0123456789') for _ in range(rng.randrange(100, 5000))))
+        else:
+            corpus.append(rng.choice(units) * rng.randrange(10, 1000))
+    return corpus
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def run(corpus, **kwargs):
+    latencies = []
+    truncated = 0
+    for text in corpus:
+        start = time.perf_counter()
+        truncated += parse_dates(text, **kwargs).truncated
+        latencies.append(time.perf_counter() - start)
+    return latencies, truncated
+
+
+def main(size=100, max_time=0.05):
+    corpus = adversarial_corpus(random.Random(0), size)
+    budgets = [
+        ('unbounded', {}),
+        ('max_time={}'.format(max_time), dict(max_time=max_time)),
+        ('max_length=2000', dict(max_length=2000)),
+    ]
+    for label, kwargs in budgets:
+        latencies, truncated = run(corpus, **kwargs)
+        print('{:>16}: p50 {:7.1f} ms  p99.9 {:7.1f} ms  max {:7.1f} ms  truncated {}'.format(
+            label,
+            percentile(latencies, 0.5) * 1000,
+            percentile(latencies, 0.999) * 1000,
+            max(latencies) * 1000, truncated))
+
+
+if __name__ == '__main__':
+    main()
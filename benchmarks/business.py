@@ -0,0 +1,54 @@
+import datetime
+import random
+import time
+
+from kronosparser import business, holidays
+
+
+def add_business_days_naive(day, count, closed):
+    # Reference day-by-day walk
+    while count > 0:
+        day += datetime.timedelta(days=1)
+        if day.weekday() not in business.WEEKEND and day not in closed:
+            count -= 1
+    return day
+
+
+def main(items=200000, count=10):
+    start = time.perf_counter()
+    calendar = business.BusinessCalendar('US')
+    print('calendar build: {:.1f} ms'.format((time.perf_counter() - start) * 1000))
+
+    rng = random.Random(0)
+    days = [
+        datetime.date(2020, 1, 1) + datetime.timedelta(days=rng.randrange(3650))
+        for _ in range(items)
+    ]
+    closed = holidays.observed_holidays('US')
+
+    start = time.perf_counter()
+    expected = [add_business_days_naive(day, count, closed) for day in days]
+    naive = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = calendar.add_business_days_many(days, count)
+    ranked = time.perf_counter() - start
+    # Both agree whenever the starting day is itself a business day
+    assert all(result[i] == expected[i] for i, day in enumerate(days)
+               if calendar.is_business_day(day))
+
+    print('{} days, +{} business days'.format(items, count))
+    print('  day-by-day: {:8.1f} ms'.format(naive * 1000))
+    print('      ranked: {:8.1f} ms'.format(ranked * 1000))
+    print('{:.1f} us per item'.format(ranked / len(result) * 1e6))
+
+    moments = [datetime.datetime.combine(day, datetime.time(rng.randrange(24))) for day in days]
+    start = time.perf_counter()
+    for moment in moments:
+        calendar.add_working_time(moment, datetime.timedelta(hours=30))
+    print('working hours: {:.1f} us per item'.format(
+        (time.perf_counter() - start) / len(moments) * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,29 @@
+import time
+
+from kronosparser import corpus, parse_dates
+
+
+def main(sentences=2000, generated=200000):
+    start = time.perf_counter()
+    for _ in corpus.generate(generated, seed=0):
+        pass
+    print('generation: {:.0f} sentences/s'.format(generated / (time.perf_counter() - start)))
+
+    samples = list(corpus.generate(sentences, seed=1))
+    characters = sum(len(sample['text']) for sample in samples)
+    expected = sum(len(sample['expressions']) for sample in samples)
+    found = 0
+    start = time.perf_counter()
+    for sample in samples:
+        spans = {(match['start'], match['start'] + len(match['text'].rstrip()))
+                 for match in parse_dates(sample['text'])}
+        found += sum((expression['start'], expression['end']) in spans
+                     for expression in sample['expressions'])
+    elapsed = time.perf_counter() - start
+    print('parsing: {:.0f} sentences/s, {:.0f} characters/s'.format(sentences / elapsed,
+                                                                    characters / elapsed))
+    print('labelled expressions found at their offsets: {}/{}'.format(found, expected))
+
+
+if __name__ == '__main__':
+    main()
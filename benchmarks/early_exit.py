@@ -0,0 +1,26 @@
+import time
+
+from kronosparser import first_date, has_date, parse_dates
+
+
+def timed(function, text, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function(text)
+    return (time.perf_counter() - start) / repeat
+
+
+def main(repeat=5):
+    text = 'the report is due tomorrow noon, ' + 'and there is nothing else to read here ' * 2000
+    print('{} characters, one early date'.format(len(text)))
+    print('      parse_dates: {:8.1f} ms'.format(timed(parse_dates, text, repeat) * 1000))
+    print('    max_matches=1: {:8.1f} ms'.format(
+        timed(lambda value: parse_dates(value, max_matches=1), text, repeat) * 1000))
+    print('       first_date: {:8.1f} ms'.format(timed(first_date, text, repeat) * 1000))
+    print('         has_date: {:8.1f} ms'.format(timed(has_date, text, repeat) * 1000))
+    plain = 'there is nothing to read here ' * 2000
+    print('has_date, no date: {:8.1f} ms'.format(timed(has_date, plain, repeat) * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+import random
+import time
+from datetime import datetime, timedelta
+
+from kronosparser import batch, clock, parse_dates
+
+MESSAGES = [
+    'ok', 'thanks!', 'see you tomorrow', 'can we do next friday at 3pm?', 'call me now',
+    'running 10 minutes late', 'by the end of the week please', 'lunch at noon?',
+    'I sent it yesterday', 'let us talk on monday', 'good morning', 'in 2 hours',
+    'happy thanksgiving', 'the demo is on march 3rd', 'sounds good'
+]
+TIMEZONES = ['US/Pacific', 'US/Eastern', 'Europe/London']
+
+
+def sample(rng, rows, years=3):
+    # A few busy conversations a day, messages close to each other in time
+    start = datetime(2018, 1, 1)
+    history = []
+    while len(history) < rows:
+        moment = start + timedelta(seconds=rng.randrange(years * 365 * 86400))
+        tz = rng.choice(TIMEZONES)
+        for _ in range(rng.randrange(5, 30)):
+            moment += timedelta(seconds=rng.randrange(600))
+            history.append((rng.choice(MESSAGES), moment, tz))
+    return history[:rows]
+
+
+def main(rows=20000):
+    history = sample(random.Random(0), rows)
+
+    start = time.perf_counter()
+    expected = []
+    for text, reference_time, tz in history:
+        with clock.use_time(reference_time):
+            expected.append(parse_dates(text, tz=tz))
+    naive = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = batch.parse_history(history)
+    grouped = time.perf_counter() - start
+    assert results == expected
+
+    print('{} messages over 3 years'.format(rows))
+    print('  parse_dates per row: {:7.0f} rows/s'.format(rows / naive))
+    print('        parse_history: {:7.0f} rows/s ({:.1f}x)'.format(rows / grouped, naive / grouped))
+
+
+if __name__ == '__main__':
+    main()
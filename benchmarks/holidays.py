@@ -0,0 +1,47 @@
+import functools
+import timeit
+
+from kronosparser import holidays, parse_dates
+
+PHRASES = [
+    'after Thanksgiving', 'before Christmas', 'the week of Memorial Day', 'next labor day at 9am',
+    '2 days before easter', 'no holidays in this sentence at all'
+]
+
+
+def resolve_with_rules(rules, names, years):
+    for year in years:
+        for name in names:
+            rules[name](year)
+
+
+def resolve_with_index(index, names, years):
+    for year in years:
+        for name in names:
+            index.get(name, year)
+
+
+def main(number=20):
+    rules = holidays.REGIONS['US']
+    names = sorted(rules)
+    years = range(2000, 2050)
+    index = holidays.get_index('US')
+    for label, func, table in [('rules', resolve_with_rules, rules),
+                               ('index', resolve_with_index, index)]:
+        seconds = min(
+            timeit.repeat(functools.partial(func, table, names, years), number=number, repeat=5))
+        per_lookup = seconds / (number * len(names) * len(years)) * 1e9
+        print('{:>6}: {:8.1f} ns/lookup'.format(label, per_lookup))
+
+    start = timeit.default_timer()
+    holidays.HolidayIndex(rules)
+    print('index build: {:.1f} ms for {} years'.format(
+        (timeit.default_timer() - start) * 1000, holidays.LAST_YEAR - holidays.FIRST_YEAR + 1))
+
+    seconds = min(
+        timeit.repeat(lambda: [parse_dates(phrase) for phrase in PHRASES], number=1, repeat=5))
+    print('parse: {:.2f} ms/phrase'.format(seconds / len(PHRASES) * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,28 @@
+import time
+
+from kronosparser.incremental import IncrementalParser
+
+PARAGRAPH = ('I need the report now, by tomorrow noon, or next week. Can we meet next friday at '
+             '3pm? Nothing to see in this sentence. The invoice was sent three days ago.\n')
+
+
+def keystroke_latency(paragraphs, keystrokes=50):
+    session = IncrementalParser(PARAGRAPH * paragraphs)
+    middle = len(session.text) // 2
+    start = time.perf_counter()
+    for i, character in enumerate('see you on monday at noon. ' * 2):
+        if i == keystrokes:
+            break
+        session.edit(middle + i, 0, character)
+    return (time.perf_counter() - start) / keystrokes
+
+
+def main():
+    for paragraphs in [1, 10, 100, 1000]:
+        latency = keystroke_latency(paragraphs)
+        print('{:>8} chars: {:.2f} ms/keystroke'.format(
+            len(PARAGRAPH) * paragraphs, latency * 1000))
+
+
+if __name__ == '__main__':
+    main()
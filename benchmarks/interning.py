@@ -0,0 +1,56 @@
+import copy
+import itertools
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from kronosparser import batch
+from kronosparser.interning import InternPool
+
+PHRASES = [
+    'see you tomorrow', 'can we do next friday at 3pm?', 'by the end of the week please',
+    'lunch at noon?', 'I sent it yesterday', 'next week works', 'the demo is on march 3rd',
+    'every other monday at noon', 'in 2 hours'
+]
+
+
+def build(results, matches, pool):
+    # A result set of `matches` matches, as a large batch would return them
+    built = []
+    count = 0
+    for result in itertools.cycle(results):
+        built.append(copy.deepcopy(result) if pool is None else pool.matches(result))
+        count += len(result)
+        if count >= matches:
+            break
+    return built
+
+
+def measure(results, matches, pool):
+    tracemalloc.start()
+    start = time.perf_counter()
+    built = build(results, matches, pool)
+    elapsed = time.perf_counter() - start
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del built
+    return size, elapsed
+
+
+def main(matches=1000000, days=30):
+    # Results differ from day to day, so the distinct values are those of `days` reference days
+    results = []
+    for day in range(days):
+        results.extend(
+            batch.parse_batch(PHRASES, reference_time=datetime(2020, 3, 1, 12) + timedelta(day)))
+
+    copied, copying = measure(results, matches, None)
+    interned, interning = measure(results, matches, InternPool())
+    print('{} matches, {} distinct results'.format(matches, len(results)))
+    print('    copies: {:7.1f} MiB ({:.1f} s)'.format(copied / 2**20, copying))
+    print('  interned: {:7.1f} MiB ({:.1f} s), {:.1f}x smaller'.format(
+        interned / 2**20, interning, copied / interned))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+import argparse
+import datetime
+import random
+import time
+
+from kronosparser.interval_index import IntervalIndex
+from kronosparser.time_interval import TimeInterval
+
+ORIGIN = datetime.datetime(2020, 1, 1)
+
+
+def random_intervals(count, rng):
+    intervals = []
+    for _ in range(count):
+        start = ORIGIN + datetime.timedelta(minutes=rng.randrange(60 * 24 * 365 * 5))
+        intervals.append(
+            TimeInterval(start, start + datetime.timedelta(minutes=rng.randrange(30, 60 * 24 * 3))))
+    return intervals
+
+
+def timed(label, func, repeat=1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    elapsed = time.perf_counter() - start
+    print('{:>22}: {:10.3f} ms{}'.format(label, elapsed * 1000 / repeat,
+                                         '' if repeat == 1 else ' per query'))
+    return result
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Benchmark the parsed interval index.')
+    arg_parser.add_argument('--intervals', type=int, default=1000000)
+    arg_parser.add_argument('--queries', type=int, default=1000)
+    args = arg_parser.parse_args()
+
+    rng = random.Random(0)
+    intervals = random_intervals(args.intervals, rng)
+    slots = [
+        ORIGIN + datetime.timedelta(minutes=rng.randrange(60 * 24 * 365 * 5))
+        for _ in range(args.queries)
+    ]
+
+    index = timed('bulk build', lambda: IntervalIndex(intervals))
+    incremental = IntervalIndex()
+    timed('incremental insert', lambda: [incremental.add(interval) for interval in intervals])
+
+    slot_iter = iter(slots * 3)
+    timed('stab', lambda: index.stab(next(slot_iter)), repeat=args.queries)
+    timed('overlap (1 hour slot)',
+          lambda: index.overlap(*(lambda slot: (slot, slot + datetime.timedelta(hours=1)))
+                                (next(slot_iter))),
+          repeat=args.queries)
+    timed('nearest', lambda: index.nearest(next(slot_iter)), repeat=args.queries)
+
+    slot = slots[0]
+    timed(
+        'linear scan overlap', lambda:
+        [interval for interval in intervals if interval.get_start() <= slot <= interval.get_end()])
+
+
+if __name__ == '__main__':
+    main()
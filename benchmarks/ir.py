@@ -0,0 +1,43 @@
+import json
+import random
+import time
+from datetime import datetime, timedelta
+
+from kronosparser import Parser, corpus, ir
+
+
+def main(sentences=500, evaluations=3):
+    texts = [sample['text'] for sample in corpus.generate(sentences, seed=2)]
+    rng = random.Random(0)
+    references = [
+        datetime(2020, 1, 1) + timedelta(seconds=rng.randrange(2 * 365 * 86400))
+        for _ in range(evaluations)
+    ]
+    parser = Parser(cache_size=0)
+
+    start = time.perf_counter()
+    compiled = [json.dumps(ir.compile_ir(text)) for text in texts]
+    compiling = time.perf_counter() - start
+    compiled = [json.loads(nodes) for nodes in compiled]
+
+    start = time.perf_counter()
+    expected = [
+        parser.parse(text, reference_time=reference) for reference in references for text in texts
+    ]
+    parsing = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = [ir.evaluate(nodes, reference) for reference in references for nodes in compiled]
+    evaluating = time.perf_counter() - start
+    assert results == [list(matches) for matches in expected]
+
+    count = len(texts) * len(references)
+    print('{} sentences, {} reference times'.format(len(texts), len(references)))
+    print(' compile once: {:7.0f} sentences/s'.format(len(texts) / compiling))
+    print(' Parser.parse: {:7.0f} sentences/s'.format(count / parsing))
+    print('     evaluate: {:7.0f} sentences/s ({:.1f}x)'.format(count / evaluating,
+                                                                parsing / evaluating))
+
+
+if __name__ == '__main__':
+    main()
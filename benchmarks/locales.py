@@ -0,0 +1,41 @@
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from kronosparser import locales, time_parser
+
+IMPORT_SNIPPET = 'import time; start = time.perf_counter(); import kronosparser; ' \
+                 'print(time.perf_counter() - start)'
+
+
+def import_time(repeat=5):
+    timings = []
+    for _ in range(repeat):
+        output = subprocess.check_output([sys.executable, '-c', IMPORT_SNIPPET])
+        timings.append(float(output))
+    return min(timings)
+
+
+def build_cost(locale):
+    pack = __import__(locales.LOCALE_PACKS[locale], fromlist=['LOCALE'])
+    tracemalloc.start()
+    start = time.perf_counter()
+    grammar = time_parser.build_grammar(pack)
+    elapsed = time.perf_counter() - start
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del grammar
+    return elapsed, retained, peak
+
+
+def main():
+    print('import kronosparser: {:.1f} ms'.format(import_time() * 1000))
+    for locale in sorted(locales.LOCALE_PACKS):
+        elapsed, retained, peak = build_cost(locale)
+        print('{}: build {:.1f} ms, {:.0f} KiB retained, {:.0f} KiB peak'.format(
+            locale, elapsed * 1000, retained / 1024, peak / 1024))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+import random
+import time
+from datetime import datetime
+
+from kronosparser import Parser, ir
+from kronosparser.memo import SpanMemo
+
+PHRASES = [
+    'tomorrow', 'next week', 'at 3pm', 'by the end of the month', 'tonight', 'next friday',
+    'in 2 hours', 'on monday morning'
+]
+WORDS = 'ok so can we meet and talk about the report please thanks maybe later'.split()
+
+
+def message(rng):
+    before = ' '.join(rng.choice(WORDS) for _ in range(rng.randrange(2, 10)))
+    after = ' '.join(rng.choice(WORDS) for _ in range(rng.randrange(0, 6)))
+    return '{} {} {}'.format(before, rng.choice(PHRASES), after).strip()
+
+
+def main(messages=1000):
+    rng = random.Random(0)
+    texts = [message(rng) for _ in range(messages)]
+    reference_time = datetime(2020, 3, 11, 19, 16, 2)
+    parser = Parser(cache_size=0)
+    memo = SpanMemo().warm_up(PHRASES, reference_time)
+
+    start = time.perf_counter()
+    expected = [parser.parse(text, reference_time=reference_time) for text in texts]
+    parsing = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = [memo.parse(text, reference_time) for text in texts]
+    memoized = time.perf_counter() - start
+    assert results == expected
+
+    compiled = [ir.compile_ir(text) for text in texts]
+    start = time.perf_counter()
+    evaluated = [ir.evaluate(nodes, reference_time) for nodes in compiled]
+    evaluating = time.perf_counter() - start
+    start = time.perf_counter()
+    assert [ir.evaluate(nodes, reference_time, memo=memo) for nodes in compiled] == evaluated
+    evaluating_memoized = time.perf_counter() - start
+
+    print('{} messages, {} distinct phrases'.format(messages, len(PHRASES)))
+    print('           Parser.parse: {:8.0f} messages/s'.format(messages / parsing))
+    print('         SpanMemo.parse: {:8.0f} messages/s'.format(messages / memoized))
+    print('            ir.evaluate: {:8.0f} messages/s'.format(messages / evaluating))
+    print('  ir.evaluate with memo: {:8.0f} messages/s'.format(messages / evaluating_memoized))
+    print(memo.stats())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+import os
+import random
+import time
+
+from kronosparser import parse_dates
+from kronosparser.parallel import parse_document
+
+
+def transcript(rng, size):
+    sentences = [
+        'Let us meet tomorrow at 5pm to go over the numbers.',
+        'I already sent the slides last friday, did you get them?',
+        'The contract renews every other month, starting on march 3rd 2020.',
+        'Okay, sounds good, talk to you soon.',
+        'Can we push the review to the end of next week?',
+        'Honestly I do not remember what we agreed on.',
+    ]
+    lines = []
+    length = 0
+    while length < size:
+        line = 'Speaker {}: {}'.format(rng.randrange(1, 4), rng.choice(sentences))
+        lines.append(line)
+        length += len(line) + 1
+    return '\n'.join(lines)
+
+
+def main(size=200000, chunk_size=20000):
+    text = transcript(random.Random(0), size)
+    print('{} characters, {} cores'.format(len(text), os.cpu_count()))
+
+    start = time.perf_counter()
+    expected = parse_dates(text)
+    serial = time.perf_counter() - start
+    print('      parse_dates: {:7.2f} s'.format(serial))
+
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        start = time.perf_counter()
+        matches = parse_document(text, workers=workers, chunk_size=chunk_size)
+        elapsed = time.perf_counter() - start
+        assert matches == expected
+        print('{:>2} parse_document: {:7.2f} s ({:.1f}x)'.format(workers, elapsed,
+                                                                 serial / elapsed))
+        workers *= 2
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+import datetime
+import random
+import time
+import tracemalloc
+
+from kronosparser.recurrence import UNITS, Recurrence
+
+
+def recurrences(count, seed=0):
+    rng = random.Random(seed)
+    start = datetime.date(2020, 1, 1)
+    return [
+        Recurrence(start + datetime.timedelta(days=rng.randrange(365)),
+                   unit=rng.choice(UNITS),
+                   interval=rng.randint(1, 3),
+                   time=rng.choice([None, datetime.time(rng.randrange(24))])) for _ in range(count)
+    ]
+
+
+def main(count=10000):
+    rules = recurrences(count)
+    window = (datetime.date(2021, 1, 1), datetime.date(2021, 12, 31))
+
+    start = time.perf_counter()
+    occurrences = sum(1 for rule in rules for _ in rule.between(*window))
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    for rule in rules:
+        for _ in rule.between(*window):
+            pass
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print('expanded {} recurrences into {} occurrences in {:.1f} ms ({:.0f} KiB peak)'.format(
+        count, occurrences, elapsed * 1000, peak / 1024))
+
+    every_day = Recurrence(datetime.date(2020, 1, 1))
+    start = time.perf_counter()
+    last = list(every_day.between(datetime.date(9999, 12, 1), datetime.date(9999, 12, 31)))[-1]
+    print('far-future window of a daily rule ({}) in {:.3f} ms'.format(
+        last, (time.perf_counter() - start) * 1000))
+
+
+if __name__ == '__main__':
+    main()
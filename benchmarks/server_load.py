@@ -0,0 +1,97 @@
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from kronosparser import corpus
+from kronosparser.client import Client
+
+# Reproducible synthetic sentences rather than real messages
+TEXTS = [sample['text'] for sample in corpus.generate(256, seed=0, length=(4, 16))]
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def run_worker(address, requests, pipeline, latencies, lock):
+    client = Client(**address)
+    local = []
+    try:
+        for i in range(0, requests, pipeline):
+            batch = [TEXTS[(i + j) % len(TEXTS)] for j in range(min(pipeline, requests - i))]
+            start = time.perf_counter()
+            if pipeline == 1:
+                client.parse_dates(batch[0])
+            else:
+                client.parse_many(batch)
+            elapsed = time.perf_counter() - start
+            local.extend([elapsed] * len(batch))
+    finally:
+        client.close()
+    with lock:
+        latencies.extend(local)
+
+
+def wait_for_server(address, timeout=30.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            Client(**address).close()
+            return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError('parse server did not start')
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Load test the kronosparser parse server.')
+    arg_parser.add_argument('--unix', help='socket of a running server (default: spawn one)')
+    arg_parser.add_argument('--port', type=int, help='TCP port of a running server')
+    arg_parser.add_argument('--clients', type=int, default=8)
+    arg_parser.add_argument('--requests', type=int, default=2000, help='requests per client')
+    arg_parser.add_argument('--pipeline', type=int, default=1, help='requests in flight per client')
+    args = arg_parser.parse_args()
+
+    server = None
+    if args.unix is None and args.port is None:
+        args.unix = os.path.join(tempfile.mkdtemp(), 'kronosparser.sock')
+        server = subprocess.Popen(
+            [sys.executable, '-m', 'kronosparser.server', '--unix', args.unix])
+    address = {'path': args.unix} if args.unix else {'port': args.port}
+    try:
+        wait_for_server(address)
+        latencies = []
+        lock = threading.Lock()
+        threads = [
+            threading.Thread(target=run_worker,
+                             args=(address, args.requests, args.pipeline, latencies, lock))
+            for _ in range(args.clients)
+        ]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    latencies.sort()
+    print('clients={} pipeline={} requests={}'.format(args.clients, args.pipeline, len(latencies)))
+    print('throughput: {:.0f} req/s'.format(len(latencies) / elapsed))
+    for label, fraction in [('p50', 0.5), ('p90', 0.9), ('p99', 0.99), ('p99.9', 0.999)]:
+        print('{:>6}: {:.3f} ms'.format(label, percentile(latencies, fraction) * 1000))
+    print('   max: {:.3f} ms'.format(latencies[-1] * 1000 if latencies else 0.0))
+
+
+if __name__ == '__main__':
+    main()
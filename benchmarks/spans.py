@@ -0,0 +1,30 @@
+import time
+
+from kronosparser import parse_dates, parse_spans
+
+
+def main(repeat=20):
+    filler = 'the rest of this message is just regular chat without any dates in it. ' * 40
+    text = (filler + 'can we meet tomorrow at 5pm? ' + filler + 'otherwise next friday works. ' +
+            filler)
+    spans = [(match['start'], match['end']) for match in parse_dates(text)]
+    print('{} characters, {} spans of {} characters'.format(
+        len(text), len(spans), sum(end - start for start, end in spans)))
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        expected = parse_dates(text)
+    full = (time.perf_counter() - start) / repeat
+
+    for anchored in [False, True]:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            result = parse_spans(text, spans, anchored=anchored)
+        elapsed = (time.perf_counter() - start) / repeat
+        assert [match for matches in result for match in matches] == expected
+        print('parse_spans(anchored={}): {:6.2f} ms vs parse_dates {:6.2f} ms ({:.0f}x)'.format(
+            anchored, elapsed * 1000, full * 1000, full / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+import random
+import time
+from datetime import datetime
+
+import pytz
+
+from kronosparser import batch, clock, parse_dates
+
+MESSAGES = [
+    'ok', 'thanks!', 'see you tomorrow', 'can we do next friday at 3pm?', 'call me now',
+    'running 10 minutes late', 'by the end of the week please', 'lunch at noon?',
+    'I sent it yesterday', 'let us talk on monday', 'good morning', 'in 2 hours',
+    'the demo is on march 3rd', 'sounds good', 'next week works'
+]
+
+
+def main(items=5000, timezones=300):
+    rng = random.Random(0)
+    zones = rng.sample(pytz.common_timezones, timezones)
+    batch_items = [(rng.choice(MESSAGES), rng.choice(zones), rng.random() < 0.5, rng.random() < 0.5)
+                   for _ in range(items)]
+    reference_time = datetime(2020, 3, 11, 19, 16, 2)
+
+    start = time.perf_counter()
+    with clock.use_time(reference_time):
+        expected = [
+            parse_dates(text, future=future, interval_to_date=interval_to_date, tz=tz)
+            for text, tz, future, interval_to_date in batch_items
+        ]
+    per_item = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = batch.parse_batch(batch_items, reference_time=reference_time)
+    grouped = time.perf_counter() - start
+    assert results == expected
+
+    print('{} items over {} timezones'.format(items, timezones))
+    print('  parse_dates per item: {:7.0f} items/s'.format(items / per_item))
+    print('           parse_batch: {:7.0f} items/s ({:.1f}x)'.format(items / grouped,
+                                                                     per_item / grouped))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+import threading
+import time
+from datetime import datetime
+
+from kronosparser import Parser
+
+TEXTS = [
+    'I need the report now, by tomorrow noon, or next week',
+    'can we meet next friday at 3pm or the week after',
+    'within 4 working hours or in 2 business days',
+    'every other monday at 10am starting after thanksgiving',
+]
+
+
+def make_parsers():
+    # Different timezones and clocks so that any cross-talk changes the output
+    return [
+        Parser(tz='US/Pacific', clock=lambda: datetime(2020, 3, 11, 21), cache_size=0),
+        Parser(tz='Asia/Tokyo', clock=lambda: datetime(2021, 6, 30, 16), cache_size=0),
+        Parser(tz='Europe/London',
+               future=True,
+               clock=lambda: datetime(2019, 12, 31, 23),
+               cache_size=0),
+        Parser(tz='US/Eastern',
+               interval_to_date=False,
+               clock=lambda: datetime(2020, 11, 25, 3),
+               cache_size=0),
+    ]
+
+
+def work(parser, expected, parses, errors):
+    for number in range(parses):
+        text_index = number % len(TEXTS)
+        if parser.parse(TEXTS[text_index]) != expected[text_index]:
+            errors.append(parser)
+
+
+def run_threads(threads):
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def main(parses=800):
+    parsers = make_parsers()
+    expected = [[parser.parse(text) for text in TEXTS] for parser in parsers]
+    baseline = None
+    for count in [1, 2, 4, 8]:
+        errors = []
+        threads = [
+            threading.Thread(target=work,
+                             args=(parsers[index % len(parsers)], expected[index % len(parsers)],
+                                   parses // count, errors)) for index in range(count)
+        ]
+        elapsed = run_threads(threads)
+        assert not errors, 'results changed under {} threads'.format(count)
+        throughput = parses / elapsed
+        baseline = baseline or throughput
+        print('{} threads: {:7.0f} parses/s ({:.2f}x of one thread)'.format(
+            count, throughput, throughput / baseline))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,27 @@
+import functools
+import timeit
+
+from kronosparser import word_number
+
+PHRASES = [
+    'seven', 'twenty five', 'forty-five', 'a hundred and ten', 'nineteen hundred and ninety nine',
+    'two million, three hundred thousand and one', 'in a day', 'no numbers in this sentence at all'
+]
+
+
+def scan(parser):
+    for phrase in PHRASES:
+        for _ in parser.scanString(phrase):
+            pass
+
+
+def main(number=200):
+    for label, parser in [('combinators', word_number.word_number),
+                          ('table-driven', word_number.WordNumber())]:
+        seconds = min(timeit.repeat(functools.partial(scan, parser), number=number, repeat=5))
+        per_phrase = seconds / (number * len(PHRASES)) * 1e6
+        print('{:>13}: {:8.1f} us/phrase'.format(label, per_phrase))
+
+
+if __name__ == '__main__':
+    main()
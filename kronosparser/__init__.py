@@ -1,17 +1,114 @@
+import time
+
+from kronosparser import metrics, slowlog
 from kronosparser import time_parser as delta_time_defs
-from kronosparser.utils import find_all, set_date_for_interval, set_dates_with_timezone_fixes
+from kronosparser.locales import get_grammar
+from kronosparser.parser import Parser, parse_context
+from kronosparser.utils import (find_all, get_deadline, has_match, iter_matches, resolve_all,
+                                resolve_match)
 
 delta_time = delta_time_defs.delta_time
 
 
-def parse_dates(text, future=False, interval_to_date=True, tz='US/Pacific'):
-    matches = find_all(delta_time, text)
-    for match in matches:
-        parsed_output_keys = list(match['parsed'].keys())
-        if 'future' in parsed_output_keys:
-            match['parsed'] = match['parsed']['future' if future else 'past']
-        parsed_output_keys = list(match['parsed'].keys())
-        if interval_to_date and 'interval' in parsed_output_keys:
-            set_date_for_interval(match)
-        set_dates_with_timezone_fixes(match, tz)
+def parse_dates(text,
+                future=False,
+                interval_to_date=True,
+                tz='US/Pacific',
+                locale='en',
+                region=None,
+                max_matches=None,
+                max_time=None,
+                deadline=None,
+                max_length=None):
+    # pylint: disable=too-many-arguments
+    # Past `max_time` seconds (or the absolute `time.monotonic()` deadline) or `max_length`
+    # characters, the matches found so far are returned and `matches.truncated` is set
+    start = time.perf_counter()
+    deadline = get_deadline(max_time, deadline)
+    expression = get_grammar(locale).delta_time
+    timer = slowlog.start(text, expression)
+    with parse_context(tz, region):
+        matches = find_all(expression,
+                           text,
+                           max_matches=max_matches,
+                           deadline=deadline,
+                           max_length=max_length)
+    if timer is not None:
+        timer.scanned()
+    resolve_all(matches, future=future, interval_to_date=interval_to_date, tz=tz)
+    if timer is not None:
+        timer.finish(matches)
+    if metrics.registry is not None:
+        metrics.registry.observe_parse(text, matches, time.perf_counter() - start)
     return matches
+
+
+def parse_spans(text,
+                spans,
+                future=False,
+                interval_to_date=True,
+                tz='US/Pacific',
+                locale='en',
+                region=None,
+                anchored=False):
+    # pylint: disable=too-many-arguments
+    # Only the given (start, end) windows are scanned, anchored ones must match at their start
+    expression = get_grammar(locale).delta_time
+    results = []
+    with parse_context(tz, region):
+        for start, end in spans:
+            if not 0 <= start <= end <= len(text):
+                raise ValueError('Span [{}, {}) is outside of the text'.format(start, end))
+            matches = find_all(expression, text[start:end], anchored=anchored)
+            for match in matches:
+                match['start'] += start
+                match['end'] += start
+            results.append(matches)
+    for matches in results:
+        resolve_all(matches, future=future, interval_to_date=interval_to_date, tz=tz)
+    return results
+
+
+def parse_span(text,
+               start=0,
+               end=None,
+               future=False,
+               interval_to_date=True,
+               tz='US/Pacific',
+               locale='en',
+               region=None,
+               anchored=False):
+    # pylint: disable=too-many-arguments
+    return parse_spans(text, [(start, len(text) if end is None else end)],
+                       future=future,
+                       interval_to_date=interval_to_date,
+                       tz=tz,
+                       locale=locale,
+                       region=region,
+                       anchored=anchored)[0]
+
+
+def first_date(text,
+               future=False,
+               interval_to_date=True,
+               tz='US/Pacific',
+               locale='en',
+               region=None):
+    # pylint: disable=too-many-arguments
+    with parse_context(tz, region):
+        for match in iter_matches(get_grammar(locale).delta_time, text):
+            resolve_match(match, future=future, interval_to_date=interval_to_date, tz=tz)
+            if 'datetime_parsing_error' not in match['parsed']:
+                return match
+    return None
+
+
+def _is_valid(tokens):
+    return bool(tokens) and 'datetime_parsing_error' not in tokens[0]
+
+
+def has_date(text, locale='en', region=None):
+    # Whether first_date finds something. Candidates are found without parse actions, which then
+    # only run on them to reject invalid dates such as "february 30th" or "$2020".
+    with parse_context('US/Pacific', region):
+        return has_match(get_grammar(locale).delta_time, text, accept=_is_valid)
@@ -0,0 +1,105 @@
+import math
+import random
+import time
+
+from kronosparser import parse_dates
+
+# Largest growth exponent of the worst-case time tolerated for any input class
+MAX_EXPONENT = 1.3
+LENGTHS = (500, 1000, 2000, 4000)
+MONTHS = ('january february march april may june july august september october november december '
+          'jan feb mar apr jun jul aug sep sept oct nov dec').split()
+
+
+def repeat(unit, length):
+    return (unit * (length // len(unit) + 1))[:length]
+
+
+def digits(rng, length):
+    return ''.join(rng.choice('0123456789') for _ in range(length))
+
+
+def separated_digits(rng, length):
+    return repeat(rng.choice(['1/', '12-', '1.2.', '1:2:', '2020-', '12/31/', '3, ']), length)
+
+
+def next_next(rng, length):
+    return repeat(rng.choice(['next ', 'next next week ', 'last next this ', 'the end of the ']),
+                  length)
+
+
+def month_names(rng, length):
+    words = []  # type: list
+    while sum(len(word) + 1 for word in words) < length:
+        words.append(rng.choice(MONTHS))
+    return ' '.join(words)[:length]
+
+
+def whitespace(rng, length):
+    expression = 'tomorrow at 5pm'
+    padding = length - len(expression)
+    return ' ' * (padding // 2) + expression + rng.choice(' \t\n') * (padding - padding // 2)
+
+
+def am_pm(rng, length):
+    return repeat(rng.choice(['a.m. ', '5 p. m. ', '12:30am', 'p.m.p.m.', '1 2 3 am ']), length)
+
+
+def invalid_dates(rng, length):
+    return repeat(rng.choice(['february 30th ', '2020-02-31 ', 'feb 29 2021, ', '31/04/2020 ']),
+                  length)
+
+
+def log_lines(rng, length):
+    line = '2020-03-{:02d} {:02d}:{:02d}:{:02d},{:03d} INFO [worker-{}] took {} ms\n'.format(
+        rng.randrange(1, 29), rng.randrange(24), rng.randrange(60), rng.randrange(60),
+        rng.randrange(1000), rng.randrange(9), rng.randrange(999))
+    return repeat(line, length)
+
+
+CLASSES = {
+    'digits': digits,
+    'separated digits': separated_digits,
+    'next next next': next_next,
+    'month names': month_names,
+    'whitespace': whitespace,
+    'am/pm': am_pm,
+    'log lines': log_lines,
+    'invalid dates': invalid_dates,
+}
+
+
+def worst_case(generator, length, samples, seed=0):
+    # Exceptions propagate, a crash is as bad as a timeout for the caller
+    rng = random.Random(seed)
+    worst = 0.0
+    for _ in range(samples):
+        text = generator(rng, length)
+        start = time.perf_counter()
+        parse_dates(text)
+        worst = max(worst, time.perf_counter() - start)
+    return worst
+
+
+def growth_exponent(lengths, times):
+    # Least squares slope of log(time) against log(length)
+    xs = [math.log(length) for length in lengths]
+    ys = [math.log(max(value, 1e-9)) for value in times]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    return (sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / sum(
+        (x - mean_x)**2 for x in xs))
+
+
+def check(lengths=LENGTHS, samples=3, max_exponent=MAX_EXPONENT, classes=None, output=print):
+    # Returns the (name, exponent) of every input class whose worst case grows faster than allowed
+    failures = []
+    for name, generator in sorted((classes or CLASSES).items()):
+        times = [worst_case(generator, length, samples) for length in lengths]
+        exponent = growth_exponent(lengths, times)
+        output('{:>16}: {}  exponent {:.2f}'.format(
+            name, '  '.join('{}: {:7.1f} ms'.format(length, value * 1000)
+                            for length, value in zip(lengths, times)), exponent))
+        if exponent > max_exponent:
+            failures.append((name, exponent))
+    return failures
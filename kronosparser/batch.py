@@ -0,0 +1,116 @@
+import copy
+import itertools
+
+import pytz
+from kronosparser import clock, metrics
+from kronosparser.locales import get_grammar
+from kronosparser.parser import parse_context
+from kronosparser.utils import find_all, resolve_match
+
+DEFAULT_TIMEZONE = 'US/Pacific'
+
+
+def _row(row):
+    text, reference_time = row[0], clock.to_utc(row[1]).replace(microsecond=0)
+    tz = row[2] if len(row) > 2 and row[2] else DEFAULT_TIMEZONE
+    return text, reference_time, tz
+
+
+def _group_key(row):
+    # Rows of the same UTC day and timezone offset resolve identically up to the time of day
+    _, reference_time, tz = row
+    offset = pytz.utc.localize(reference_time).astimezone(pytz.timezone(tz)).utcoffset()
+    return tz, reference_time.date(), offset
+
+
+def _reuse(matches, pool):
+    # Another result from a cached one, sharing its values when interning
+    return copy.deepcopy(matches) if pool is None else pool.matches(matches)
+
+
+def parse_history(rows, future=False, interval_to_date=True, locale='en', region=None, pool=None):
+    # pylint: disable=too-many-arguments,too-many-locals
+    # Rows are (text, reference_time) or (text, reference_time, tz) tuples, naive reference times
+    # being UTC. Each row gets what parse_dates would have returned at its reference time.
+    rows = [_row(row) for row in rows]
+    expression = get_grammar(locale).delta_time
+    results = [None] * len(rows)
+    order = sorted(range(len(rows)), key=lambda index: _group_key(rows[index]))
+    for (tz, _, _), indices in itertools.groupby(order, key=lambda index: _group_key(rows[index])):
+        # A result is reused for the same text whenever the reference time agrees with the one it
+        # was computed at, down to the finest resolution that parse read
+        resolutions = {}  # type: dict
+        cache = {}  # type: dict
+        with parse_context(tz, region):
+            for index in indices:
+                text, reference_time, _ = rows[index]
+                for resolution in resolutions.get(text, ()):
+                    cached = cache.get((text, resolution, clock.stamp(reference_time, resolution)))
+                    if cached is not None:
+                        results[index] = _reuse(cached, pool)
+                        break
+                else:
+                    cached = None
+                    with clock.use_time(reference_time), clock.track() as reads:
+                        matches = find_all(expression, text)
+                        for match in matches:
+                            resolve_match(match,
+                                          future=future,
+                                          interval_to_date=interval_to_date,
+                                          tz=tz)
+                    if pool is not None:
+                        matches = pool.matches(matches)
+                    resolutions.setdefault(text, set()).add(reads.resolution)
+                    cache[text, reads.resolution,
+                          clock.stamp(reference_time, reads.resolution)] = matches
+                    results[index] = matches
+                if metrics.registry is not None:
+                    metrics.registry.count_cache('history', hit=cached is not None)
+    return results
+
+
+def _item(item):
+    if isinstance(item, str):
+        item = (item, )
+    text, tz, future, interval_to_date = tuple(item) + (None, False, True)[len(item) - 1:]
+    return text, tz or DEFAULT_TIMEZONE, future, interval_to_date
+
+
+def parse_batch(items, reference_time=None, locale='en', region=None, pool=None):
+    # pylint: disable=too-many-locals
+    # Items are texts or (text, tz, future, interval_to_date) tuples, trailing fields being
+    # optional. Every item is resolved at the same reference time (now by default). Items are
+    # grouped by timezone so that each one is set up once, a text is scanned once per timezone
+    # whatever its future and interval_to_date, and results come back in the order of `items`.
+    # With an interning.InternPool, equal values are shared between results instead of copied.
+    items = [_item(item) for item in items]
+    now = clock.utc_now() if reference_time is None else clock.to_utc(reference_time).replace(
+        microsecond=0)
+    expression = get_grammar(locale).delta_time
+    results = [None] * len(items)
+    order = sorted(range(len(items)), key=lambda index: items[index][1])
+    for tz, indices in itertools.groupby(order, key=lambda index: items[index][1]):
+        scanned = {}  # type: dict
+        resolved = {}  # type: dict
+        with parse_context(tz, region, now):
+            for index in indices:
+                text, _, future, interval_to_date = items[index]
+                key = (text, future, interval_to_date)
+                cached = resolved.get(key)
+                if cached is not None:
+                    results[index] = _reuse(cached, pool)
+                else:
+                    if text not in scanned:
+                        scanned[text] = find_all(expression, text)
+                    matches = copy.deepcopy(scanned[text])
+                    for match in matches:
+                        resolve_match(match,
+                                      future=future,
+                                      interval_to_date=interval_to_date,
+                                      tz=tz)
+                    if pool is not None:
+                        matches = pool.matches(matches)
+                    resolved[key] = results[index] = matches
+                if metrics.registry is not None:
+                    metrics.registry.count_cache('batch', hit=cached is not None)
+    return results
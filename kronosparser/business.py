@@ -0,0 +1,135 @@
+import array
+import contextlib
+import datetime
+import functools
+import threading
+
+import pytz
+from kronosparser import holidays
+
+WEEKEND = (5, 6)
+WORK_START = datetime.time(9)
+WORK_END = datetime.time(17)
+DEFAULT_TIMEZONE = 'US/Pacific'
+
+
+class BusinessCalendar:
+    # Every day of the supported range gets the number of business days before it (its rank), and
+    # every business day gets its date offset. Moving by n business days or working hours is then a
+    # couple of array lookups instead of a day-by-day walk.
+    def __init__(self,
+                 region=holidays.DEFAULT_REGION,
+                 weekend=WEEKEND,
+                 work_start=WORK_START,
+                 work_end=WORK_END):
+        index = holidays.get_index(region)
+        self.first_day = datetime.date(index.first_year, 1, 1)
+        self.last_day = datetime.date(index.last_year, 12, 31)
+        self.work_start = work_start
+        self.work_end = work_end
+        self.work_seconds = int(
+            (datetime.datetime.combine(self.first_day, work_end) -
+             datetime.datetime.combine(self.first_day, work_start)).total_seconds())
+        if self.work_seconds <= 0:
+            raise ValueError('Working hours must end after they start')
+
+        closed = holidays.observed_holidays(region)
+        first = self.first_day.toordinal()
+        days = self.last_day.toordinal() - first + 1
+        self._ranks = array.array('l', bytes(array.array('l').itemsize * (days + 1)))
+        self._offsets = array.array('l')
+        for offset in range(days):
+            day = datetime.date.fromordinal(first + offset)
+            is_open = day.weekday() not in weekend and day not in closed
+            if is_open:
+                self._offsets.append(offset)
+            self._ranks[offset + 1] = self._ranks[offset] + is_open
+
+    def _offset(self, day):
+        offset = day.toordinal() - self.first_day.toordinal()
+        if not 0 <= offset < len(self._ranks) - 1:
+            raise ValueError('{} is outside of the business calendar'.format(day))
+        return offset
+
+    def _day(self, rank):
+        if not 0 <= rank < len(self._offsets):
+            raise ValueError('Business day is outside of the business calendar')
+        return self.first_day + datetime.timedelta(days=self._offsets[rank])
+
+    def is_business_day(self, day):
+        offset = self._offset(day)
+        return self._ranks[offset + 1] != self._ranks[offset]
+
+    def business_days_between(self, start, end):
+        return self._ranks[self._offset(end)] - self._ranks[self._offset(start)]
+
+    def add_business_days(self, day, count):
+        # A closed day counts from the previous business day when moving forward and from the
+        # following one when moving backwards, e.g. 1 business day after Saturday is Monday.
+        offset = self._offset(day)
+        if count >= 0:
+            return self._day(self._ranks[offset + 1] - 1 + count)
+        return self._day(self._ranks[offset] + count)
+
+    def add_business_days_many(self, days, count):
+        return [self.add_business_days(day, count) for day in days]
+
+    def _position(self, moment):
+        offset = self._offset(moment.date())
+        rank = self._ranks[offset]
+        if self._ranks[offset + 1] == rank:
+            return rank * self.work_seconds
+        elapsed = (moment - self.opening(moment.date())).total_seconds()
+        return rank * self.work_seconds + min(max(elapsed, 0), self.work_seconds)
+
+    def add_working_time(self, moment, delta):
+        position = self._position(moment) + delta.total_seconds()
+        rank, elapsed = divmod(position, self.work_seconds)
+        if elapsed == 0 and rank > 0 and delta.total_seconds() > 0:
+            # The end of a working day rather than the start of the following one
+            rank, elapsed = rank - 1, self.work_seconds
+        return datetime.datetime.combine(self._day(int(rank)),
+                                         self.work_start) + datetime.timedelta(seconds=elapsed)
+
+    def working_time_between(self, start, end):
+        return datetime.timedelta(seconds=self._position(end) - self._position(start))
+
+    def opening(self, day):
+        return datetime.datetime.combine(day, self.work_start)
+
+    def closing(self, day):
+        return datetime.datetime.combine(day, self.work_end)
+
+
+@functools.lru_cache(maxsize=None)
+def get_calendar(region=holidays.DEFAULT_REGION, work_start=WORK_START, work_end=WORK_END):
+    return BusinessCalendar(region, work_start=work_start, work_end=work_end)
+
+
+def current_calendar():
+    return get_calendar(holidays.current_region())
+
+
+_settings = threading.local()
+
+
+def current_timezone():
+    return getattr(_settings, 'tz', None) or DEFAULT_TIMEZONE
+
+
+@contextlib.contextmanager
+def use_timezone(tz):
+    previous = getattr(_settings, 'tz', None)
+    _settings.tz = tz
+    try:
+        yield
+    finally:
+        _settings.tz = previous
+
+
+def add_working_time_utc(moment_utc, delta):
+    # Working hours are local, the parse actions work in UTC
+    tz = pytz.timezone(current_timezone())
+    local = pytz.utc.localize(moment_utc).astimezone(tz).replace(tzinfo=None)
+    result = current_calendar().add_working_time(local, delta)
+    return tz.localize(result).astimezone(pytz.utc).replace(tzinfo=None)
@@ -0,0 +1,93 @@
+import collections
+import json
+import socket
+
+DEFAULT_PIPELINE_DEPTH = 128
+
+
+class ParseServerError(Exception):
+    pass
+
+
+class Client:
+    def __init__(self,
+                 path=None,
+                 port=None,
+                 host='127.0.0.1',
+                 timeout=None,
+                 pipeline_depth=DEFAULT_PIPELINE_DEPTH):
+        # pylint: disable=too-many-arguments
+        if path is not None:
+            self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._socket.settimeout(timeout)
+            self._socket.connect(path)
+        elif port is not None:
+            self._socket = socket.create_connection((host, port), timeout=timeout)
+            self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        else:
+            raise ValueError('either a socket path or a TCP port is required')
+        self._reader = self._socket.makefile('rb')
+        self._next_id = 0
+        self.pipeline_depth = pipeline_depth
+
+    def close(self):
+        self._reader.close()
+        self._socket.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def parse_dates(self, text, future=False, interval_to_date=True, tz='US/Pacific'):
+        return self.parse_many([text], future=future, interval_to_date=interval_to_date, tz=tz)[0]
+
+    def parse_many(self, texts, future=False, interval_to_date=True, tz='US/Pacific'):
+        # Requests are pipelined: up to `pipeline_depth` of them are in flight at any time. After
+        # an error response no more requests are sent, and the replies still in flight are read
+        # before raising so that the connection can be used again.
+        results = []  # type: list
+        errors = []  # type: list
+        in_flight = collections.deque()  # type: collections.deque
+        for text in texts:
+            if len(in_flight) >= self.pipeline_depth:
+                self._collect(in_flight.popleft(), results, errors)
+                if errors:
+                    break
+            in_flight.append(self._send(text, future, interval_to_date, tz))
+        while in_flight:
+            self._collect(in_flight.popleft(), results, errors)
+        if errors:
+            raise ParseServerError(errors[0])
+        return results
+
+    def _collect(self, request_id, results, errors):
+        response = self._receive(request_id)
+        if 'error' in response:
+            errors.append(response['error'])
+        else:
+            results.append(response['matches'])
+
+    def _send(self, text, future, interval_to_date, tz):
+        self._next_id += 1
+        request = {
+            'id': self._next_id,
+            'text': text,
+            'future': future,
+            'interval_to_date': interval_to_date,
+            'tz': tz
+        }
+        self._socket.sendall(json.dumps(request).encode('utf-8') + b'\n')
+        return self._next_id
+
+    def _receive(self, request_id):
+        line = self._reader.readline()
+        if not line:
+            raise ParseServerError('connection closed by the parse server')
+        response = json.loads(line)
+        # Errors about a whole batch are not tied to a request id
+        if response.get('id') != request_id and 'error' not in response:
+            raise ParseServerError('out of order response {} for request {}'.format(
+                response.get('id'), request_id))
+        return response
@@ -0,0 +1,82 @@
+import contextlib
+import datetime
+import threading
+
+import pytz
+
+# How much of the reference time a parse has read, from coarsest to finest
+DAY = 0
+HOUR = 1
+SECOND = 2
+
+_settings = threading.local()
+
+
+class Reads:
+    def __init__(self):
+        self.resolution = DAY
+
+
+def to_utc(moment):
+    # Naive datetimes are already UTC, aware ones are converted
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(pytz.utc).replace(tzinfo=None)
+    return moment
+
+
+def stamp(moment, resolution):
+    # `moment` truncated to `resolution`, equal for every reference time a parse that read the clock
+    # at that resolution would resolve identically at
+    if resolution == DAY:
+        return moment.date()
+    if resolution == HOUR:
+        return moment.replace(minute=0, second=0)
+    return moment
+
+
+def reference_time():
+    # The UTC time that relative expressions are resolved against in this thread, if pinned
+    return getattr(_settings, 'now', None)
+
+
+def utc_now(resolution=SECOND):
+    reads = getattr(_settings, 'reads', None)
+    if reads is not None:
+        reads.resolution = max(reads.resolution,
+                               min(resolution, getattr(_settings, 'ceiling', SECOND)))
+    now = reference_time()
+    if now is None:
+        now = datetime.datetime.utcnow()
+    return now.replace(microsecond=0)
+
+
+@contextlib.contextmanager
+def use_time(moment):
+    previous = reference_time()
+    _settings.now = None if moment is None else to_utc(moment)
+    try:
+        yield
+    finally:
+        _settings.now = previous
+
+
+@contextlib.contextmanager
+def reading(resolution):
+    # Reads made inside only depend on the reference time up to `resolution`
+    previous = getattr(_settings, 'ceiling', SECOND)
+    _settings.ceiling = min(resolution, previous)
+    try:
+        yield
+    finally:
+        _settings.ceiling = previous
+
+
+@contextlib.contextmanager
+def track():
+    # Records the finest resolution at which the reference time is read
+    previous = getattr(_settings, 'reads', None)
+    _settings.reads = Reads()
+    try:
+        yield _settings.reads
+    finally:
+        _settings.reads = previous
@@ -0,0 +1,227 @@
+import argparse
+import itertools
+import json
+import random
+import sys
+
+from kronosparser import lexicon
+
+# Words that the grammar never matches, used around the generated expressions
+FILLER = tuple(('please send updated report we should review budget notes with team can you check '
+                'draft slides sounds good thanks call me invoice project status discuss numbers '
+                'agenda follow up deadline meeting room client feedback').split())
+
+
+def _choice(rng, table):
+    return rng.choice(sorted(table))
+
+
+def _keyword(rng, lex, name):
+    return rng.choice(lex.KEYWORDS[name])
+
+
+def _quantity(rng, lex):
+    if rng.random() < 0.3:
+        return _choice(rng, {word for word, value in lex.NUMBER_UNITS.items() if 1 < value < 10})
+    return str(rng.randrange(2, 30))
+
+
+def _unit(rng, lex, names=('day', 'week', 'month')):
+    return lex.UNITS[rng.choice(names)][1]
+
+
+def _clock_time(rng, lex):
+    hour = rng.randrange(1, 13)
+    return rng.choice([
+        '{} {}{}'.format(_keyword(rng, lex, 'at'), hour, rng.choice(['am', 'pm'])),
+        '{} {}:{:02d} {}'.format(_keyword(rng, lex, 'at'), hour, rng.randrange(0, 60, 5),
+                                 rng.choice(['am', 'pm'])),
+        '{} {}'.format(_keyword(rng, lex, 'at'), _keyword(rng, lex, 'noon')),
+    ])
+
+
+def _relative(rng, lex):
+    return rng.choice(
+        [_keyword(rng, lex, 'next'),
+         _keyword(rng, lex, 'last'),
+         _keyword(rng, lex, 'this')])
+
+
+def _month_name(rng, lex):
+    return _choice(rng, {name for name in lex.MONTH_NAMES if name.isalpha() and len(name) > 3})
+
+
+def _weekday(rng, lex):
+    return _choice(rng, {name for name in lex.WEEKDAYS if name.isalpha() and len(name) > 4})
+
+
+def date_mdy(rng, lex):
+    month = rng.randrange(1, 13)
+    day = rng.randrange(1, 29)
+    return rng.choice([
+        '{} {}'.format(
+            _month_name(rng, lex),
+            _choice(rng, {name
+                          for name, value in lex.ORDINAL_DAYS.items() if value == day})),
+        '{} {}, {}'.format(_month_name(rng, lex), day, rng.randrange(2000, 2030)),
+        '{}/{}/{}'.format(month, day, rng.randrange(2000, 2030)),
+    ])
+
+
+def date_ymd(rng, lex):  # pylint: disable=unused-argument
+    return '{}-{:02d}-{:02d}'.format(rng.randrange(2000, 2030), rng.randrange(1, 13),
+                                     rng.randrange(1, 29))
+
+
+def named_day(rng, lex):
+    day = _choice(rng, lex.NAMED_DAYS)
+    return day if rng.random() < 0.5 else '{} {}'.format(day, _clock_time(rng, lex))
+
+
+def weekday_ref(rng, lex):
+    return '{} {}'.format(_relative(rng, lex), _weekday(rng, lex))
+
+
+def time_of_day(rng, lex):
+    return _clock_time(rng, lex)
+
+
+def named_day_date_spec(rng, lex):
+    if rng.random() < 0.5:
+        return '{} {} {}'.format(_keyword(rng, lex, 'in'), _quantity(rng, lex), _unit(rng, lex))
+    return '{} {} {}'.format(_quantity(rng, lex), _unit(rng, lex), _keyword(rng, lex, 'ago'))
+
+
+def rel_time_spec(rng, lex):
+    return '{} {} {} {}'.format(
+        _quantity(rng, lex), _unit(rng, lex, ('day', 'week')),
+        rng.choice([_keyword(rng, lex, 'before'),
+                    _keyword(rng, lex, 'after')]), _choice(rng, lex.NAMED_DAYS))
+
+
+def before_after_datetime_object(rng, lex):
+    return rng.choice([
+        '{} {} {} {}'.format(_keyword(rng, lex, 'between'), weekday_ref(rng, lex),
+                             _keyword(rng, lex, 'and'), date_mdy(rng, lex)),
+        '{} {} {} {}'.format(_keyword(rng, lex, 'from'), date_mdy(rng, lex),
+                             _keyword(rng, lex, 'to'), weekday_ref(rng, lex)),
+        '{} {}'.format(_keyword(rng, lex, 'after'), date_mdy(rng, lex)),
+    ])
+
+
+def last_this_next_interval(rng, lex):
+    return '{} {}'.format(_relative(rng, lex), _unit(rng, lex, ('week', 'month', 'year'))[:-1])
+
+
+def beginning_end_of(rng, lex):
+    if rng.random() < 0.3:
+        return '{} {}'.format(_choice(rng, lex.BOUNDS), _month_name(rng, lex))
+    return '{} {} {} {}'.format(_keyword(rng, lex, 'the'), _choice(rng, lex.BOUNDS_OF),
+                                _keyword(rng, lex, 'of'), last_this_next_interval(rng, lex))
+
+
+def half_of(rng, lex):
+    return '{} {} {} {} {}'.format(_keyword(rng, lex, 'the'), rng.choice(['first', 'second']),
+                                   _keyword(rng, lex, 'half'), _keyword(rng, lex, 'of'),
+                                   last_this_next_interval(rng, lex))
+
+
+def interval_quarter(rng, lex):
+    return rng.choice([
+        '{} {}'.format(_choice(rng, lex.QUARTER_NAMES).upper(), rng.randrange(2000, 2030)),
+        '{} {} quarter'.format(_keyword(rng, lex, 'the'), _choice(rng, lex.QUARTER_ORDINALS)),
+        '{} quarter'.format(rng.choice([_keyword(rng, lex, 'next'),
+                                        _keyword(rng, lex, 'last')])),
+    ])
+
+
+def interval_month(rng, lex):
+    return '{} {}'.format(_month_name(rng, lex), rng.randrange(2000, 2030))
+
+
+def holiday(rng, lex):
+    name = _choice(rng, lex.HOLIDAYS)
+    return name if rng.random() < 0.5 else '{} {}'.format(_keyword(rng, lex, 'after'), name)
+
+
+def recurrence(rng, lex):
+    expression = '{} {}'.format(_keyword(rng, lex, 'every'), _weekday(rng, lex))
+    return expression if rng.random() < 0.5 else '{} {}'.format(expression, _clock_time(rng, lex))
+
+
+# Named after the grammar elements that are expected to recognize them
+PRODUCTIONS = {
+    production.__name__: production
+    for production in [
+        date_mdy, date_ymd, named_day, weekday_ref, time_of_day, named_day_date_spec, rel_time_spec,
+        before_after_datetime_object, last_this_next_interval, beginning_end_of, half_of,
+        interval_quarter, interval_month, holiday, recurrence
+    ]
+}
+
+
+def sentence(rng, density=0.5, mix=None, length=(6, 20), lex=lexicon):
+    # pylint: disable=too-many-locals
+    # A sentence of filler words with date expressions in between, and where each one is, as
+    # labelled expressions
+    names = sorted(mix or PRODUCTIONS)
+    weights = [(mix or {}).get(name, 1) for name in names]
+    words = [rng.choice(FILLER) for _ in range(rng.randint(*length))]
+    count = 0
+    while count < len(words) - 1 and rng.random() < density:
+        count += 1
+    slots = sorted(rng.sample(range(1, len(words)), count)) if count else []
+    parts = []
+    expressions = []
+    position = 0
+    previous = 0
+    for slot in slots + [len(words)]:
+        filler = ' '.join(words[previous:slot])
+        parts.append(filler)
+        position += len(filler)
+        previous = slot
+        if slot == len(words):
+            break
+        name = rng.choices(names, weights)[0]
+        text = PRODUCTIONS[name](rng, lex)
+        parts.append(' {} '.format(text))
+        # A leading article is left out of the match, as the grammar does
+        skip = 0
+        for article in lex.KEYWORDS['the']:
+            if text.startswith(article + ' '):
+                skip = len(article) + 1
+        expressions.append({
+            'production': name,
+            'text': text[skip:],
+            'start': position + 1 + skip,
+            'end': position + 1 + len(text)
+        })
+        position += len(text) + 2
+    return {'text': ''.join(parts), 'expressions': expressions}
+
+
+def generate(count=None, seed=0, density=0.5, mix=None, length=(6, 20), lex=lexicon):
+    # pylint: disable=too-many-arguments
+    # Endless (or `count` long) reproducible stream of labelled sentences
+    rng = random.Random(seed)
+    for _ in itertools.count() if count is None else range(count):
+        yield sentence(rng, density=density, mix=mix, length=length, lex=lex)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Generate labelled date-expression sentences')
+    parser.add_argument('--count', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--density', type=float, default=0.5)
+    parser.add_argument('--min-words', type=int, default=6)
+    parser.add_argument('--max-words', type=int, default=20)
+    parser.add_argument('--production', action='append', choices=sorted(PRODUCTIONS))
+    args = parser.parse_args(argv)
+    mix = dict.fromkeys(args.production, 1) if args.production else None
+    for sample in generate(args.count, args.seed, args.density, mix,
+                           (args.min_words, args.max_words)):
+        sys.stdout.write(json.dumps(sample) + '\n')
+
+
+if __name__ == '__main__':
+    main()
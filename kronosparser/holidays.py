@@ -0,0 +1,232 @@
+import contextlib
+import datetime
+import functools
+import threading
+
+FIRST_YEAR = 1970
+LAST_YEAR = 2100
+DEFAULT_REGION = 'US'
+
+
+def fixed(month, day):
+    return lambda year: datetime.date(year, month, day)
+
+
+def nth_weekday(month, weekday, nth):
+    # nth counts from 1, negative values count from the end of the month
+    def rule(year):
+        if nth > 0:
+            first = datetime.date(year, month, 1)
+            return first + datetime.timedelta(days=(weekday - first.weekday()) % 7 + 7 * (nth - 1))
+        following = datetime.date(year + month // 12, month % 12 + 1, 1)
+        last = following - datetime.timedelta(days=1)
+        return last - datetime.timedelta(days=(last.weekday() - weekday) % 7 + 7 * (-nth - 1))
+
+    return rule
+
+
+def weekday_before(month, day, weekday):
+    def rule(year):
+        limit = datetime.date(year, month, day)
+        return limit - datetime.timedelta(days=(limit.weekday() - weekday) % 7 or 7)
+
+    return rule
+
+
+def easter(year):
+    # Anonymous Gregorian algorithm
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    g = (8 * b + 13) // 25
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return datetime.date(year, month, day + 1)
+
+
+def relative_to(rule, days):
+    return lambda year: rule(year) + datetime.timedelta(days=days)
+
+
+_COMMON = {
+    'new_year': fixed(1, 1),
+    'valentines_day': fixed(2, 14),
+    'easter': easter,
+    'good_friday': relative_to(easter, -2),
+    'halloween': fixed(10, 31),
+    'christmas_eve': fixed(12, 24),
+    'christmas': fixed(12, 25),
+    'new_years_eve': fixed(12, 31),
+}
+
+REGIONS = {
+    'US':
+    dict(
+        _COMMON, **{
+            'mlk_day': nth_weekday(1, 0, 3),
+            'presidents_day': nth_weekday(2, 0, 3),
+            'mothers_day': nth_weekday(5, 6, 2),
+            'memorial_day': nth_weekday(5, 0, -1),
+            'fathers_day': nth_weekday(6, 6, 3),
+            'juneteenth': fixed(6, 19),
+            'independence_day': fixed(7, 4),
+            'labor_day': nth_weekday(9, 0, 1),
+            'columbus_day': nth_weekday(10, 0, 2),
+            'veterans_day': fixed(11, 11),
+            'thanksgiving': nth_weekday(11, 3, 4),
+        }),
+    'CA':
+    dict(
+        _COMMON, **{
+            'easter_monday': relative_to(easter, 1),
+            'victoria_day': weekday_before(5, 25, 0),
+            'mothers_day': nth_weekday(5, 6, 2),
+            'fathers_day': nth_weekday(6, 6, 3),
+            'canada_day': fixed(7, 1),
+            'labor_day': nth_weekday(9, 0, 1),
+            'thanksgiving': nth_weekday(10, 0, 2),
+            'boxing_day': fixed(12, 26),
+        }),
+    'UK':
+    dict(
+        _COMMON, **{
+            'easter_monday': relative_to(easter, 1),
+            'mothers_day': relative_to(easter, -21),
+            'early_may_bank_holiday': nth_weekday(5, 0, 1),
+            'spring_bank_holiday': nth_weekday(5, 0, -1),
+            'fathers_day': nth_weekday(6, 6, 3),
+            'summer_bank_holiday': nth_weekday(8, 0, -1),
+            'boxing_day': fixed(12, 26),
+        }),
+}
+
+# Holidays that close businesses, the rest of a region's rules being observances
+PUBLIC_HOLIDAYS = {
+    'US':
+    frozenset({
+        'new_year', 'mlk_day', 'presidents_day', 'memorial_day', 'juneteenth', 'independence_day',
+        'labor_day', 'columbus_day', 'veterans_day', 'thanksgiving', 'christmas'
+    }),
+    'CA':
+    frozenset({
+        'new_year', 'good_friday', 'victoria_day', 'canada_day', 'labor_day', 'thanksgiving',
+        'christmas', 'boxing_day'
+    }),
+    'UK':
+    frozenset({
+        'new_year', 'good_friday', 'easter_monday', 'early_may_bank_holiday', 'spring_bank_holiday',
+        'summer_bank_holiday', 'christmas', 'boxing_day'
+    }),
+}
+
+
+def nearest_weekday(day, _taken):
+    # Saturday holidays are observed on the Friday before, Sunday ones on the Monday after
+    return day + datetime.timedelta(days=-1 if day.weekday() == 5 else 1)
+
+
+def substitute_weekday(day, taken):
+    # The first following weekday that is not a holiday already
+    while day.weekday() >= 5 or day in taken:
+        day += datetime.timedelta(days=1)
+    return day
+
+
+OBSERVED_ON = {
+    'US': nearest_weekday,
+    'CA': substitute_weekday,
+    'UK': substitute_weekday,
+}
+
+
+class HolidayIndex:
+    # Every rule is expanded once into one date per year, so resolving a holiday is a list lookup
+    def __init__(self, rules, first_year=FIRST_YEAR, last_year=LAST_YEAR):
+        self.first_year = first_year
+        self.last_year = last_year
+        self._dates = {
+            name: tuple(rule(year) for year in range(first_year, last_year + 1))
+            for name, rule in rules.items()
+        }
+
+    def __contains__(self, name):
+        return name in self._dates
+
+    def get(self, name, year):
+        dates = self._dates.get(name)
+        if dates is None or not self.first_year <= year <= self.last_year:
+            return None
+        return dates[year - self.first_year]
+
+    def next_occurrence(self, name, origin):
+        occurrence = self.get(name, origin.year)
+        if occurrence is not None and occurrence <= origin:
+            occurrence = self.get(name, origin.year + 1)
+        return occurrence
+
+    def previous_occurrence(self, name, origin):
+        occurrence = self.get(name, origin.year)
+        if occurrence is not None and occurrence >= origin:
+            occurrence = self.get(name, origin.year - 1)
+        return occurrence
+
+    def dates_between(self, start, end):
+        first = max(start.year, self.first_year) - self.first_year
+        last = min(end.year, self.last_year) - self.first_year
+        return sorted(occurrence for dates in self._dates.values()
+                      for occurrence in dates[first:last + 1] if start <= occurrence <= end)
+
+
+@functools.lru_cache(maxsize=None)
+def get_index(region=DEFAULT_REGION):
+    if region not in REGIONS:
+        raise ValueError('Unknown holiday region {!r}, expected one of {}'.format(
+            region, ', '.join(sorted(REGIONS))))
+    return HolidayIndex(REGIONS[region])
+
+
+@functools.lru_cache(maxsize=None)
+def observed_holidays(region=DEFAULT_REGION):
+    # Days off for the public holidays of `region`, weekend ones being moved to a weekday
+    index = get_index(region)
+    observed = set()  # type: set
+    for year in range(index.first_year, index.last_year + 1):
+        dates = sorted(index.get(name, year) for name in PUBLIC_HOLIDAYS[region])
+        taken = {day for day in dates if day.weekday() < 5}
+        for day in dates:
+            if day.weekday() >= 5:
+                taken.add(OBSERVED_ON[region](day, taken))
+        observed |= taken
+    return frozenset(observed)
+
+
+_settings = threading.local()
+_default_region = DEFAULT_REGION
+
+
+def set_default_region(region):
+    global _default_region  # pylint: disable=global-statement
+    get_index(region)
+    _default_region = region
+
+
+def current_region():
+    return getattr(_settings, 'region', None) or _default_region
+
+
+def current_index():
+    return get_index(current_region())
+
+
+@contextlib.contextmanager
+def use_region(region):
+    get_index(region)
+    previous = getattr(_settings, 'region', None)
+    _settings.region = region
+    try:
+        yield
+    finally:
+        _settings.region = previous
@@ -0,0 +1,121 @@
+from kronosparser.locales import get_grammar
+from kronosparser.parser import parse_context
+from kronosparser.utils import find_all, resolve_all, word_end, word_start
+
+# Longest stretch of text, in characters, that an edit can influence on either side of it. It is
+# comfortably above the longest expressions the grammar accepts, e.g. "between next friday at
+# 10:30 am PST and the second half of next month".
+MAX_LOOKAHEAD = 96
+
+
+class IncrementalParser:  # pylint: disable=too-many-instance-attributes
+    def __init__(self,
+                 text='',
+                 future=False,
+                 interval_to_date=True,
+                 tz='US/Pacific',
+                 locale='en',
+                 region=None,
+                 lookahead=MAX_LOOKAHEAD):
+        # pylint: disable=too-many-arguments
+        self.expression = get_grammar(locale).delta_time
+        self.future = future
+        self.interval_to_date = interval_to_date
+        self.tz = tz
+        self.region = region
+        self.lookahead = lookahead
+        self.text = ''
+        # Matches before `_pending` hold their offsets in the current text, the ones after it
+        # still lack `_shift`: typing only settles the matches between two consecutive edits.
+        self._matches = []
+        self._pending = 0
+        self._shift = 0
+        self.reset(text)
+
+    @property
+    def matches(self):
+        self._settle(len(self._matches))
+        return self._matches
+
+    def reset(self, text):
+        self.text = text
+        self._matches = self._scan(text, 0, len(text))
+        self._pending = len(self._matches)
+        self._shift = 0
+        return self._matches
+
+    def edit(self, offset, deleted, inserted=''):
+        # Returns the matches found again around the edit, `matches` has all of them
+        if not 0 <= offset <= offset + deleted <= len(self.text):
+            raise ValueError('Edit [{}, {}) is outside of the text'.format(
+                offset, offset + deleted))
+        old_text = self.text
+        text = old_text[:offset] + inserted + old_text[offset + deleted:]
+        shift = len(inserted) - deleted
+
+        # Window in old coordinates, widened so that no surviving match overlaps it
+        low, high = self._window(offset - self.lookahead, offset + deleted + self.lookahead)
+        low = word_start(old_text, low)
+        high = word_end(old_text, high)
+        low, high = self._window(low, high)
+
+        first = self._bisect(low)
+        last = self._bisect(high)
+        self._settle(last)
+        scanned = self._scan(text, low, high + shift)
+        self._matches[first:last] = scanned
+        self._pending = first + len(scanned)
+        self._shift += shift
+        self.text = text
+        return scanned
+
+    def _settle(self, index):
+        # Moves `_pending` to `index`, adding or taking back the pending shift on the way
+        if index > self._pending:
+            shift = self._shift
+        else:
+            shift = -self._shift
+        for match in self._matches[min(index, self._pending):max(index, self._pending)]:
+            match['start'] += shift
+            match['end'] += shift
+        self._pending = index
+        if index == len(self._matches):
+            self._shift = 0
+
+    def _offset(self, index, key):
+        offset = self._matches[index][key]
+        return offset + self._shift if index >= self._pending else offset
+
+    def _bisect(self, position, right=False):
+        # Index of the first match starting after `position` (at or after it unless `right`)
+        low, high = 0, len(self._matches)
+        while low < high:
+            middle = (low + high) // 2
+            start = self._offset(middle, 'start')
+            if start < position or right and start == position:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _window(self, low, high):
+        low = max(low, 0)
+        high = min(high, len(self.text))
+        index = self._bisect(low, right=True) - 1
+        if index >= 0 and self._offset(index, 'end') > low:
+            low = self._offset(index, 'start')
+        index = self._bisect(high) - 1
+        if index >= 0 and self._offset(index, 'end') > high:
+            high = self._offset(index, 'end')
+        return low, high
+
+    def _scan(self, text, low, high):
+        with parse_context(self.tz, self.region):
+            matches = find_all(self.expression, text[low:high])
+            for match in matches:
+                match['start'] += low
+                match['end'] += low
+            return resolve_all(matches,
+                               future=self.future,
+                               interval_to_date=self.interval_to_date,
+                               tz=self.tz)
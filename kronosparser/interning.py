@@ -0,0 +1,58 @@
+from kronosparser.utils import MatchList
+
+# Distinct values kept by a pool before it starts over
+DEFAULT_SIZE = 1 << 20
+
+
+class InternPool:
+    # Shares equal strings and equal `parsed` structures (dicts, lists) between results, so that a
+    # large result set holds each distinct date, datetime or interval once. Shared structures must
+    # be treated as read-only. Use one pool per batch, or a long-lived one bounded by `maxsize`
+    # (None for no bound).
+    def __init__(self, maxsize=DEFAULT_SIZE):
+        self.maxsize = maxsize
+        self._values = {}  # type: dict
+
+    def __len__(self):
+        return len(self._values)
+
+    def clear(self):
+        self._values.clear()
+
+    def _shared(self, key, value):
+        if self.maxsize is not None and len(self._values) >= self.maxsize:
+            self._values.clear()
+        return self._values.setdefault(key, value)
+
+    def _intern(self, value):
+        # The shared copy of `value` and the hashable key it is pooled under
+        if isinstance(value, str):
+            return self._shared(value, value), value
+        if isinstance(value, dict):
+            items = [(self._intern(name)[0], self._intern(item)) for name, item in value.items()]
+            key = (dict, tuple((name, item[1]) for name, item in items))  # type: tuple
+            shared = self._values.get(key)
+            if shared is None:
+                shared = self._shared(key, {name: item[0] for name, item in items})
+            return shared, key
+        if isinstance(value, (list, tuple)):
+            items = [self._intern(item) for item in value]
+            key = (type(value), tuple(item[1] for item in items))
+            shared = self._values.get(key)
+            if shared is None:
+                shared = self._shared(key, type(value)(item[0] for item in items))
+            return shared, key
+        return value, (type(value), value)
+
+    def value(self, value):
+        return self._intern(value)[0]
+
+    def match(self, match):
+        # Equal matches, e.g. of the same message, end up being the same dict
+        return self.value(match)
+
+    def matches(self, matches):
+        interned = MatchList(self.match(match) for match in matches)
+        interned.truncated = getattr(matches, 'truncated', False)
+        interned.fast = getattr(matches, 'fast', False)
+        return interned
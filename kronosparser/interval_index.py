@@ -0,0 +1,204 @@
+import bisect
+import datetime
+import operator
+
+from dateutil import parser as date_parser
+from kronosparser.time_interval import TimeInterval
+
+# Inserted intervals are buffered and then merged into sorted blocks whose sizes follow a binary
+# counter, so an insert costs O(log n) amortized and a query visits O(log n) blocks.
+BUFFER_SIZE = 64
+
+_SECONDS_PER_DAY = 86400
+_NO_END = float('-inf')
+_ORDER = operator.itemgetter(0, 1)
+
+
+def _key(value, end=False):
+    if isinstance(value, datetime.datetime):
+        return (value.toordinal() * _SECONDS_PER_DAY + value.hour * 3600 + value.minute * 60 +
+                value.second)
+    return value.toordinal() * _SECONDS_PER_DAY + (_SECONDS_PER_DAY - 1 if end else 0)
+
+
+def _point_keys(point):
+    return _key(point), _key(point, end=True)
+
+
+def interval_from_parsed(parsed):
+    if 'interval' in parsed:
+        start = date_parser.parse(parsed['interval']['start']).replace(tzinfo=None)
+        end = date_parser.parse(parsed['interval']['end']).replace(tzinfo=None)
+        if len(parsed['interval']['start']) == 10 and len(parsed['interval']['end']) == 10:
+            return TimeInterval(start.date(), end.date())
+        return TimeInterval(start, end)
+    if 'date' in parsed:
+        day = date_parser.parse(parsed['date']).date()
+        return TimeInterval(day, day)
+    if 'datetime' in parsed:
+        moment = date_parser.parse(parsed['datetime']).replace(tzinfo=None)
+        return TimeInterval(moment, moment)
+    return None
+
+
+class _Block:
+    def __init__(self, entries):
+        self.starts = [entry[0] for entry in entries]
+        self.ends = [entry[1] for entry in entries]
+        self.values = [entry[2] for entry in entries]
+        size = 1
+        while size < len(entries):
+            size *= 2
+        self.size = size
+        tree = [_NO_END] * (2 * size)
+        tree[size:size + len(entries)] = self.ends
+        while size > 1:
+            tree[size // 2:size] = [
+                max(left, right)
+                for left, right in zip(tree[size:2 * size:2], tree[size + 1:2 * size:2])
+            ]
+            size //= 2
+        self.max_ends = tree
+
+    def __len__(self):
+        return len(self.starts)
+
+    def entries(self):
+        return zip(self.starts, self.ends, self.values)
+
+    def overlap(self, low, high, found):
+        # Entries starting after `high` are cut by a bisection, the max-end tree prunes the rest
+        count = bisect.bisect_right(self.starts, high)
+        if not count:
+            return
+        tree = self.max_ends
+        stack = [(1, 0, self.size)]
+        while stack:
+            node, first, last = stack.pop()
+            if first >= count or tree[node] < low:
+                continue
+            if node >= self.size:
+                found.append((self.starts[first], self.ends[first], self.values[first]))
+                continue
+            middle = (first + last) // 2
+            stack.append((2 * node + 1, middle, last))
+            stack.append((2 * node, first, middle))
+
+    def max_end_before(self, high):
+        count = bisect.bisect_right(self.starts, high)
+        best = None
+        first = self.size
+        last = self.size + count
+        tree = self.max_ends
+        while first < last:
+            if first & 1:
+                best = self._best(best, first)
+                first += 1
+            if last & 1:
+                last -= 1
+                best = self._best(best, last)
+            first //= 2
+            last //= 2
+        if best is None:
+            return None
+        while best < self.size:
+            best = 2 * best + (tree[2 * best + 1] == tree[best])
+        index = best - self.size
+        return self.starts[index], self.ends[index], self.values[index]
+
+    def _best(self, best, node):
+        if best is None or self.max_ends[node] > self.max_ends[best]:
+            return node
+        return best
+
+    def first_start_after(self, high):
+        index = bisect.bisect_right(self.starts, high)
+        if index == len(self.starts):
+            return None
+        return self.starts[index], self.ends[index], self.values[index]
+
+
+class IntervalIndex:
+    def __init__(self, items=()):
+        self._blocks = []
+        self._buffer = []
+        self.update(items)
+
+    @classmethod
+    def from_matches(cls, matches):
+        # Matches that do not resolve to a point in time (errors, recurrences) are skipped
+        items = []
+        for match in matches:
+            interval = interval_from_parsed(match['parsed'])
+            if interval is not None:
+                items.append((interval, match))
+        return cls(items)
+
+    def __len__(self):
+        return len(self._buffer) + sum(len(block) for block in self._blocks)
+
+    def add(self, interval, value=None):
+        self._buffer.append(self._entry(interval, value))
+        if len(self._buffer) >= BUFFER_SIZE:
+            self._flush()
+
+    def update(self, items):
+        entries = [
+            self._entry(*item) if isinstance(item, tuple) else self._entry(item) for item in items
+        ]
+        if len(entries) < BUFFER_SIZE:
+            for entry in entries:
+                self._buffer.append(entry)
+            if len(self._buffer) >= BUFFER_SIZE:
+                self._flush()
+            return
+        entries.sort(key=_ORDER)
+        self._push(entries)
+
+    def stab(self, point):
+        return self.overlap(point, point)
+
+    def overlap(self, start, end=None):
+        if isinstance(start, TimeInterval):
+            start, end = start.get_start(), start.get_end()
+        low = _key(start)
+        high = _key(end if end is not None else start, end=True)
+        found = [entry for entry in self._buffer if entry[0] <= high and entry[1] >= low]
+        for block in self._blocks:
+            block.overlap(low, high, found)
+        found.sort(key=_ORDER)
+        return [entry[2] for entry in found]
+
+    def nearest(self, point):
+        low, high = _point_keys(point)
+        best = None
+        best_distance = None
+        candidates = list(self._buffer)
+        for block in self._blocks:
+            candidates.append(block.max_end_before(high))
+            candidates.append(block.first_start_after(high))
+        for candidate in candidates:
+            if candidate is None:
+                continue
+            distance = max(candidate[0] - high, low - candidate[1], 0)
+            if best_distance is None or distance < best_distance:
+                best, best_distance = candidate, distance
+        return None if best is None else best[2]
+
+    @staticmethod
+    def _entry(interval, value=None):
+        if interval.get_end() is None:
+            raise ValueError('Cannot index an interval without an end')
+        return (_key(interval.get_start()), _key(interval.get_end(),
+                                                 end=True), interval if value is None else value)
+
+    def _flush(self):
+        entries = sorted(self._buffer, key=_ORDER)
+        self._buffer = []
+        self._push(entries)
+
+    def _push(self, entries):
+        while self._blocks and len(self._blocks[-1]) <= len(entries):
+            block = self._blocks.pop()
+            entries = sorted(list(block.entries()) + entries, key=_ORDER)
+        self._blocks.append(_Block(entries))
@@ -0,0 +1,108 @@
+import pyparsing
+from kronosparser import clock
+from kronosparser.locales import get_grammar, normalize_locale
+from kronosparser.parser import parse_context
+from kronosparser.time_parser import GRAMMAR_VERSION, set_datetime
+from kronosparser.utils import find_all, resolve_match
+
+# Context kept around a span, enough for the lookarounds of the grammar (a word boundary before it,
+# `NotAny(datetime_spec)` after it). Spans whose result depends on more keep the whole text.
+HEAD = 1
+TAIL = 64
+
+
+def production(grammar, text, start, end):
+    # Name of the delta_time alternative that matched text[start:end]
+    for name, alternative in grammar.productions.items():
+        try:
+            loc, _ = alternative._parse(text, start)  # pylint: disable=protected-access
+        except pyparsing.ParseException:
+            continue
+        return name if loc == end else None
+    return None
+
+
+def _node(text, match, locale, alternative, whole=False):
+    # With `whole`, the node keeps all of the text around the span instead of HEAD and TAIL
+    start, end = match['start'], match['end']
+    head, tail = (len(text), len(text)) if whole else (HEAD, TAIL)
+    return {
+        'text': match['text'],
+        'start': start,
+        'end': end,
+        'locale': locale,
+        'version': GRAMMAR_VERSION,
+        'production': alternative,
+        'head': text[max(start - head, 0):start],
+        'tail': text[end:end + tail],
+    }
+
+
+def parse_node(node):
+    if node.get('version') != GRAMMAR_VERSION:
+        raise ValueError('{!r} was compiled for grammar version {}, not {}'.format(
+            node['text'], node.get('version'), GRAMMAR_VERSION))
+    grammar = get_grammar(node['locale'])
+    expression = grammar.delta_time
+    if node['production'] is not None:
+        if node['production'] not in grammar.productions:
+            raise ValueError('Unknown production {!r}'.format(node['production']))
+        expression = grammar.productions[node['production']]
+    context = node['head'] + node['text'] + node['tail']
+    start = len(node['head'])
+    end, tokens = expression._parse(context, start)  # pylint: disable=protected-access
+    if end != start + len(node['text']):
+        raise ValueError('{!r} no longer parses as in its IR'.format(node['text']))
+    return set_datetime(tokens) if node['production'] is not None else tokens[0]
+
+
+def compile_ir(text, locale='en', tz='US/Pacific', region=None):
+    # Time-independent form of the date expressions in `text`: each one keeps its span, the name
+    # of the delta_time alternative that matched it and the little context that alternative looks
+    # at. JSON-serializable, and resolved against any reference time by `evaluate` as long as the
+    # grammar keeps the same GRAMMAR_VERSION.
+    locale = normalize_locale(locale)
+    grammar = get_grammar(locale)
+    nodes = []
+    with parse_context(tz, region, clock.utc_now()):
+        for match in find_all(grammar.delta_time, text):
+            alternative = production(grammar, text, match['start'], match['end'])
+            node = _node(text, match, locale, alternative)
+            if parse_node(node) != match['parsed']:
+                node = _node(text, match, locale, alternative, whole=True)
+            nodes.append(node)
+    return nodes
+
+
+def evaluate(nodes,
+             reference_time=None,
+             future=False,
+             interval_to_date=True,
+             tz='US/Pacific',
+             region=None,
+             memo=None):
+    # pylint: disable=too-many-arguments
+    # What parse_dates returns for the compiled text at `reference_time` (now by default), without
+    # scanning the text again. With a memo.SpanMemo, spans it has already resolved in the same
+    # context are not parsed at all.
+    now = clock.utc_now() if reference_time is None else clock.to_utc(reference_time).replace(
+        microsecond=0)
+    matches = []
+    with parse_context(tz, region, now):
+        for node in nodes:
+            match = {
+                'text': node['text'],
+                'parsed': None,
+                'start': node['start'],
+                'end': node['end']
+            }
+            if memo is not None:
+                match['parsed'] = memo.resolve(node['text'], now, future, interval_to_date, tz,
+                                               node['locale'], region)
+                if match['parsed'] is not None:
+                    matches.append(match)
+                    continue
+            match['parsed'] = parse_node(node)
+            matches.append(
+                resolve_match(match, future=future, interval_to_date=interval_to_date, tz=tz))
+    return matches
@@ -0,0 +1,265 @@
+import re
+import types
+
+from kronosparser import word_number
+
+
+def freeze(mapping):
+    return types.MappingProxyType(dict(mapping))
+
+
+def numbered(rows, first=0):
+    # Every word of the n-th row (from `first`) maps to n, e.g. the spellings of a weekday
+    return freeze((word, number) for number, words in enumerate(rows, first) for word in words)
+
+
+def _ordinal(number):
+    if 10 <= number % 100 < 20:
+        return '{}th'.format(number)
+    return '{}{}'.format(number, {1: 'st', 2: 'nd', 3: 'rd'}.get(number % 10, 'th'))
+
+
+ORDINAL_DAYS = freeze((_ordinal(day), day) for day in range(1, 32))
+
+WEEKDAYS = freeze({
+    'monday': 0,
+    'mon': 0,
+    'mon.': 0,
+    'tuesday': 1,
+    'tue': 1,
+    'tue.': 1,
+    'tues': 1,
+    'tues.': 1,
+    'wednesday': 2,
+    'wed': 2,
+    'wed.': 2,
+    'thursday': 3,
+    'thu': 3,
+    'thu.': 3,
+    'thurs': 3,
+    'thurs.': 3,
+    'friday': 4,
+    'fri': 4,
+    'fri.': 4,
+    'saturday': 5,
+    'sat': 5,
+    'sat.': 5,
+    'sunday': 6,
+    'sun': 6,
+    'sun.': 6
+})
+
+MONTH_NAMES = freeze({
+    'jan': 1,
+    'jan.': 1,
+    'january': 1,
+    'feb': 2,
+    'feb.': 2,
+    'february': 2,
+    'mar': 3,
+    'mar.': 3,
+    'march': 3,
+    'apr': 4,
+    'apr.': 4,
+    'april': 4,
+    'may': 5,
+    'jun': 6,
+    'jun.': 6,
+    'june': 6,
+    'jul': 7,
+    'jul.': 7,
+    'july': 7,
+    'aug': 8,
+    'aug.': 8,
+    'august': 8,
+    'sep': 9,
+    'sep.': 9,
+    'sept': 9,
+    'sept.': 9,
+    'september': 9,
+    'oct': 10,
+    'oct.': 10,
+    'october': 10,
+    'nov': 11,
+    'nov.': 11,
+    'november': 11,
+    'dec': 12,
+    'dec.': 12,
+    'december': 12
+})
+
+NUMERIC_MONTHS = freeze([(str(month), month)
+                         for month in range(1, 13)] + [('{:02d}'.format(month), month)
+                                                       for month in range(1, 10)])
+
+MONTHS = freeze(list(MONTH_NAMES.items()) + list(NUMERIC_MONTHS.items()))
+
+QUARTER_NAMES = freeze({'q1': 1, 'q2': 2, 'q3': 3, 'q4': 4})
+
+QUARTER_ORDINALS = freeze({'first': 1, 'second': 2, 'third': 3, 'fourth': 4})
+
+QUARTERS = freeze(list(QUARTER_NAMES.items()) + list(QUARTER_ORDINALS.items()))
+
+
+def keyword_pattern(words, leading=r'\b', trailing=r'\b'):
+    alternatives = '|'.join(re.escape(word) for word in sorted(words, key=lambda x: (-len(x), x)))
+    return '{}({}){}'.format(leading, alternatives, trailing)
+
+
+def case_variants(table):
+    variants = {}  # type: dict
+    for word, value in table.items():
+        for variant in (word, word.title(), word.upper()):
+            variants.setdefault(variant, value)
+    return freeze(variants)
+
+
+def lookup(table):
+    # The common spellings are resolved with a single dict hit, only unusual casing is lowered
+    variants = case_variants(table)
+
+    def resolve(word):
+        value = variants.get(word)
+        if value is None:
+            value = table[word.lower()]
+        return value
+
+    return resolve
+
+
+def resolve_action(table):
+    resolve = lookup(table)
+    return lambda tokens: resolve(tokens[0])
+
+
+# Everything below, together with the tables above, makes up a locale pack: the vocabulary that
+# time_parser.build_grammar plugs into the shared grammar skeleton. Other packs live in
+# kronosparser.locales and define the same names.
+
+LOCALE = 'en'
+
+NAMED_DAYS = freeze({'yesterday': 'yesterday', 'today': 'today', 'tomorrow': 'tomorrow'})
+
+UNITS = freeze({
+    'year': ('year', 'years'),
+    'quarter': ('quarter', 'quarters'),
+    'month': ('month', 'months'),
+    'week': ('week', 'weeks'),
+    'day': ('day', 'days'),
+    'hour': ('hour', 'hours'),
+    'minute': ('minute', 'minutes'),
+    'second': ('second', 'seconds'),
+})
+
+KEYWORDS = freeze({
+    'the': ('the', ),
+    'to': ('to', ),
+    'at': ('at', '@'),
+    'and': ('and', ),
+    'by': ('by', ),
+    'around': ('around', ),
+    'of': ('of', ),
+    'on': ('on', ),
+    'time': ('time', ),
+    'o_clock': ('o\'clock', 'oclock', 'o clock'),
+    'between': ('between', ),
+    'in': ('in', ),
+    'from': ('from', ),
+    'before': ('before', ),
+    'after': ('after', ),
+    'ago': ('ago', ),
+    'ago_prefix': (),
+    'next': ('next', ),
+    'last': ('last', ),
+    'this': ('this', ),
+    'noon': ('noon', ),
+    'midnight': ('midnight', ),
+    'now': ('now', ),
+    'dawn': ('dawn', ),
+    'sunrise': ('sunrise', ),
+    'morning': ('morning', ),
+    'afternoon': ('afternoon', ),
+    'dusk': ('dusk', ),
+    'sunset': ('sunset', ),
+    'eod': ('eod', ),
+    'evening': ('evening', ),
+    'night': ('night', ),
+    'tonight': ('tonight', ),
+    'couple_article': ('a', ),
+    'couple': ('couple', ),
+    'half': ('half', ),
+    'asap': ('asap', ),
+    'greeting': ('good', ),
+    'every': ('every', 'each'),
+    'other': ('other', ),
+    'business': ('business', 'working', 'work'),
+    'business_suffix': (),
+    'within': ('within', ),
+})
+
+QUANTITY_ARTICLES = ('a', 'an')
+
+# Bounds followed by `of`, bounds used on their own and bounds optionally followed by a dash
+BOUNDS_OF = freeze({
+    'beginning': 'beginning',
+    'start': 'beginning',
+    'middle': 'middle',
+    'end': 'end'
+})
+BOUNDS = freeze({'early': 'beginning', 'late': 'end'})
+BOUNDS_DASH = freeze({'mid': 'middle'})
+
+HALVES = freeze({'earlier': 'first', 'first': 'first', 'later': 'second', 'second': 'second'})
+
+# Holiday names resolve to the rule names of kronosparser.holidays
+HOLIDAYS = freeze({
+    'new year\'s day': 'new_year',
+    'new years day': 'new_year',
+    'new year\'s': 'new_year',
+    'mlk day': 'mlk_day',
+    'martin luther king day': 'mlk_day',
+    'presidents day': 'presidents_day',
+    'presidents\' day': 'presidents_day',
+    'president\'s day': 'presidents_day',
+    'valentine\'s day': 'valentines_day',
+    'valentines day': 'valentines_day',
+    'good friday': 'good_friday',
+    'easter': 'easter',
+    'easter sunday': 'easter',
+    'easter monday': 'easter_monday',
+    'mother\'s day': 'mothers_day',
+    'mothers day': 'mothers_day',
+    'victoria day': 'victoria_day',
+    'early may bank holiday': 'early_may_bank_holiday',
+    'memorial day': 'memorial_day',
+    'spring bank holiday': 'spring_bank_holiday',
+    'father\'s day': 'fathers_day',
+    'fathers day': 'fathers_day',
+    'juneteenth': 'juneteenth',
+    'canada day': 'canada_day',
+    'independence day': 'independence_day',
+    'fourth of july': 'independence_day',
+    'summer bank holiday': 'summer_bank_holiday',
+    'labor day': 'labor_day',
+    'labour day': 'labor_day',
+    'columbus day': 'columbus_day',
+    'thanksgiving': 'thanksgiving',
+    'thanksgiving day': 'thanksgiving',
+    'halloween': 'halloween',
+    'veterans day': 'veterans_day',
+    'veterans\' day': 'veterans_day',
+    'christmas eve': 'christmas_eve',
+    'christmas': 'christmas',
+    'christmas day': 'christmas',
+    'xmas': 'christmas',
+    'boxing day': 'boxing_day',
+    'new year\'s eve': 'new_years_eve',
+    'new years eve': 'new_years_eve',
+})
+
+NUMBER_UNITS = freeze(word_number.unit_definitions)
+NUMBER_TENS = freeze(word_number.tens_definitions)
+NUMBER_HUNDREDS = freeze(word_number.hundred_definitions)
+NUMBER_MAJORS = freeze(word_number.major_definitions)
+NUMBER_ARTICLES = tuple(word_number.article_definitions)
+NUMBER_CONJUNCTIONS = tuple(word_number.conjunction_definitions)
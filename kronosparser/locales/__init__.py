@@ -0,0 +1,57 @@
+import gc
+import importlib
+import threading
+
+from kronosparser import time_parser
+
+DEFAULT_LOCALE = 'en'
+
+LOCALE_PACKS = {
+    'en': 'kronosparser.lexicon',
+    'es': 'kronosparser.locales.es',
+    'pt': 'kronosparser.locales.pt',
+}
+
+_grammars = {DEFAULT_LOCALE: time_parser.english}
+_lock = threading.Lock()
+
+
+def normalize_locale(locale):
+    if locale is None:
+        return DEFAULT_LOCALE
+    language = locale.replace('-', '_').split('_')[0].lower()
+    if language not in LOCALE_PACKS:
+        raise ValueError('Unsupported locale {!r}, expected one of {}'.format(
+            locale, ', '.join(sorted(LOCALE_PACKS))))
+    return language
+
+
+def get_grammar(locale=DEFAULT_LOCALE):
+    # Grammars other than English are only imported and built the first time they are requested
+    language = normalize_locale(locale)
+    grammar = _grammars.get(language)
+    if grammar is None:
+        with _lock:
+            grammar = _grammars.get(language)
+            if grammar is None:
+                pack = importlib.import_module(LOCALE_PACKS[language])
+                grammar = time_parser.build_grammar(pack)
+                _grammars[language] = grammar
+    return grammar
+
+
+def loaded_locales():
+    return sorted(_grammars)
+
+
+def freeze_grammars(locales=(DEFAULT_LOCALE, )):
+    # Builds the grammars and moves every object alive at this point out of the garbage collector's
+    # reach, so that collections stop traversing the grammar graphs. Meant to be called once when a
+    # worker starts, as it also freezes whatever else the process holds at that time.
+    for locale in locales:
+        get_grammar(locale)
+    gc.collect()
+    # gc.freeze is new in Python 3.7
+    freeze = getattr(gc, 'freeze', None)
+    if freeze is not None:
+        freeze()
@@ -0,0 +1,184 @@
+from kronosparser.lexicon import freeze, numbered
+
+LOCALE = 'es'
+
+ORDINAL_DAYS = freeze([('{}º'.format(day), day) for day in range(1, 32)] + [('primero', 1)])
+
+WEEKDAYS = numbered([
+    ('lunes', 'lun', 'lun.'),
+    ('martes', ),
+    ('miércoles', 'miercoles', 'mié', 'mie'),
+    ('jueves', 'jue', 'jue.'),
+    ('viernes', 'vie', 'vie.'),
+    ('sábado', 'sabado', 'sáb', 'sab'),
+    ('domingo', 'dom', 'dom.'),
+])
+
+MONTH_NAMES = numbered([
+    ('enero', 'ene', 'ene.'),
+    ('febrero', 'feb', 'feb.'),
+    ('marzo', 'mar', 'mar.'),
+    ('abril', 'abr', 'abr.'),
+    ('mayo', ),
+    ('junio', 'jun', 'jun.'),
+    ('julio', 'jul', 'jul.'),
+    ('agosto', 'ago', 'ago.'),
+    ('septiembre', 'setiembre', 'sep', 'sep.', 'sept', 'sept.'),
+    ('octubre', 'oct', 'oct.'),
+    ('noviembre', 'nov', 'nov.'),
+    ('diciembre', 'dic', 'dic.'),
+],
+                       first=1)
+
+QUARTER_NAMES = freeze({'q1': 1, 'q2': 2, 'q3': 3, 'q4': 4})
+
+QUARTER_ORDINALS = freeze({'primer': 1, 'segundo': 2, 'tercer': 3, 'cuarto': 4})
+
+NAMED_DAYS = freeze({'ayer': 'yesterday', 'hoy': 'today', 'mañana': 'tomorrow'})
+
+UNITS = freeze({
+    'year': ('año', 'años'),
+    'quarter': ('trimestre', 'trimestres'),
+    'month': ('mes', 'meses'),
+    'week': ('semana', 'semanas'),
+    'day': ('día', 'días', 'dia', 'dias'),
+    'hour': ('hora', 'horas'),
+    'minute': ('minuto', 'minutos'),
+    'second': ('segundo', 'segundos'),
+})
+
+KEYWORDS = freeze({
+    'the': ('el', 'la', 'los', 'las'),
+    'to': ('a', 'hasta'),
+    'at': ('a las', 'a la', '@'),
+    'and': ('y', ),
+    'by': ('para', ),
+    'around': ('alrededor de', 'sobre'),
+    'of': ('de', 'del'),
+    'on': ('el', ),
+    'time': ('hora', ),
+    'o_clock': ('en punto', ),
+    'between': ('entre', ),
+    'in': ('en', 'dentro de'),
+    'from': ('desde', 'a partir de'),
+    'before': ('antes de', 'antes del'),
+    'after': ('después de', 'despues de', 'después del', 'despues del'),
+    'ago': (),
+    'ago_prefix': ('hace', ),
+    'next': ('próximo', 'próxima', 'proximo', 'proxima', 'siguiente'),
+    'last': ('pasado', 'pasada', 'último', 'última', 'ultimo', 'ultima'),
+    'this': ('este', 'esta'),
+    'noon': ('mediodía', 'mediodia'),
+    'midnight': ('medianoche', ),
+    'now': ('ahora', ),
+    'dawn': ('amanecer', 'alba'),
+    'sunrise': ('salida del sol', ),
+    'morning': ('por la mañana', 'en la mañana', 'de la mañana'),
+    'afternoon': ('por la tarde', 'en la tarde', 'de la tarde'),
+    'dusk': ('anochecer', ),
+    'sunset': ('atardecer', 'puesta del sol'),
+    'eod': ('fin del día', 'fin del dia'),
+    'evening': (),
+    'night': ('por la noche', 'en la noche', 'de la noche'),
+    'tonight': ('esta noche', ),
+    'couple_article': ('un', ),
+    'couple': ('par', ),
+    'half': ('mitad', ),
+    'asap': ('cuanto antes', 'lo antes posible', 'asap'),
+    'greeting': (),
+    'every': ('cada', 'todos los', 'todas las'),
+    'other': (),
+    'business': (),
+    'business_suffix': ('hábiles', 'habiles', 'laborables'),
+    'within': ('dentro de', ),
+})
+
+QUANTITY_ARTICLES = ('un', 'una')
+
+BOUNDS_OF = freeze({
+    'principio': 'beginning',
+    'principios': 'beginning',
+    'inicio': 'beginning',
+    'comienzo': 'beginning',
+    'mediados': 'middle',
+    'final': 'end',
+    'finales': 'end',
+    'fin': 'end'
+})
+BOUNDS = freeze({})
+BOUNDS_DASH = freeze({})
+
+HALVES = freeze({'primera': 'first', 'segunda': 'second'})
+
+HOLIDAYS = freeze({
+    'año nuevo': 'new_year',
+    'san valentín': 'valentines_day',
+    'san valentin': 'valentines_day',
+    'viernes santo': 'good_friday',
+    'pascua': 'easter',
+    'domingo de pascua': 'easter',
+    'día de la madre': 'mothers_day',
+    'dia de la madre': 'mothers_day',
+    'día del padre': 'fathers_day',
+    'dia del padre': 'fathers_day',
+    'acción de gracias': 'thanksgiving',
+    'accion de gracias': 'thanksgiving',
+    'día de acción de gracias': 'thanksgiving',
+    'dia de accion de gracias': 'thanksgiving',
+    'halloween': 'halloween',
+    'nochebuena': 'christmas_eve',
+    'navidad': 'christmas',
+    'nochevieja': 'new_years_eve',
+})
+
+NUMBER_UNITS = freeze({
+    'cero': 0,
+    'uno': 1,
+    'una': 1,
+    'dos': 2,
+    'tres': 3,
+    'cuatro': 4,
+    'cinco': 5,
+    'seis': 6,
+    'siete': 7,
+    'ocho': 8,
+    'nueve': 9,
+    'diez': 10,
+    'once': 11,
+    'doce': 12,
+    'trece': 13,
+    'catorce': 14,
+    'quince': 15,
+    'dieciséis': 16,
+    'dieciseis': 16,
+    'diecisiete': 17,
+    'dieciocho': 18,
+    'diecinueve': 19,
+    'veintiuno': 21,
+    'veintiuna': 21,
+    'veintidós': 22,
+    'veintidos': 22,
+    'veintitrés': 23,
+    'veintitres': 23,
+    'veinticuatro': 24,
+    'veinticinco': 25,
+    'veintiséis': 26,
+    'veintiseis': 26,
+    'veintisiete': 27,
+    'veintiocho': 28,
+    'veintinueve': 29,
+})
+NUMBER_TENS = freeze({
+    'veinte': 20,
+    'treinta': 30,
+    'cuarenta': 40,
+    'cincuenta': 50,
+    'sesenta': 60,
+    'setenta': 70,
+    'ochenta': 80,
+    'noventa': 90,
+})
+NUMBER_HUNDREDS = freeze({'cien': 100, 'ciento': 100})
+NUMBER_MAJORS = freeze({'mil': 10**3, 'millón': 10**6, 'millon': 10**6, 'millones': 10**6})
+NUMBER_ARTICLES = ('un', )
+NUMBER_CONJUNCTIONS = ('y', )
@@ -0,0 +1,178 @@
+from kronosparser.lexicon import freeze, numbered
+
+LOCALE = 'pt'
+
+ORDINAL_DAYS = freeze([('{}º'.format(day), day) for day in range(1, 32)] + [('primeiro', 1)])
+
+WEEKDAYS = numbered([
+    ('segunda-feira', 'segunda', 'seg'),
+    ('terça-feira', 'terca-feira', 'terça', 'terca', 'ter'),
+    ('quarta-feira', 'quarta', 'qua'),
+    ('quinta-feira', 'quinta', 'qui'),
+    ('sexta-feira', 'sexta', 'sex'),
+    ('sábado', 'sabado', 'sáb', 'sab'),
+    ('domingo', 'dom'),
+])
+
+MONTH_NAMES = numbered([
+    ('janeiro', 'jan', 'jan.'),
+    ('fevereiro', 'fev', 'fev.'),
+    ('março', 'marco', 'mar', 'mar.'),
+    ('abril', 'abr', 'abr.'),
+    ('maio', 'mai', 'mai.'),
+    ('junho', 'jun', 'jun.'),
+    ('julho', 'jul', 'jul.'),
+    ('agosto', 'ago', 'ago.'),
+    ('setembro', 'set', 'set.'),
+    ('outubro', 'out', 'out.'),
+    ('novembro', 'nov', 'nov.'),
+    ('dezembro', 'dez', 'dez.'),
+],
+                       first=1)
+
+QUARTER_NAMES = freeze({'q1': 1, 'q2': 2, 'q3': 3, 'q4': 4})
+
+QUARTER_ORDINALS = freeze({'primeiro': 1, 'segundo': 2, 'terceiro': 3, 'quarto': 4})
+
+NAMED_DAYS = freeze({
+    'ontem': 'yesterday',
+    'hoje': 'today',
+    'amanhã': 'tomorrow',
+    'amanha': 'tomorrow'
+})
+
+UNITS = freeze({
+    'year': ('ano', 'anos'),
+    'quarter': ('trimestre', 'trimestres'),
+    'month': ('mês', 'mes', 'meses'),
+    'week': ('semana', 'semanas'),
+    'day': ('dia', 'dias'),
+    'hour': ('hora', 'horas'),
+    'minute': ('minuto', 'minutos'),
+    'second': ('segundo', 'segundos'),
+})
+
+KEYWORDS = freeze({
+    'the': ('o', 'a', 'os', 'as'),
+    'to': ('até', 'ate', 'a'),
+    'at': ('às', 'ao', '@'),
+    'and': ('e', ),
+    'by': ('até', 'ate'),
+    'around': ('por volta de', 'por volta das'),
+    'of': ('de', 'do', 'da'),
+    'on': ('no', 'na', 'em'),
+    'time': ('hora', ),
+    'o_clock': ('em ponto', ),
+    'between': ('entre', ),
+    'in': ('em', 'daqui a', 'dentro de'),
+    'from': ('desde', 'a partir de'),
+    'before': ('antes de', 'antes do', 'antes da'),
+    'after': ('depois de', 'depois do', 'depois da', 'após', 'apos'),
+    'ago': ('atrás', 'atras'),
+    'ago_prefix': ('há', ),
+    'next': ('próximo', 'próxima', 'proximo', 'proxima'),
+    'last': ('passado', 'passada', 'último', 'última', 'ultimo', 'ultima'),
+    'this': ('este', 'esta', 'neste', 'nesta'),
+    'noon': ('meio-dia', 'meio dia'),
+    'midnight': ('meia-noite', 'meia noite'),
+    'now': ('agora', ),
+    'dawn': ('madrugada', ),
+    'sunrise': ('nascer do sol', ),
+    'morning': ('de manhã', 'pela manhã', 'da manhã', 'de manha', 'da manha'),
+    'afternoon': ('à tarde', 'de tarde', 'pela tarde', 'da tarde'),
+    'dusk': ('anoitecer', ),
+    'sunset': ('pôr do sol', 'por do sol'),
+    'eod': ('fim do dia', ),
+    'evening': (),
+    'night': ('à noite', 'de noite', 'da noite'),
+    'tonight': ('hoje à noite', 'esta noite'),
+    'couple_article': ('um', ),
+    'couple': ('par', ),
+    'half': ('metade', ),
+    'asap': ('o quanto antes', 'o mais rápido possível', 'asap'),
+    'greeting': (),
+    'every': ('cada', 'todos os', 'todas as'),
+    'other': (),
+    'business': (),
+    'business_suffix': ('úteis', 'uteis'),
+    'within': ('dentro de', ),
+})
+
+QUANTITY_ARTICLES = ('um', 'uma')
+
+BOUNDS_OF = freeze({
+    'início': 'beginning',
+    'inicio': 'beginning',
+    'começo': 'beginning',
+    'comeco': 'beginning',
+    'meio': 'middle',
+    'meados': 'middle',
+    'fim': 'end',
+    'final': 'end'
+})
+BOUNDS = freeze({})
+BOUNDS_DASH = freeze({})
+
+HALVES = freeze({'primeira': 'first', 'segunda': 'second'})
+
+HOLIDAYS = freeze({
+    'ano novo': 'new_year',
+    'dia dos namorados': 'valentines_day',
+    'sexta-feira santa': 'good_friday',
+    'páscoa': 'easter',
+    'pascoa': 'easter',
+    'dia das mães': 'mothers_day',
+    'dia das maes': 'mothers_day',
+    'dia dos pais': 'fathers_day',
+    'ação de graças': 'thanksgiving',
+    'acao de gracas': 'thanksgiving',
+    'dia de ação de graças': 'thanksgiving',
+    'halloween': 'halloween',
+    'véspera de natal': 'christmas_eve',
+    'vespera de natal': 'christmas_eve',
+    'natal': 'christmas',
+    'véspera de ano novo': 'new_years_eve',
+    'reveillon': 'new_years_eve',
+    'réveillon': 'new_years_eve',
+})
+
+NUMBER_UNITS = freeze({
+    'zero': 0,
+    'um': 1,
+    'uma': 1,
+    'dois': 2,
+    'duas': 2,
+    'três': 3,
+    'tres': 3,
+    'quatro': 4,
+    'cinco': 5,
+    'seis': 6,
+    'sete': 7,
+    'oito': 8,
+    'nove': 9,
+    'dez': 10,
+    'onze': 11,
+    'doze': 12,
+    'treze': 13,
+    'catorze': 14,
+    'quatorze': 14,
+    'quinze': 15,
+    'dezesseis': 16,
+    'dezessete': 17,
+    'dezoito': 18,
+    'dezenove': 19,
+})
+NUMBER_TENS = freeze({
+    'vinte': 20,
+    'trinta': 30,
+    'quarenta': 40,
+    'cinquenta': 50,
+    'sessenta': 60,
+    'setenta': 70,
+    'oitenta': 80,
+    'noventa': 90,
+})
+NUMBER_HUNDREDS = freeze({'cem': 100, 'cento': 100})
+NUMBER_MAJORS = freeze({'mil': 10**3, 'milhão': 10**6, 'milhao': 10**6, 'milhões': 10**6})
+NUMBER_ARTICLES = ()
+NUMBER_CONJUNCTIONS = ('e', )
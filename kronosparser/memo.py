@@ -0,0 +1,175 @@
+import collections
+import copy
+import threading
+
+import pyparsing
+import pytz
+from kronosparser import clock, ir, metrics
+from kronosparser.locales import get_grammar, normalize_locale
+from kronosparser.parser import parse_context
+from kronosparser.utils import MatchList, resolve_match, scan
+
+DEFAULT_SIZE = 65536
+# Evaluation contexts (timezone, direction, reference time...) remembered per span
+RESULTS_PER_SPAN = 8
+
+
+class SpanMemo:
+    # Bounded LRU of resolved date expressions keyed by their matched text. The grammar still finds
+    # the spans of a message, but a span seen before in the same evaluation context (timezone and
+    # its offset, future, interval_to_date, region, and the reference time down to the resolution
+    # its parse read) gets its result back without running parse actions or timezone fixes.
+    def __init__(self, maxsize=DEFAULT_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._entries),
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def _entry(self, locale, span):
+        key = (locale, span)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+        entry = {
+            'production': ir.production(get_grammar(locale), span, 0, len(span)),
+            'results': collections.OrderedDict(),
+        }
+        with self._lock:
+            self._entries[key] = entry
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return entry
+
+    def _record(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+        if metrics.registry is not None:
+            metrics.registry.count_cache('span', hit)
+
+    def resolve(self,
+                span,
+                now,
+                future=False,
+                interval_to_date=True,
+                tz='US/Pacific',
+                locale='en',
+                region=None):
+        # pylint: disable=too-many-arguments,too-many-locals
+        # The resolved `parsed` value of a span at `now`, which must be pinned by the caller's
+        # parse_context. Falls back to None when the span does not parse on its own.
+        # Trailing whitespace taken by the match does not change its value
+        span = span.rstrip()
+        entry = self._entry(locale, span)
+        offset = pytz.utc.localize(now).astimezone(pytz.timezone(tz)).utcoffset()
+        context = (future, interval_to_date, tz, offset, region)
+        for (known, resolution, stamp), parsed in list(entry['results'].items()):
+            if known == context and stamp == clock.stamp(now, resolution):
+                self._record(True)
+                return copy.deepcopy(parsed)
+        self._record(False)
+        node = {
+            'text': span,
+            'locale': locale,
+            'version': ir.GRAMMAR_VERSION,
+            'production': entry['production'],
+            'head': '',
+            'tail': '',
+        }
+        with clock.track() as reads:
+            try:
+                parsed = ir.parse_node(node)
+            except (pyparsing.ParseException, ValueError):
+                return None
+            match = resolve_match({'parsed': parsed},
+                                  future=future,
+                                  interval_to_date=interval_to_date,
+                                  tz=tz)
+        with self._lock:
+            results = entry['results']
+            results[context, reads.resolution,
+                    clock.stamp(now, reads.resolution)] = copy.deepcopy(match['parsed'])
+            while len(results) > RESULTS_PER_SPAN:
+                results.popitem(last=False)
+        return match['parsed']
+
+    def parse(self,
+              text,
+              reference_time=None,
+              future=False,
+              interval_to_date=True,
+              tz='US/Pacific',
+              locale='en',
+              region=None):
+        # pylint: disable=too-many-arguments
+        # Same result as Parser.parse with the same settings
+        locale = normalize_locale(locale)
+        expression = get_grammar(locale).delta_time
+        now = clock.utc_now() if reference_time is None else clock.to_utc(reference_time).replace(
+            microsecond=0)
+        matches = MatchList()
+        with parse_context(tz, region, now):
+            for tokens, start, end in scan(expression, text, do_actions=False, suppressed=True):
+                if not tokens:
+                    # An ignored alternative, e.g. a greeting or an invalid year-first date
+                    parsed = {'datetime_parsing_error': True}
+                else:
+                    parsed = self.resolve(text[start:end], now, future, interval_to_date, tz,
+                                          locale, region)
+                if parsed is None:
+                    # Only parses with the text around it
+                    parsed = resolve_match(
+                        {
+                            'parsed':
+                            ir.parse_node({
+                                'text': text[start:end],
+                                'locale': locale,
+                                'version': ir.GRAMMAR_VERSION,
+                                'production': None,
+                                'head': text[:start],
+                                'tail': text[end:],
+                            })
+                        },
+                        future=future,
+                        interval_to_date=interval_to_date,
+                        tz=tz)['parsed']
+                matches.append({
+                    'text': text[start:end],
+                    'parsed': parsed,
+                    'start': start,
+                    'end': end
+                })
+        return matches
+
+    def warm_up(self, phrases, reference_time=None, locale='en', region=None, **settings):
+        # Finds the grammar production of every phrase ahead of time, and resolves it at
+        # `reference_time` (now by default) with the given `future`, `interval_to_date` and `tz`
+        for phrase in phrases:
+            self.parse(phrase,
+                       reference_time=reference_time,
+                       locale=locale,
+                       region=region,
+                       **settings)
+        return self
@@ -0,0 +1,173 @@
+import bisect
+import os
+import threading
+from typing import Optional
+
+# name: (type, help, histogram bucket upper bounds)
+METRICS = {
+    'kronosparser_parse_seconds':
+    ('histogram', 'Time spent in a parse call', (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+                                                 0.1, 0.25, 0.5, 1, 2.5, 5)),
+    'kronosparser_text_length_chars': ('histogram', 'Length of the parsed texts',
+                                       (16, 32, 64, 128, 256, 512, 1024, 4096, 16384, 65536)),
+    'kronosparser_matches':
+    ('histogram', 'Date expressions found per parse call', (0, 1, 2, 4, 8, 16, 32, 64)),
+    'kronosparser_parsing_errors_total':
+    ('counter', 'Matches resolved to datetime_parsing_error', None),
+    'kronosparser_parses_total': ('counter', 'Parse calls by scan path, "fast" when no position '
+                                  'of the text could start a date expression', None),
+    'kronosparser_cache_requests_total': ('counter', 'Result cache lookups', None),
+}  # type: dict
+
+# The registry observations go to, None while metrics are disabled
+registry = None  # type: Optional[Registry]
+
+
+def _labels(labels):
+    return tuple(sorted(labels.items()))
+
+
+class Registry:
+    # Counters and histograms of one process. `exporter`, if given, is also called with
+    # (name, value, labels) for every observation.
+    def __init__(self, exporter=None):
+        self.exporter = exporter
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._histograms = {}
+
+    def reset(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._histograms = {}
+
+    def count(self, name, value=1, **labels):
+        key = (name, _labels(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+        if self.exporter is not None:
+            self.exporter(name, value, labels)
+
+    def observe(self, name, value, **labels):
+        key = (name, _labels(labels))
+        bucket = bisect.bisect_left(METRICS[name][2], value)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = [[0] * (len(METRICS[name][2]) + 1), 0, 0]
+            histogram[0][bucket] += 1
+            histogram[1] += value
+            histogram[2] += 1
+        if self.exporter is not None:
+            self.exporter(name, value, labels)
+
+    def observe_parse(self, text, matches, seconds):
+        # The scan path is the one utils.find_all reported on `matches`
+        fast = getattr(matches, 'fast', False)
+        self.count('kronosparser_parses_total', path='fast' if fast else 'grammar')
+        self.observe('kronosparser_parse_seconds', seconds)
+        self.observe('kronosparser_text_length_chars', len(text))
+        self.observe('kronosparser_matches', len(matches))
+        errors = sum(1 for match in matches if 'datetime_parsing_error' in match['parsed'])
+        if errors:
+            self.count('kronosparser_parsing_errors_total', errors)
+
+    def count_cache(self, cache, hit):
+        self.count('kronosparser_cache_requests_total',
+                   cache=cache,
+                   result='hit' if hit else 'miss')
+
+    def snapshot(self):
+        # A picklable copy, e.g. to be sent back from worker processes and merged
+        with self._lock:
+            return {
+                'counters': dict(self._counters),
+                'histograms': {
+                    key: [list(histogram[0]), histogram[1], histogram[2]]
+                    for key, histogram in self._histograms.items()
+                },
+            }
+
+
+def merge(*snapshots):
+    merged = {'counters': {}, 'histograms': {}}  # type: dict
+    for snapshot in snapshots:
+        for key, value in snapshot['counters'].items():
+            merged['counters'][key] = merged['counters'].get(key, 0) + value
+        for key, (buckets, total, count) in snapshot['histograms'].items():
+            if key not in merged['histograms']:
+                merged['histograms'][key] = [list(buckets), total, count]
+                continue
+            histogram = merged['histograms'][key]
+            histogram[0] = [first + second for first, second in zip(histogram[0], buckets)]
+            histogram[1] += total
+            histogram[2] += count
+    return merged
+
+
+def _format_labels(labels, **extra):
+    labels = list(labels) + sorted(extra.items())
+    if not labels:
+        return ''
+    return '{' + ','.join('{}="{}"'.format(name, value) for name, value in labels) + '}'
+
+
+def _format_value(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def prometheus(snapshot=None):
+    # Prometheus text exposition format of `snapshot`, the current registry by default
+    if snapshot is None:
+        snapshot = registry.snapshot() if registry is not None else merge()
+    lines = []
+    for name, (kind, help_text, bounds) in METRICS.items():
+        if kind == 'counter':
+            samples = [(labels, value)
+                       for (metric, labels), value in sorted(snapshot['counters'].items())
+                       if metric == name]
+        else:
+            samples = [(labels, histogram)
+                       for (metric, labels), histogram in sorted(snapshot['histograms'].items())
+                       if metric == name]
+        if not samples:
+            continue
+        lines.append('# HELP {} {}'.format(name, help_text))
+        lines.append('# TYPE {} {}'.format(name, kind))
+        for labels, value in samples:
+            if kind == 'counter':
+                lines.append('{}{} {}'.format(name, _format_labels(labels), _format_value(value)))
+                continue
+            buckets, total, count = value
+            cumulative = 0
+            for bound, bucket in zip(bounds + ('+Inf', ), buckets):
+                cumulative += bucket
+                lines.append('{}_bucket{} {}'.format(name, _format_labels(labels, le=bound),
+                                                     cumulative))
+            lines.append('{}_sum{} {}'.format(name, _format_labels(labels), _format_value(total)))
+            lines.append('{}_count{} {}'.format(name, _format_labels(labels), count))
+    return '\n'.join(lines) + '\n' if lines else ''
+
+
+def enable(exporter=None):
+    global registry  # pylint: disable=global-statement
+    registry = Registry(exporter)
+    return registry
+
+
+def disable():
+    global registry  # pylint: disable=global-statement
+    registry = None
+
+
+def _after_fork():
+    # A forked worker starts from empty metrics and a fresh lock, its snapshots can then be merged
+    # with the parent's without counting anything twice
+    if registry is not None:
+        registry.reset()
+
+
+# os.register_at_fork is new in Python 3.7
+_register_at_fork = getattr(os, 'register_at_fork', None)
+if _register_at_fork is not None:
+    _register_at_fork(after_in_child=_after_fork)
@@ -0,0 +1,95 @@
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+from kronosparser import clock, parse_dates
+from kronosparser.parser import parse_context
+from kronosparser.incremental import MAX_LOOKAHEAD
+from kronosparser.locales import get_grammar
+from kronosparser.utils import MatchList, scan, word_end, word_start
+
+# Documents are cut into pieces of roughly this many characters, each parsed in its own process
+CHUNK_SIZE = 200000
+# Candidate boundaries from the most to the least natural, and how many of each are checked
+BOUNDARIES = (re.compile(r'\n\s*'), re.compile(r'[.!?]\s+'), re.compile(r'\s+'))
+MAX_CANDIDATES = 8
+
+
+def crosses(text, expression, point, lookahead=MAX_LOOKAHEAD):
+    # Whether a match around `point` would be cut by splitting the text there
+    low = word_start(text, max(point - lookahead, 0))
+    high = word_end(text, min(point + lookahead, len(text)))
+    return any(low + start < point < low + end
+               for _, start, end in scan(expression, text[low:high]))
+
+
+def safe_point(text, expression, low, high, lookahead=MAX_LOOKAHEAD):
+    for boundary in BOUNDARIES:
+        for count, found in enumerate(boundary.finditer(text, low, high)):
+            if count == MAX_CANDIDATES:
+                break
+            point = found.end()
+            if point < len(text) and not crosses(text, expression, point, lookahead):
+                return point
+    return None
+
+
+def split_points(text, expression, chunk_size=CHUNK_SIZE, lookahead=MAX_LOOKAHEAD):
+    points = []
+    target = chunk_size
+    while target + chunk_size // 2 < len(text):
+        point = safe_point(text, expression, target, target + chunk_size // 2, lookahead)
+        if point is None:
+            target += chunk_size
+        else:
+            points.append(point)
+            target = point + chunk_size
+    return points
+
+
+def _parse_piece(piece):
+    text, offset, now, kwargs = piece
+    with clock.use_time(now):
+        matches = parse_dates(text, **kwargs)
+    for match in matches:
+        match['start'] += offset
+        match['end'] += offset
+    return matches
+
+
+def parse_document(text,
+                   future=False,
+                   interval_to_date=True,
+                   tz='US/Pacific',
+                   locale='en',
+                   region=None,
+                   workers=None,
+                   chunk_size=CHUNK_SIZE,
+                   executor=None,
+                   reference_time=None):
+    # pylint: disable=too-many-arguments,too-many-locals
+    # Same matches as parse_dates, with the pieces of a long text parsed on a process pool. The
+    # clock is read once, every piece is resolved at that reference time.
+    now = clock.utc_now() if reference_time is None else clock.to_utc(reference_time).replace(
+        microsecond=0)
+    kwargs = {
+        'future': future,
+        'interval_to_date': interval_to_date,
+        'tz': tz,
+        'locale': locale,
+        'region': region
+    }
+    with parse_context(tz, region, now):
+        points = split_points(text, get_grammar(locale).delta_time, chunk_size)
+    if not points:
+        return _parse_piece((text, 0, now, kwargs))
+    bounds = list(zip([0] + points, points + [len(text)]))
+    pieces = [(text[start:end], start, now, kwargs) for start, end in bounds]
+    if executor is None:
+        with ProcessPoolExecutor(workers) as pool:
+            results = list(pool.map(_parse_piece, pieces))
+    else:
+        results = list(executor.map(_parse_piece, pieces))
+    matches = MatchList()
+    for piece_matches in results:
+        matches.extend(piece_matches)
+    return matches
@@ -0,0 +1,90 @@
+import contextlib
+import copy
+import functools
+import threading
+import time
+
+from kronosparser import business, holidays, metrics
+from kronosparser.clock import to_utc, use_time, utc_now
+from kronosparser.locales import get_grammar
+from kronosparser.utils import find_all, get_deadline, resolve_all
+
+DEFAULT_CACHE_SIZE = 1024
+
+_local = threading.local()
+
+
+@contextlib.contextmanager
+def parse_context(tz, region, now=None):
+    # Everything a parse reads besides its text is thread-local and set here
+    with holidays.use_region(region or holidays.current_region()), business.use_timezone(tz):
+        if now is None:
+            yield
+        else:
+            with use_time(now):
+                yield
+
+
+class Parser:  # pylint: disable=too-many-instance-attributes
+    # Holds its own settings and reference clock, and only touches thread-local state while
+    # parsing, so one instance can be shared by many threads
+    def __init__(self,
+                 future=False,
+                 interval_to_date=True,
+                 tz='US/Pacific',
+                 locale='en',
+                 region=None,
+                 clock=utc_now,
+                 cache_size=DEFAULT_CACHE_SIZE):
+        # pylint: disable=too-many-arguments
+        self.future = future
+        self.interval_to_date = interval_to_date
+        self.tz = tz
+        self.region = region or holidays.current_region()
+        self.clock = clock
+        self.cache_size = cache_size
+        self.expression = get_grammar(locale).delta_time
+        self.expression.streamline()
+        holidays.get_index(self.region)
+        # Results only depend on the text and the reference second, so they can be shared
+        self._parse_cached = functools.lru_cache(maxsize=cache_size)(self._parse)
+
+    def now(self):
+        return to_utc(self.clock()).replace(microsecond=0)
+
+    def parse(self, text, reference_time=None, max_matches=None, max_time=None, max_length=None):
+        # pylint: disable=too-many-arguments
+        now = self.now() if reference_time is None else to_utc(reference_time).replace(
+            microsecond=0)
+        registry = metrics.registry
+        start = time.perf_counter()
+        if self.cache_size and max_matches is None and max_time is None and max_length is None:
+            _local.missed = False
+            matches = copy.deepcopy(self._parse_cached(text, now))
+            if registry is not None:
+                registry.count_cache('parser', hit=not _local.missed)
+        else:
+            matches = self._parse(text, now, max_matches, get_deadline(max_time), max_length)
+        if registry is not None:
+            registry.observe_parse(text, matches, time.perf_counter() - start)
+        return matches
+
+    def parse_many(self, texts, reference_time=None):
+        # All texts share one reading of the clock
+        now = self.now() if reference_time is None else reference_time
+        return [self.parse(text, reference_time=now) for text in texts]
+
+    def _parse(self, text, now, max_matches=None, deadline=None, max_length=None):
+        # pylint: disable=too-many-arguments
+        _local.missed = True
+        with parse_context(self.tz, self.region, now):
+            matches = find_all(self.expression,
+                               text,
+                               max_matches=max_matches,
+                               deadline=deadline,
+                               max_length=max_length)
+            resolve_all(matches,
+                        future=self.future,
+                        interval_to_date=self.interval_to_date,
+                        tz=self.tz)
+        return matches
@@ -0,0 +1,175 @@
+import argparse
+import collections
+import contextlib
+import functools
+import json
+import sys
+import time
+
+from kronosparser import corpus, utils
+from kronosparser.locales import get_grammar
+from kronosparser.parser import parse_context
+
+
+def _closure(function, name):
+    code = getattr(function, '__code__', None)
+    if code is None or name not in code.co_freevars:
+        return None
+    return function.__closure__[code.co_freevars.index(name)].cell_contents
+
+
+def _unwrap(function):
+    # Through partials, pyparsing's arity wrapper and the slow-parse log's timing wrapper
+    while True:
+        if hasattr(function, '__wrapped__'):
+            function = function.__wrapped__
+        elif isinstance(function, functools.partial):
+            function = function.func
+        elif getattr(function, '__name__', None) == 'wrapper' and _closure(function, 'func'):
+            function = _closure(function, 'func')
+        else:
+            return function
+
+
+def action_name(action):
+    function = _unwrap(action)
+    name = (getattr(function, '__qualname__', None)
+            or type(function).__name__).replace('.<locals>', '')
+    if name.endswith('.decorated_func') and _closure(function, 'func') is not None:
+        # tz_decorate(convert_to_date), past_future_wrap(...)
+        return '{}({})'.format(name.split('.')[0], action_name(_closure(function, 'func')))
+    return name
+
+
+class Profiler:
+    # Attributes the time of a parse to the grammar productions of time_parser.py, named as there,
+    # and to parse actions. Each collapsed stack keeps its self time, children excluded.
+    def __init__(self, locale='en'):
+        self.grammar = get_grammar(locale)
+        self.stacks = collections.Counter()  # type: collections.Counter
+        self._stack = []
+        self._children = []
+
+    def _frame(self, name, function, *args):
+        self._stack.append(name)
+        self._children.append(0.0)
+        start = time.perf_counter()
+        try:
+            return function(*args)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.stacks[';'.join(self._stack)] += elapsed - self._children.pop()
+            self._stack.pop()
+            if self._children:
+                self._children[-1] += elapsed
+
+    def _wrap_parse(self, element, name):
+        parse = element._parse  # pylint: disable=protected-access
+
+        def profiled(instring, loc, doActions=True, callPreParse=True):  # pylint: disable=invalid-name
+            return self._frame(name, parse, instring, loc, doActions, callPreParse)
+
+        element._parse = profiled  # pylint: disable=protected-access
+
+    def _wrap_action(self, action):
+        name = action_name(action)
+        return lambda string, loc, tokens: self._frame(name, action, string, loc, tokens)
+
+    @contextlib.contextmanager
+    def installed(self):
+        names = {}  # type: dict
+        for name, element in vars(self.grammar).items():
+            if name != 'locale':
+                names.setdefault(id(element), name)
+        actions = {}
+        for element in utils.walk(self.grammar.delta_time):
+            if id(element) in names:
+                self._wrap_parse(element, names[id(element)])
+            if element.parseAction:
+                actions[element] = element.parseAction
+                element.parseAction = [self._wrap_action(action) for action in actions[element]]
+        fixes = utils.set_dates_with_timezone_fixes
+        utils.set_dates_with_timezone_fixes = lambda match, tz: self._frame(
+            'set_dates_with_timezone_fixes', fixes, match, tz)
+        try:
+            yield self
+        finally:
+            utils.set_dates_with_timezone_fixes = fixes
+            for element in utils.walk(self.grammar.delta_time):
+                element.__dict__.pop('_parse', None)
+            for element, original in actions.items():
+                element.parseAction = original
+
+    def parse(self, text, future=False, interval_to_date=True, tz='US/Pacific', region=None):
+        # pylint: disable=too-many-arguments
+        with parse_context(tz, region):
+            matches = self._frame('scan', utils.find_all, self.grammar.delta_time, text)
+        for match in matches:
+            self._frame('resolve_match', utils.resolve_match, match, future, interval_to_date, tz)
+        return matches
+
+    def run(self, texts, **kwargs):
+        with self.installed():
+            for text in texts:
+                self.parse(text, **kwargs)
+        return self
+
+    def collapsed(self):
+        # One "frame;frame;frame microseconds" line per stack, as flamegraph.pl and speedscope read
+        return [
+            '{} {}'.format(stack, int(round(seconds * 1e6)))
+            for stack, seconds in sorted(self.stacks.items()) if seconds >= 5e-7
+        ]
+
+    def top(self, count=20):
+        frames = collections.Counter()  # type: collections.Counter
+        for stack, seconds in self.stacks.items():
+            frames[stack.rsplit(';', 1)[-1]] += seconds
+        return frames.most_common(count)
+
+
+def read_texts(stream):
+    # Plain text lines or JSON lines with a "text" field, e.g. the output of kronosparser.corpus
+    for line in stream:
+        line = line.rstrip('\n')
+        if line.startswith('{'):
+            yield json.loads(line)['text']
+        elif line:
+            yield line
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Profile the date grammar on a corpus and write collapsed stacks')
+    parser.add_argument('corpus', nargs='?', help='text or JSON lines file, generated if missing')
+    parser.add_argument('--count', type=int, default=1000, help='generated sentences')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--locale', default='en')
+    parser.add_argument('--tz', default='US/Pacific')
+    parser.add_argument('--future', action='store_true')
+    parser.add_argument('--output', help='collapsed stacks file, standard output by default')
+    parser.add_argument('--top', type=int, default=20, help='frames summarized on standard error')
+    args = parser.parse_args(argv)
+
+    if args.corpus:
+        with open(args.corpus, encoding='utf-8') as stream:
+            texts = list(read_texts(stream))
+    else:
+        texts = [sample['text'] for sample in corpus.generate(args.count, seed=args.seed)]
+    profiler = Profiler(args.locale).run(texts, future=args.future, tz=args.tz)
+
+    output = open(args.output, 'w') if args.output else sys.stdout
+    try:
+        for line in profiler.collapsed():
+            output.write(line + '\n')
+    finally:
+        if args.output:
+            output.close()
+    total = sum(profiler.stacks.values()) or 1
+    for name, seconds in profiler.top(args.top):
+        sys.stderr.write('{:6.1f}% {:10.1f} ms  {}\n'.format(seconds / total * 100, seconds * 1000,
+                                                             name))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+import datetime
+import itertools
+
+from dateutil.relativedelta import relativedelta
+
+UNITS = ('day', 'week', 'month', 'year')
+_UNIT_DAYS = {'day': 1, 'week': 7}
+_UNIT_MONTHS = {'month': 1, 'year': 12}
+
+
+class Recurrence:
+    # Occurrences are computed from their index, nothing is materialized until it is iterated
+    def __init__(self, start, unit='day', interval=1, time=None):
+        if unit not in UNITS:
+            raise ValueError('Unknown recurrence unit {!r}'.format(unit))
+        if interval < 1:
+            raise ValueError('Recurrence interval must be positive')
+        self.start = start
+        self.unit = unit
+        self.interval = interval
+        self.time = time
+
+    def __repr__(self):
+        return 'Recurrence({!r})'.format(self.to_dict())
+
+    def __eq__(self, other):
+        return isinstance(other, Recurrence) and self.to_dict() == other.to_dict()
+
+    def __iter__(self):
+        # Stops after the last occurrence before year 10000
+        for index in itertools.count():
+            try:
+                occurrence = self.occurrence(index)
+            except (OverflowError, ValueError):
+                return
+            yield occurrence
+
+    def occurrence(self, index):
+        steps = index * self.interval
+        if self.unit in _UNIT_DAYS:
+            day = self.start + datetime.timedelta(days=steps * _UNIT_DAYS[self.unit])
+        else:
+            day = self.start + relativedelta(months=steps * _UNIT_MONTHS[self.unit])
+        if self.time is None:
+            return day
+        return datetime.datetime.combine(day, self.time)
+
+    def between(self, start, end):
+        start, end = self._bounds(start, end)
+        index = self._first_index(start)
+        try:
+            occurrence = self.occurrence(index)
+            if self.unit in _UNIT_DAYS:
+                # Fixed length steps, each occurrence is a single addition away from the previous
+                step = datetime.timedelta(days=self.interval * _UNIT_DAYS[self.unit])
+                while occurrence <= end:
+                    yield occurrence
+                    occurrence += step
+            else:
+                while occurrence <= end:
+                    yield occurrence
+                    index += 1
+                    occurrence = self.occurrence(index)
+        except (OverflowError, ValueError):
+            # Past year 9999
+            return
+
+    def _bounds(self, start, end):
+        if self.time is None:
+            if isinstance(start, datetime.datetime):
+                start = start.date()
+            if isinstance(end, datetime.datetime):
+                end = end.date()
+            return start, end
+        if not isinstance(start, datetime.datetime):
+            start = datetime.datetime.combine(start, datetime.time.min)
+        if not isinstance(end, datetime.datetime):
+            end = datetime.datetime.combine(end, datetime.time.max)
+        return start, end
+
+    def _first_index(self, start):
+        day = start.date() if isinstance(start, datetime.datetime) else start
+        if self.unit in _UNIT_DAYS:
+            elapsed = (day - self.start).days // _UNIT_DAYS[self.unit]
+        else:
+            elapsed = ((day.year - self.start.year) * 12 + day.month -
+                       self.start.month) // _UNIT_MONTHS[self.unit]
+        index = max(elapsed // self.interval - 1, 0)
+        while self.occurrence(index) < start:
+            index += 1
+        return index
+
+    def to_dict(self):
+        result = {'start': self.start.isoformat(), 'unit': self.unit, 'interval': self.interval}
+        if self.unit == 'week':
+            result['weekday'] = self.start.weekday()
+        if self.time is not None:
+            result['time'] = self.time.isoformat()
+        return result
+
+    @classmethod
+    def from_dict(cls, data):
+        time = data.get('time')
+        return cls(datetime.date.fromisoformat(data['start']),
+                   unit=data['unit'],
+                   interval=data['interval'],
+                   time=datetime.time.fromisoformat(time) if time else None)
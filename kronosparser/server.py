@@ -0,0 +1,249 @@
+import argparse
+import asyncio
+import collections
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from kronosparser import parse_dates
+from kronosparser.locales import freeze_grammars
+
+MAX_LINE_LENGTH = 2**20
+DEFAULT_BATCH_SIZE = 64
+DEFAULT_BATCH_DELAY = 0.001
+
+WARM_UP_TEXTS = [
+    'now', 'tomorrow at noon', 'next friday at 3pm', 'in 2 hours', 'three days ago',
+    'between monday and wednesday', 'march 12th, 2020', '2020-03-12', 'the 3rd of june',
+    'end of next month', 'first half of Q3', 'next week', 'last year', 'tonight', 'asap'
+]
+
+
+def warm_up():
+    for text in WARM_UP_TEXTS:
+        parse_dates(text)
+    freeze_grammars()
+
+
+def handle_request(request):
+    if not isinstance(request, dict) or not isinstance(request.get('text'), str):
+        return {
+            'id': request.get('id') if isinstance(request, dict) else None,
+            'error': 'request must be an object with a "text" string'
+        }
+    try:
+        matches = parse_dates(request['text'],
+                              future=request.get('future', False),
+                              interval_to_date=request.get('interval_to_date', True),
+                              tz=request.get('tz', 'US/Pacific'))
+    except Exception as err:  # pylint: disable=broad-except
+        return {'id': request.get('id'), 'error': '{}: {}'.format(type(err).__name__, err)}
+    return {'id': request.get('id'), 'matches': matches}
+
+
+def handle_batch(requests):
+    return [handle_request(request) for request in requests]
+
+
+def closing_response(request):
+    return {'id': request.get('id'), 'error': 'server closing'}
+
+
+def decode_request(line):
+    # The request and None, or None and the error response to send back instead
+    try:
+        request = json.loads(line)
+    except ValueError as err:
+        return None, {'id': None, 'error': 'invalid JSON: {}'.format(err)}
+    if not isinstance(request, dict):
+        return None, {'id': None, 'error': 'request must be an object with a "text" string'}
+    return request, None
+
+
+class ParseServer:
+    def __init__(self, batch_size=DEFAULT_BATCH_SIZE, batch_delay=DEFAULT_BATCH_DELAY):
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self._queue = None
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._server = None
+        self._batcher = None
+        # Requests taken off the queue by the batcher, the last of which may still be parsed
+        self._batch = []  # type: list
+
+    async def start_unix(self, path):
+        if os.path.exists(path):
+            os.unlink(path)
+        await self._start()
+        self._server = await asyncio.start_unix_server(self._handle_connection,
+                                                       path=path,
+                                                       limit=MAX_LINE_LENGTH)
+        return self._server
+
+    async def start_tcp(self, port, host='127.0.0.1'):
+        await self._start()
+        self._server = await asyncio.start_server(self._handle_connection,
+                                                  host=host,
+                                                  port=port,
+                                                  limit=MAX_LINE_LENGTH)
+        return self._server
+
+    async def _start(self):
+        self._queue = asyncio.Queue()
+        await asyncio.get_event_loop().run_in_executor(self._executor, warm_up)
+        self._batcher = asyncio.ensure_future(self._run_batches())
+
+    async def close(self):
+        # Requests still queued or being parsed get an error response, so that no client keeps
+        # waiting for them
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._batcher is not None:
+            self._batcher.cancel()
+            try:
+                await self._batcher
+            except asyncio.CancelledError:
+                pass
+            outstanding = self._batch
+            while not self.queue.empty():
+                outstanding.append(self.queue.get_nowait())
+            for request, future in outstanding:
+                if not future.done():
+                    future.set_result(closing_response(request))
+        self._executor.shutdown(wait=False)
+
+    @property
+    def queue(self):
+        if self._queue is None:
+            raise RuntimeError('the parse server is not started')
+        return self._queue
+
+    async def _next_batch(self):
+        batch = self._batch = [await self.queue.get()]
+        loop = asyncio.get_event_loop()
+        deadline = loop.time() + self.batch_delay
+        while len(batch) < self.batch_size:
+            if self.queue.empty():
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            else:
+                batch.append(self.queue.get_nowait())
+        return batch
+
+    async def _run_batches(self):
+        loop = asyncio.get_event_loop()
+        while True:
+            batch = await self._next_batch()
+            try:
+                responses = await loop.run_in_executor(self._executor, handle_batch,
+                                                       [request for request, _ in batch])
+            except asyncio.CancelledError:
+                # An Exception too before Python 3.8
+                raise
+            except Exception as err:  # pylint: disable=broad-except
+                responses = [{'id': None, 'error': str(err)} for _ in batch]
+            for (_, future), response in zip(batch, responses):
+                if not future.done():
+                    future.set_result(response)
+
+    async def _handle_connection(self, reader, writer):
+        # Requests are answered in the order they were received, so clients may pipeline as many
+        # lines as they want without waiting for the previous response.
+        pending = collections.deque()  # type: collections.deque
+        ready = asyncio.Event()
+        writer_task = asyncio.ensure_future(self._write_responses(writer, pending, ready))
+        try:
+            while True:
+                future = asyncio.get_event_loop().create_future()
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    future.set_result({'id': None, 'error': 'request line too long'})
+                    pending.append(future)
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                request, error = decode_request(line)
+                if request is None:
+                    future.set_result(error)
+                elif self._batcher is None or self._batcher.done():
+                    future.set_result(closing_response(request))
+                else:
+                    self.queue.put_nowait((request, future))
+                pending.append(future)
+                ready.set()
+        finally:
+            pending.append(None)
+            ready.set()
+            await writer_task
+            writer.close()
+
+    @staticmethod
+    async def _write_responses(writer, pending, ready):
+        while True:
+            if not pending:
+                ready.clear()
+                await ready.wait()
+                continue
+            future = pending.popleft()
+            if future is None:
+                break
+            response = await future
+            writer.write(json.dumps(response).encode('utf-8') + b'\n')
+            if not pending:
+                try:
+                    await writer.drain()
+                except ConnectionError:
+                    break
+
+
+def serve(path=None,
+          port=None,
+          host='127.0.0.1',
+          batch_size=DEFAULT_BATCH_SIZE,
+          batch_delay=DEFAULT_BATCH_DELAY):
+    server = ParseServer(batch_size=batch_size, batch_delay=batch_delay)
+    loop = asyncio.get_event_loop()
+    if path is not None:
+        loop.run_until_complete(server.start_unix(path))
+    else:
+        loop.run_until_complete(server.start_tcp(port, host=host))
+    try:
+        loop.run_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        loop.run_until_complete(server.close())
+        if path is not None and os.path.exists(path):
+            os.unlink(path)
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description='Serve kronosparser over a local socket.')
+    address = arg_parser.add_mutually_exclusive_group(required=True)
+    address.add_argument('--unix', help='path of the Unix domain socket to listen on')
+    address.add_argument('--port', type=int, help='localhost TCP port to listen on')
+    arg_parser.add_argument('--host', default='127.0.0.1')
+    arg_parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+    arg_parser.add_argument('--batch-delay',
+                            type=float,
+                            default=DEFAULT_BATCH_DELAY,
+                            help='seconds to wait for more requests before parsing a batch')
+    args = arg_parser.parse_args(argv)
+    serve(path=args.unix,
+          port=args.port,
+          host=args.host,
+          batch_size=args.batch_size,
+          batch_delay=args.batch_delay)
+
+
+if __name__ == '__main__':
+    main()
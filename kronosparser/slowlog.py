@@ -0,0 +1,168 @@
+import collections
+import json
+import random
+import re
+import threading
+import time
+import weakref
+
+from kronosparser import utils
+
+DEFAULT_THRESHOLD = 0.1
+DEFAULT_CAPACITY = 256
+
+# The recorder used by parse_dates, None while the slow-parse log is disabled
+recorder = None
+
+_local = threading.local()
+# Grammars whose parse actions are timed, and the function that puts their own actions back
+_installed = weakref.WeakKeyDictionary()  # type: weakref.WeakKeyDictionary
+_instrument_lock = threading.Lock()
+
+
+def shape(text):
+    # Redaction that keeps the structure pathological inputs depend on: letters become 'a' or 'A',
+    # digits '9', whitespace and punctuation are kept
+    text = re.sub(r'[^\W\d_]', lambda letter: 'A' if letter.group().isupper() else 'a', text)
+    return re.sub(r'\d', '9', text)
+
+
+class _Timed:
+    def __init__(self, action):
+        self.__wrapped__ = action
+
+    def __call__(self, string, location, tokens):
+        if getattr(_local, 'actions', None) is None:
+            return self.__wrapped__(string, location, tokens)
+        began = time.perf_counter()
+        try:
+            return self.__wrapped__(string, location, tokens)
+        finally:
+            _local.actions += time.perf_counter() - began
+
+
+def instrument(expression):
+    # Parse actions only measure themselves while a recorded parse runs on the same thread. Returns
+    # the function that uninstalls them, which disable() calls for every instrumented grammar.
+    uninstall = _installed.get(expression)
+    if uninstall is not None:
+        return uninstall
+    with _instrument_lock:
+        uninstall = _installed.get(expression)
+        if uninstall is not None:
+            return uninstall
+        originals = []
+        for element in utils.walk(expression):
+            if element.parseAction:
+                originals.append((element, element.parseAction))
+                element.parseAction = [
+                    action if isinstance(action, _Timed) else _Timed(action)
+                    for action in element.parseAction
+                ]
+
+        def restore():
+            with _instrument_lock:
+                if _installed.pop(expression, None) is None:
+                    return
+                for element, actions in originals:
+                    element.parseAction = actions
+
+        _installed[expression] = restore
+        return restore
+
+
+def uninstall_all():
+    for uninstall in list(_installed.values()):
+        uninstall()
+
+
+class _Timer:
+    def __init__(self, owner, text):
+        self.recorder = owner
+        self.text = text
+        self.actions = 0.0
+        _local.actions = 0.0
+        self.start = self.scan_end = time.perf_counter()
+
+    def scanned(self):
+        self.scan_end = time.perf_counter()
+        self.actions = _local.actions or 0.0
+        _local.actions = None
+
+    def finish(self, matches):
+        end = time.perf_counter()
+        self.recorder.add(self.text,
+                          matches,
+                          total=end - self.start,
+                          scan=self.scan_end - self.start - self.actions,
+                          actions=self.actions,
+                          tz=end - self.scan_end)
+
+
+class SlowParseRecorder:
+    # Keeps the last `capacity` parses slower than `threshold` seconds, of which only a
+    # `sample_rate` fraction is recorded. `redact` (e.g. `shape`) is applied to the stored text.
+    def __init__(self,
+                 threshold=DEFAULT_THRESHOLD,
+                 capacity=DEFAULT_CAPACITY,
+                 sample_rate=1.0,
+                 redact=None,
+                 seed=None):
+        # pylint: disable=too-many-arguments
+        if not 0 <= sample_rate <= 1:
+            raise ValueError('sample_rate must be between 0 and 1')
+        self.threshold = threshold
+        self.sample_rate = sample_rate
+        self.redact = redact
+        self.records = collections.deque(maxlen=capacity)  # type: collections.deque
+        self._random = random.Random(seed)
+
+    def start(self, text, expression):
+        instrument(expression)
+        return _Timer(self, text)
+
+    def add(self, text, matches, total, scan, actions, tz):  # pylint: disable=too-many-arguments
+        if total < self.threshold:
+            return
+        if self.sample_rate < 1 and self._random.random() >= self.sample_rate:
+            return
+        self.records.append({
+            'text': self.redact(text) if self.redact else text,
+            'length': len(text),
+            'matches': len(matches),
+            'truncated': getattr(matches, 'truncated', False),
+            'time': total,
+            'scan': scan,
+            'actions': actions,
+            'tz': tz,
+            'timestamp': time.time(),
+        })
+
+    def dump(self, stream=None):
+        # The recorded parses, oldest first, also written to `stream` as JSON lines if given
+        records = list(self.records)
+        if stream is not None:
+            for record in records:
+                stream.write(json.dumps(record, ensure_ascii=False) + '\n')
+        return records
+
+    def clear(self):
+        self.records.clear()
+
+
+def enable(**kwargs):
+    global recorder  # pylint: disable=global-statement
+    recorder = SlowParseRecorder(**kwargs)
+    return recorder
+
+
+def disable():
+    # Also gives the grammars their own parse actions back
+    global recorder  # pylint: disable=global-statement
+    recorder = None
+    uninstall_all()
+
+
+def start(text, expression):
+    current = recorder
+    return None if current is None else current.start(text, expression)
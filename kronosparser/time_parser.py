@@ -1,26 +1,37 @@
+# pylint: disable=too-many-lines
+import collections
 import datetime
 import re
 
 import pyparsing
 from pyparsing import Optional
 from dateutil.relativedelta import relativedelta
-from kronosparser import utils
+from kronosparser import business, clock, holidays, lexicon, utils
+from kronosparser.recurrence import Recurrence
 from kronosparser.time_interval import TimeInterval
-from kronosparser.word_number import units
+from kronosparser.word_number import WordNumber
 
 _BEGINNING = 1
 _MIDDLE = 2
 _END = 3
 
 _CENTURY_CHANGE = 30
+# Bumped whenever a delta_time production changes what it matches or what it resolves to, which
+# makes IR compiled against the previous grammar stale (see kronosparser.ir)
+GRAMMAR_VERSION = 1
 
 
 def utc_now():
-    return datetime.datetime.utcnow().replace(microsecond=0)
+    return clock.utc_now()
 
 
 def utc_today():
-    return datetime.datetime.utcnow().date()
+    return clock.utc_now(clock.DAY).date()
+
+
+def utc_hour():
+    with clock.reading(clock.HOUR):
+        return utc_now().hour
 
 
 def past_future_wrap(func):
@@ -68,8 +79,7 @@ def tz_decorate(key, rel_hour=0):
             if origin is None:
                 origin = utc_today()
             datetime_utc = func(tokens, origin=origin)
-            now = utc_now()
-            diff_hour = (now.hour - rel_hour) % 24
+            diff_hour = (utc_hour() - rel_hour) % 24
             if diff_hour >= 12:
                 datetime_alt = func(tokens, origin=origin + datetime.timedelta(days=1))
             else:
@@ -164,12 +174,13 @@ def set_datetime_single(tokens):
     elif isinstance(tokens['calculatedTime'], datetime.date):
         result['date'] = tokens['calculatedTime'].isoformat()
     elif isinstance(tokens['calculatedTime'], datetime.time):
-        if utc_now().hour >= 12:
+        hour = utc_hour()
+        if hour >= 12:
             result['days_delta'] = 1
-            result['tz_threshold'] = 24 - utc_now().hour
+            result['tz_threshold'] = 24 - hour
         else:
             result['days_delta'] = -1
-            result['tz_threshold'] = -utc_now().hour - 1
+            result['tz_threshold'] = -hour - 1
         result['datetime'] = datetime.datetime.combine(utc_today(),
                                                        tokens['calculatedTime']).isoformat(' ')
     elif isinstance(tokens['calculatedTime'], TimeInterval):
@@ -177,6 +188,8 @@ def set_datetime_single(tokens):
             'start': tokens['calculatedTime'].get_start().isoformat(),
             'end': tokens['calculatedTime'].get_end().isoformat()
         }
+    elif isinstance(tokens['calculatedTime'], Recurrence):
+        result['recurrence'] = tokens['calculatedTime'].to_dict()
     return result
 
 
@@ -227,17 +240,20 @@ def month_interval(month_num, year_num):
 
 
 def convert_to_timedelta(tokens):
-    unit = tokens.time_unit.lower().rstrip('s')
+    unit = tokens.time_unit
     dir_tok = tokens.dir_abs * tokens.get('qty', 1)
-    tokens['timeOffset'] = {
-        'year': relativedelta(years=dir_tok),
-        'month': relativedelta(months=dir_tok),
-        'week': datetime.timedelta(weeks=dir_tok),
-        'day': datetime.timedelta(days=dir_tok),
-        'hour': datetime.timedelta(hours=dir_tok),
-        'minute': datetime.timedelta(minutes=dir_tok),
-        'second': datetime.timedelta(seconds=dir_tok),
-    }[unit]
+    try:
+        tokens['timeOffset'] = {
+            'year': relativedelta(years=dir_tok),
+            'month': relativedelta(months=dir_tok),
+            'week': datetime.timedelta(weeks=dir_tok),
+            'day': datetime.timedelta(days=dir_tok),
+            'hour': datetime.timedelta(hours=dir_tok),
+            'minute': datetime.timedelta(minutes=dir_tok),
+            'second': datetime.timedelta(seconds=dir_tok),
+        }[unit]
+    except OverflowError:
+        tokens['datetime_parsing_error'] = True
 
 
 @past_future_wrap
@@ -245,8 +261,7 @@ def convert_to_timedelta(tokens):
 def convert_to_day(tokens, origin=None):
     if 'weekday_ref' in tokens:
         today_num = origin.weekday()
-        named_day_num = weekday_number_mapping(tokens.weekday_ref.day_name.lower())
-        diff = named_day_num - today_num
+        diff = tokens.weekday_ref.day_name - today_num
         if tokens.weekday_ref.dir_rel >= 0:
             day_diff = diff if diff > 0 else diff + 7
         else:
@@ -264,14 +279,107 @@ def convert_to_day(tokens, origin=None):
 @tz_decorate('date')
 def convert_to_date(tokens, origin=None):
     yy = int(tokens.year) if 'year' in tokens else origin.year
-    mm = month_mapping(tokens.month) if 'month' in tokens else origin.month
-    dd = day_number_mapping(tokens.day[0] if isinstance(tokens.day, list) else tokens.day)
-    parsed_date = datetime.date(yy, mm, dd)
-    if 'day_name' in tokens and parsed_date.weekday() != weekday_number_mapping(tokens['day_name']):
+    mm = tokens.month if 'month' in tokens else origin.month
+    dd = tokens.day[0] if isinstance(tokens.day, list) else tokens.day
+    try:
+        parsed_date = datetime.date(yy, mm, dd)
+    except ValueError:
+        return None
+    if 'day_name' in tokens and parsed_date.weekday() != tokens['day_name']:
         return None
     return parsed_date
 
 
+def time_of_day_value(tokens):
+    if 'time_of_day' not in tokens:
+        return None
+    if isinstance(tokens['time_of_day'], datetime.time):
+        return tokens['time_of_day']
+    if tokens['time_of_day'] in ['noon', 'midnight']:
+        return {
+            'noon': datetime.time(12),
+            'midnight': datetime.time(0),
+        }[tokens['time_of_day']]
+    if 'hour' in tokens:
+        return convert_to_time(tokens)
+    return utc_now().time()
+
+
+@tz_decorate('date')
+def convert_to_holiday(tokens, origin=None):
+    dir_rel = tokens.dir_rel if 'dir_rel' in tokens else 0
+    index = holidays.current_index()
+    if dir_rel > 0:
+        return index.next_occurrence(tokens.holiday, origin)
+    if dir_rel < 0:
+        return index.previous_occurrence(tokens.holiday, origin)
+    return index.get(tokens.holiday, origin.year)
+
+
+def week_of_action(tokens):
+    if 'date' not in tokens:
+        return
+    start = tokens.date - datetime.timedelta(days=tokens.date.weekday())
+    tokens['calculatedTime'] = TimeInterval(start, start + datetime.timedelta(days=6))
+
+
+@tz_decorate('recurrence_start')
+def recurrence_start_action(tokens, origin=None):
+    if 'day_name' in tokens:
+        return origin + datetime.timedelta(days=(tokens.day_name - origin.weekday()) % 7)
+    return origin
+
+
+def recurrence_action(tokens):
+    unit = 'week' if 'day_name' in tokens else tokens.time_unit
+    tokens['calculatedTime'] = Recurrence(tokens.recurrence_start,
+                                          unit=unit,
+                                          interval=tokens.get('qty', 1),
+                                          time=time_of_day_value(tokens))
+
+
+@tz_decorate('calculatedTime')
+def business_day_action(tokens, origin=None):
+    if 'qty' in tokens:
+        count = tokens.qty * tokens.dir_abs
+    else:
+        count = tokens.dir_rel
+    try:
+        return business.current_calendar().add_business_days(origin, count)
+    except ValueError:
+        return None
+
+
+def business_time_action(tokens):
+    parsed_time = time_of_day_value(tokens)
+    if parsed_time is not None and 'calculatedTime' in tokens:
+        tokens['calculatedTime'] = datetime.datetime.combine(tokens['calculatedTime'], parsed_time)
+
+
+def business_bound_action(tokens):
+    if 'calculatedTime' not in tokens:
+        return
+    calendar = business.current_calendar()
+    day = tokens['calculatedTime']
+    if tokens.bound == 'beginning':
+        tokens['calculatedTime'] = calendar.opening(day)
+    elif tokens.bound == 'end':
+        tokens['calculatedTime'] = calendar.closing(day)
+    else:
+        opening = calendar.opening(day)
+        tokens['calculatedTime'] = opening + (calendar.closing(day) - opening) // 2
+
+
+def working_hours_action(tokens):
+    delta = datetime.timedelta(hours=tokens.qty * tokens.dir_abs)
+    try:
+        calculated_time = business.add_working_time_utc(utc_now(), delta)
+    except ValueError:
+        return
+    tokens['utc'] = True
+    tokens['calculatedTime'] = calculated_time
+
+
 def convert_to_time(tokens):
     hh = int(tokens.get('hour', 0))
     mm = int(tokens.get('minute', 0))
@@ -281,7 +389,7 @@ def convert_to_time(tokens):
 
 def convert_to_interval(tokens):
     origin = utc_today()
-    unit = tokens.time_unit.lower().rstrip('s')
+    unit = tokens.time_unit
     dir_tok = tokens.dir_rel
     if unit == 'day':
         start = datetime.datetime.combine(origin, datetime.time(8))
@@ -296,14 +404,14 @@ def convert_to_interval(tokens):
         end = datetime.date(rel_date.year, rel_date.month, month_days(rel_date.month,
                                                                       rel_date.year))
         if 'day' in tokens:
-            _day = day_number_mapping(tokens.day)
+            _day = tokens.day
             if _day <= month_days(rel_date.month, rel_date.year):
                 tokens['calculatedTime'] = datetime.date(rel_date.year, rel_date.month, _day)
             return
     elif unit == 'year':
         _year = origin.year + dir_tok
         if 'month' in tokens:
-            _month = month_mapping(tokens.month)
+            _month = tokens.month
             start = datetime.date(_year, _month, 1)
             end = datetime.date(_year, _month, month_days(_month, _year))
         else:
@@ -317,20 +425,7 @@ def convert_to_interval(tokens):
 @past_future_unwrap
 def convert_to_abs_time(tokens):
     day = tokens.get('named_day', tokens.get('date', None))
-    if 'time_of_day' in tokens:
-        if isinstance(tokens['time_of_day'], datetime.time):
-            parsed_time = tokens['time_of_day']
-        elif tokens['time_of_day'] in ['noon', 'midnight']:
-            parsed_time = {
-                'noon': datetime.time(12),
-                'midnight': datetime.time(0),
-            }[tokens['time_of_day']]
-        elif 'hour' in tokens:
-            parsed_time = convert_to_time(tokens)
-        else:
-            parsed_time = utc_now().time()
-    else:
-        parsed_time = None
+    parsed_time = time_of_day_value(tokens)
     if parsed_time is not None and day is not None:
         tokens['abs_time'] = datetime.datetime.combine(day, parsed_time)
     elif parsed_time is not None:
@@ -343,161 +438,42 @@ def convert_to_abs_time(tokens):
 def calculate_time(tokens):
     if 'abs_time' in tokens:
         abs_time = tokens['abs_time']
-    elif tokens.time_unit in [hour_, minute_, _second_]:
+    elif tokens.time_unit in ['hour', 'minute', 'second']:
         abs_time = utc_now()
     else:
         abs_time = utc_today()
     if 'timeOffset' in tokens:
-        abs_time += tokens['timeOffset']
+        try:
+            abs_time += tokens['timeOffset']
+        except (OverflowError, ValueError):
+            # Moved out of the years datetime supports
+            tokens['datetime_parsing_error'] = True
+            return
     tokens['calculatedTime'] = abs_time
 
 
+_day_number = lexicon.lookup(lexicon.ORDINAL_DAYS)
+_weekday_number = lexicon.lookup(lexicon.WEEKDAYS)
+_month_number = lexicon.lookup(lexicon.MONTHS)
+_quarter_number = lexicon.lookup(lexicon.QUARTERS)
+
+
 def day_number_mapping(day_str):
-    d = {
-        '1st': 1,
-        '2nd': 2,
-        '3rd': 3,
-        '4th': 4,
-        '5th': 5,
-        '6th': 6,
-        '7th': 7,
-        '8th': 8,
-        '9th': 9,
-        '10th': 10,
-        '11th': 11,
-        '12th': 12,
-        '13th': 13,
-        '14th': 14,
-        '15th': 15,
-        '16th': 16,
-        '17th': 17,
-        '18th': 18,
-        '19th': 19,
-        '20th': 20,
-        '21st': 21,
-        '22nd': 22,
-        '23rd': 23,
-        '24th': 24,
-        '25th': 25,
-        '26th': 26,
-        '27th': 27,
-        '28th': 28,
-        '29th': 29,
-        '30th': 30,
-        '31st': 31
-    }
-    day_str = day_str.lower()
-    if day_str in d:
-        return d[day_str]
+    if day_str in lexicon.ORDINAL_DAYS or day_str.lower() in lexicon.ORDINAL_DAYS:
+        return _day_number(day_str)
     return int(day_str)
 
 
 def weekday_number_mapping(weekday_str):
-    d = {
-        'monday': 0,
-        'mon': 0,
-        'mon.': 0,
-        'tuesday': 1,
-        'tue': 1,
-        'tue.': 1,
-        'tues': 1,
-        'tues.': 1,
-        'wednesday': 2,
-        'wed': 2,
-        'wed.': 2,
-        'thursday': 3,
-        'thu': 3,
-        'thu.': 3,
-        'thurs': 3,
-        'thurs.': 3,
-        'friday': 4,
-        'fri': 4,
-        'fri.': 4,
-        'saturday': 5,
-        'sat': 5,
-        'sat.': 5,
-        'sunday': 6,
-        'sun': 6,
-        'sun.': 6
-    }
-    return d[weekday_str.lower()]
+    return _weekday_number(weekday_str)
 
 
 def month_mapping(month_str):
-    m = {
-        '1': 1,
-        '01': 1,
-        'jan': 1,
-        'jan.': 1,
-        'january': 1,
-        '2': 2,
-        '02': 2,
-        'feb': 2,
-        'feb.': 2,
-        'february': 2,
-        '3': 3,
-        '03': 3,
-        'mar': 3,
-        'mar.': 3,
-        'march': 3,
-        '4': 4,
-        '04': 4,
-        'apr': 4,
-        'apr.': 4,
-        'april': 4,
-        '5': 5,
-        '05': 5,
-        'may': 5,
-        '6': 6,
-        '06': 6,
-        'jun': 6,
-        'jun.': 6,
-        'june': 6,
-        '7': 7,
-        '07': 7,
-        'jul': 7,
-        'jul.': 7,
-        'july': 7,
-        '8': 8,
-        '08': 8,
-        'aug': 8,
-        'aug.': 8,
-        'august': 8,
-        '9': 9,
-        '09': 9,
-        'sep': 9,
-        'sep.': 9,
-        'sept': 9,
-        'sept.': 9,
-        'september': 9,
-        '10': 10,
-        'oct': 10,
-        'oct.': 10,
-        'october': 10,
-        '11': 11,
-        'nov': 11,
-        'nov.': 11,
-        'november': 11,
-        '12': 12,
-        'dec': 12,
-        'dec.': 12,
-        'december': 12
-    }
-    return m[month_str.lower()]
+    return _month_number(month_str)
 
 
 def quarter_mapping(quarter_parsed_expr):
-    q = {
-        'q1': 1,
-        'q2': 2,
-        'q3': 3,
-        'q4': 4,
-        'first': 1,
-        'second': 2,
-        'third': 3,
-        'fourth': 4,
-    }
-    return q[str(quarter_parsed_expr).lower()]
+    return _quarter_number(str(quarter_parsed_expr))
 
 
 def beginning_end_of_action(tokens):
@@ -548,8 +524,7 @@ def half_of_action(tokens):
 @tz_decorate('calculatedTime', rel_hour=8)
 def asap_action(_, origin=None):
     calc = datetime.datetime(origin.year, origin.month, origin.day) + datetime.timedelta(hours=8)
-    return calc + (datetime.timedelta(days=1) if utc_now().hour >= 8 else datetime.timedelta(
-        days=0))
+    return calc + (datetime.timedelta(days=1) if utc_hour() >= 8 else datetime.timedelta(days=0))
 
 
 def interval_year_action(tokens):  # TODO: set an interval timezone decoration
@@ -570,8 +545,7 @@ def interval_quarter_action(tokens, origin=None):  # TODO: set an interval timez
         rel_date = origin + relativedelta(months=3 * tokens.dir_rel)
         calc_time = quarter_interval(quarter_by_date(origin=rel_date), rel_date.year)
     elif 'quarter' in tokens:
-        calc_time = quarter_interval(quarter_mapping(tokens.quarter),
-                                     int(tokens.get('year', origin.year)))
+        calc_time = quarter_interval(tokens.quarter, int(tokens.get('year', origin.year)))
     else:
         return
     tokens['calculatedTime'] = calc_time
@@ -585,8 +559,7 @@ def interval_month_action(tokens):
         rel_date = origin + relativedelta(months=tokens.dir_rel)
         calc_time = month_interval(rel_date.month, rel_date.year)
     elif 'month' in tokens:
-        calc_time = month_interval(month_mapping(tokens.month), int(tokens.get('year',
-                                                                               origin.year)))
+        calc_time = month_interval(tokens.month, int(tokens.get('year', origin.year)))
     else:
         return
     tokens['calculatedTime'] = calc_time
@@ -595,7 +568,7 @@ def interval_month_action(tokens):
 def now_action(tokens):
     now = utc_now()
     if 'time_unit' in tokens:
-        unit = tokens.time_unit.lower().rstrip('s')
+        unit = tokens.time_unit
         delta = {
             'hour': datetime.timedelta(hours=tokens.qty * tokens.dir_abs),
             'minute': datetime.timedelta(minutes=tokens.qty * tokens.dir_abs),
@@ -603,8 +576,12 @@ def now_action(tokens):
         }[unit]
     else:
         delta = datetime.timedelta()
+    try:
+        calculated_time = now + delta
+    except OverflowError:
+        return
     tokens['utc'] = True
-    tokens['calculatedTime'] = now + delta
+    tokens['calculatedTime'] = calculated_time
 
 
 @tz_decorate('calculatedTime')
@@ -613,34 +590,28 @@ def named_day_action(tokens, origin=None):
     if 'date' in tokens:
         day = tokens.date
     if 'time_unit' in tokens:
-        unit = tokens.time_unit.lower().rstrip('s')
-        delta = {
-            'year': relativedelta(years=tokens.qty * tokens.dir_abs),
-            'month': relativedelta(months=tokens.qty * tokens.dir_abs),
-            'week': datetime.timedelta(weeks=tokens.qty * tokens.dir_abs),
-            'day': datetime.timedelta(days=tokens.qty * tokens.dir_abs),
-        }[unit]
+        unit = tokens.time_unit
+        try:
+            delta = {
+                'year': relativedelta(years=tokens.qty * tokens.dir_abs),
+                'month': relativedelta(months=tokens.qty * tokens.dir_abs),
+                'week': datetime.timedelta(weeks=tokens.qty * tokens.dir_abs),
+                'day': datetime.timedelta(days=tokens.qty * tokens.dir_abs),
+            }[unit]
+        except OverflowError:
+            return None
     else:
         delta = datetime.timedelta()
-    if 'time_of_day' in tokens:
-        if isinstance(tokens.time_of_day, datetime.time):
-            parsed_time = tokens.time_of_day
-        elif tokens.time_of_day in ['noon', 'midnight']:
-            parsed_time = {
-                'noon': datetime.time(12),
-                'midnight': datetime.time(0),
-            }[tokens.time_of_day]
-        elif 'hour' in tokens:
-            parsed_time = convert_to_time(tokens)
-        else:
-            parsed_time = utc_now().time()
-    else:
-        parsed_time = None
-    if parsed_time is not None:
-        if day is not None:
-            return datetime.datetime.combine(day + delta, parsed_time)
-        return parsed_time + delta
-    return day + delta
+    parsed_time = time_of_day_value(tokens)
+    try:
+        if parsed_time is not None:
+            if day is not None:
+                return datetime.datetime.combine(day + delta, parsed_time)
+            return parsed_time + delta
+        return day + delta
+    except (OverflowError, ValueError):
+        # Moved out of the years datetime supports
+        return None
 
 
 @tz_decorate('calculatedTime')
@@ -662,339 +633,406 @@ def o_clock_time_to_full(tokens):
     return tokens
 
 
-# Grammar used to parse different times is defined below
-
-the_ = utils.caseless_keyword('the')
-to_ = utils.caseless_keyword('to')
-to_dash_ = utils.caseless_keyword_or(['to', '-'])
-at_ = utils.caseless_keyword_or(['at', '@'])
-and_ = utils.caseless_keyword('and')
-by_ = utils.caseless_keyword('by')
-around_ = utils.caseless_keyword('around')
-of_ = utils.caseless_keyword('of')
-on_ = utils.caseless_keyword('on')
-of_dash_ = utils.caseless_keyword_or(['of', '-'])
-time_ = utils.caseless_keyword('time')
-o_clock = utils.caseless_keyword_or(['o\'clock', 'oclock', 'o clock'])
-between_ = utils.caseless_keyword('between')
-
-in_ = utils.caseless_keyword('in').setParseAction(
-    pyparsing.replaceWith(1)).setResultsName('dir_abs')
-from_ = utils.caseless_keyword('from').setParseAction(
-    pyparsing.replaceWith(1)).setResultsName('dir_abs')
-before_ = utils.caseless_keyword('before').setParseAction(
-    pyparsing.replaceWith(-1)).setResultsName('dir_abs')
-after_ = utils.caseless_keyword('after').setParseAction(
-    pyparsing.replaceWith(1)).setResultsName('dir_abs')
-ago_ = utils.caseless_keyword('ago').setParseAction(
-    pyparsing.replaceWith(-1)).setResultsName('dir_abs')
-
-next_ = utils.caseless_keyword('next').setParseAction(
-    pyparsing.replaceWith(1)).setResultsName('dir_rel')
-last_ = utils.caseless_keyword('last').setParseAction(
-    pyparsing.replaceWith(-1)).setResultsName('dir_rel')
-this_ = utils.caseless_keyword('this').setParseAction(
-    pyparsing.replaceWith(0)).setResultsName('dir_rel')
-
-noon_ = utils.caseless_keyword('noon')
-midnight_ = utils.caseless_keyword('midnight')
-now_ = utils.caseless_keyword('now')
-
-dawn = utils.caseless_keyword('dawn').setParseAction(lambda tokens: datetime.time(5))
-sunrise = utils.caseless_keyword('sunrise').setParseAction(lambda tokens: datetime.time(6))
-morning = utils.caseless_keyword('morning').setParseAction(lambda tokens: datetime.time(9))
-AM = pyparsing.Regex(r'a(\. ?)?m\.?', re.IGNORECASE).setParseAction(lambda tokens: datetime.time(9))
-afternoon = utils.caseless_keyword('afternoon').setParseAction(lambda tokens: datetime.time(14))
-PM = pyparsing.Regex(r'p(\. ?)?m\.?',
-                     re.IGNORECASE).setParseAction(lambda tokens: datetime.time(14))
-dusk = utils.caseless_keyword('dusk').setParseAction(lambda tokens: datetime.time(17))
-sunset = utils.caseless_keyword('sunset').setParseAction(lambda tokens: datetime.time(18))
-eod = utils.caseless_keyword('eod').setParseAction(lambda tokens: datetime.time(18))
-evening = utils.caseless_keyword('evening').setParseAction(lambda tokens: datetime.time(19))
-night = utils.caseless_keyword('night').setParseAction(lambda tokens: datetime.time(21))
-tonight = (pyparsing.Empty().setParseAction(pyparsing.replaceWith(0)) +
-           utils.caseless_keyword('tonight').setParseAction(lambda tokens: datetime.time(21)))
-
-year_ = utils.pluralize('year', pyparsing_regex=True)
-quarter_ = utils.pluralize('quarter', pyparsing_regex=True)
-month_ = utils.pluralize('month', pyparsing_regex=True)
-week_ = utils.pluralize('week', pyparsing_regex=True)
-day_ = utils.pluralize('day', pyparsing_regex=True)
-hour_ = utils.pluralize('hour', pyparsing_regex=True)
-minute_ = utils.pluralize('minute', pyparsing_regex=True)
-_second_ = utils.pluralize('second', pyparsing_regex=True)
-
-# TODO: Use some NLP tool to disambiguate some months (e.g. `may` verb or noun)
-#  if this causes any issues
-months = pyparsing.Regex(
-    r'\b('
-    r'jan(uary|\.)?'
-    r'|feb(ruary|\.)?'
-    r'|mar(ch|\.)?'
-    r'|apr(il|\.)?'
-    r'|may'
-    r'|jun(e|\.)?'
-    r'|jul(y|\.)?'
-    r'|aug(ust|\.)?'
-    r'|sep(t(ember|\.)?|\.)?'
-    r'|oct(ober|\.)?'
-    r'|nov(ember|\.)?'
-    r'|dec(ember|\.)?'
-    r')\b', re.IGNORECASE)
-
-# TODO: Use some NLP tool to disambiguate some months (e.g. `may` verb or noun)
-#  if this causes any issues
-months_no_spaces = pyparsing.Regex(
-    r'('
-    r'jan(uary|\.)?'
-    r'|feb(ruary|\.)?'
-    r'|mar(ch|\.)?'
-    r'|apr(il|\.)?'
-    r'|may'
-    r'|jun(e|\.)?'
-    r'|jul(y|\.)?'
-    r'|aug(ust|\.)?'
-    r'|sep(t(ember|\.)?|\.)?'
-    r'|oct(ober|\.)?'
-    r'|nov(ember|\.)?'
-    r'|dec(ember|\.)?'
-    r')\b', re.IGNORECASE)
-
-day_name = pyparsing.Regex(
-    r'\b('
-    r'mon(day|\.)?'
-    r'|tue(s(day|\.)?|\.)?'
-    r'|wed(nesday|\.)?'
-    r'|thu(rs(day|\.)?|\.)?'
-    r'|fri(day|\.)?'
-    r'|sat(urday|\.)?'
-    r'|sun(day|\.)?'
-    r')\b', re.IGNORECASE)
-day_name = day_name.setResultsName('day_name')
-
-ordinal_day = pyparsing.Regex(r'\b('
-                              r'[23]0th'
-                              r'|[23]?(1st|2nd|3rd|[4-9]th)'
-                              r'|1\dth'
-                              r')\b', re.IGNORECASE)
-
-date_separators = ['/', '-', '.']
-
-couple = (Optional(utils.caseless_keyword('a')) + utils.caseless_keyword('couple') + Optional(of_))
-couple.setParseAction(pyparsing.replaceWith(2))
-
-a_qty = pyparsing.Regex(r'\ban?\b', re.IGNORECASE).setParseAction(pyparsing.replaceWith(1))
-
-integer = pyparsing.Word(pyparsing.nums).setParseAction(lambda token: int(token[0]))
-integer_month = pyparsing.Regex(r'\b(1[012]|0?[1-9])\b')
-integer_day = pyparsing.Regex(r'\b(3[01]|[1-2]\d|0?[1-9])\b')
-integer_month_two_digits_no_trailing_space = pyparsing.Regex(r'\b(1[012]|0[1-9])')
-integer_day_no_trailing_space = pyparsing.Regex(r'\b(3[01]|[1-2]\d|0?[1-9])')
-integer_day_two_digits_no_leading_space = pyparsing.Regex(r'(3[01]|[1-2]\d|0[1-9])\b')
-
-qty = integer | couple | a_qty | units
-qty = qty.setResultsName('qty')
-
-year4 = pyparsing.Regex(r'\b\d{4}\b').setResultsName('year')
-year2 = pyparsing.Regex(r'\b\d{2}\b').setParseAction(process_two_digits_year).setResultsName('year')
-year = pyparsing.MatchFirst([year4, year2])
-
-date_sep = Optional(pyparsing.Regex(r'[/\-\. ]'))
-year_sep = Optional(pyparsing.Regex(r'[/\-\. ,]'))
-
-month = pyparsing.MatchFirst([integer_month, months])
-month = month.setResultsName('month')
-
-day_spec = pyparsing.MatchFirst([integer_day, ordinal_day])
-day_spec = day_spec.setResultsName('day')
-
-date_day = pyparsing.MatchFirst([day_name + Optional(the_),
-                                 the_]) \
-           + ordinal_day('day')
-
-date_ymd = year4\
-           + pyparsing.MatchFirst([SEP_SYM + month + SEP_SYM for SEP_SYM in date_separators])\
-           + day_spec
-
-date_mdy = pyparsing.MatchFirst([
-    month + date_sep + Optional(the_) + day_spec +
-    Optional(year_sep + year + pyparsing.NotAny(':')),
-    integer_month_two_digits_no_trailing_space('month') +
-    integer_day_two_digits_no_leading_space('day')
-])
-
-ignore_date_ydm = year4 + pyparsing.MatchFirst(
-    [SEP_SYM + day_spec + SEP_SYM for SEP_SYM in date_separators]) + month
-
-date_day_month = pyparsing.MatchFirst([
-    day_spec + Optional(of_dash_) + month,
-    integer_day_no_trailing_space('day') + months_no_spaces('month')
-])
-
-date = pyparsing.MatchFirst([
-    Optional(day_name + Optional(',')) + pyparsing.MatchFirst([date_ymd, date_mdy, date_day_month]),
-    date_day
-])
-date.setParseAction(convert_to_date)
-
-named_day = utils.caseless_keyword_or(['yesterday', 'today', 'tomorrow']).setResultsName('name')
-
-weekday_ref = Optional(Optional(this_).suppress() + last_ | this_ | next_)('dir_rel') + day_name
-weekday_ref = weekday_ref.setResultsName('weekday_ref')
-
-day_ref = named_day | weekday_ref
-day_ref.setParseAction(convert_to_day)
-
-part_of_day = pyparsing.MatchFirst(
-    [morning, dawn, sunrise, AM, afternoon, PM, dusk, sunset, evening, eod, night])
-part_of_day = part_of_day.setResultsName('part_of_day')
-
-full_hours = pyparsing.Regex(r'\b(2[0-3]|(1|0?)[0-9])').setResultsName('hour')
-am_pm_hours = pyparsing.Regex(r'\b(1[0-2]|0?[1-9])').setResultsName('hour')
-minutes = pyparsing.Regex(r'[0-5][0-9]').setResultsName('minute')
-seconds = pyparsing.Regex(r'[0-5][0-9]').setResultsName('second')
-
-am = pyparsing.Regex(r'a(\. ?)?m\.?\b', re.IGNORECASE).setResultsName('am')
-pm = pyparsing.Regex(r'p(\. ?)?m\.?\b', re.IGNORECASE).setResultsName('pm')
-
-timezone = utils.caseless_keyword_or([
-    'Eastern', 'Central', 'Mountain', 'Pacific', 'EST', 'CST', 'MST', 'PST', 'EDT', 'CDT', 'MDT',
-    'PDT', 'ET', 'CT', 'MT', 'PT'
-])
-
-full_time = full_hours + ':' + minutes + Optional(':' + seconds)
-am_pm_time = am_pm_hours + Optional(':' + minutes + Optional(':' + seconds)) + pyparsing.MatchFirst(
-    [am, pm])
-am_pm_time.setParseAction(am_pm_time_to_full)
-o_clock_time = am_pm_hours + o_clock
-o_clock_time.setParseAction(o_clock_time_to_full)
-
-hms_time = Optional(at_) + pyparsing.MatchFirst([o_clock_time, am_pm_time, full_time
-                                                 ]) + Optional(timezone)
-
-this_time = (this_ + time_).setResultsName('this_time')
-
-time_of_day = pyparsing.MatchFirst([
-    Optional(at_ | around_).suppress() + pyparsing.MatchFirst(
-        [this_time, hms_time, noon_, midnight_, dusk, dawn, sunrise, sunset, night]),
-    Optional(Optional(in_) + the_).suppress() +
-    pyparsing.MatchFirst([morning, afternoon, evening, night]),
-    Optional(by_).suppress() + eod
-])
-time_of_day = time_of_day.setResultsName('time_of_day')
-
-relative_date_unit = (year_ | month_ | week_ | day_)('time_unit')
-relative_time_unit = (hour_ | minute_ | _second_)('time_unit')
-relative_datetime_unit = (relative_date_unit | relative_time_unit)
-
-now_datetime_spec = pyparsing.MatchFirst([
-    now_,
-    Optional(in_) + qty + relative_time_unit + from_ + now_,
-    qty + relative_time_unit + (ago_ | before_ + now_),
-    in_ + qty + relative_time_unit,
-])
-now_datetime_spec.setParseAction(now_action)
-
-named_day_date_spec = pyparsing.MatchFirst([
-    Optional(in_) + qty + relative_date_unit + from_ + now_,
-    qty + relative_date_unit + (ago_ | before_ + now_),
-    in_ + qty + relative_date_unit + Optional(time_of_day),
-])
-named_day_date_spec.setParseAction(named_day_action)
-
-last_this_next_interval = pyparsing.MatchFirst([
-    Optional(Optional(the_) + day_spec('day') + of_) + (last_ | this_ | next_) +
-    (week_ | month_)('time_unit'),
-    Optional(months('month')) + (last_ | this_ | next_) + year_('time_unit')
-])
-last_this_next_interval.setParseAction(convert_to_interval)
-last_this_next_interval = last_this_next_interval.setResultsName('calculatedTime')
-
-datetime_spec = Optional(last_this_next_interval) \
-                + pyparsing.MatchFirst([
-                    time_of_day + Optional(Optional(of_ | on_) + (date | day_ref)),
-                    (date | day_ref) + Optional(Optional(',') + time_of_day)
-                ])
-datetime_spec.setParseAction(convert_to_abs_time, calculate_time)
-
-rel_time_spec = Optional(in_) + qty + relative_datetime_unit + (from_ | before_
-                                                                | after_) + datetime_spec
-rel_time_spec.setParseAction(convert_to_timedelta, calculate_time)
-
-last_this_next_part_of_day = pyparsing.MatchFirst([
-    tonight,
-    (last_ | this_ | next_) + part_of_day,
-])
-last_this_next_part_of_day.setParseAction(last_this_next_action)
-
-interval_year = year('year')
-interval_year.setParseAction(interval_year_action)
-
-interval_year4 = Optional('$')('datetime_parsing_error') + year4('year')
-interval_year4.setParseAction(interval_year_action)
-
-quarter_name = pyparsing.Regex(r'\bQ[1234]\b', re.IGNORECASE)
-interval_quarter = pyparsing.MatchFirst([
-    pyparsing.MatchFirst([
-        quarter_name('quarter'),
-        utils.caseless_keyword_or(['first', 'second', 'third', 'fourth'])('quarter') + quarter_
-    ]) + Optional(year),
-    (last_ | this_ | next_)('dir_rel') + quarter_,
-])
-interval_quarter.setParseAction(interval_quarter_action)
-
-interval_month = months('month') + Optional(Optional(',') + year)
-interval_month.setParseAction(interval_month_action)
-
-this_placeholder = pyparsing.Empty()('dir_rel').setParseAction(lambda: 0)
-interval = pyparsing.MatchFirst([
-    interval_month, interval_quarter, interval_year, last_this_next_interval, named_day,
-    (this_placeholder + relative_date_unit)('calculatedTime').setParseAction(convert_to_interval)
-])
-
-beginning_end_of = pyparsing.MatchFirst([
-    utils.caseless_keyword_or(['beginning', 'start', 'middle', 'end'])('bound') + of_,
-    utils.caseless_keyword_or(['early', 'late'])('bound'),
-    utils.caseless_keyword('mid')('bound') + Optional(of_dash_)
-]) + interval
-beginning_end_of.setParseAction(beginning_end_of_action)
-
-half_of = (utils.caseless_keyword_or(['earlier', 'first', 'later', 'second'])('half')) +\
-          utils.caseless_keyword('half') + Optional(of_dash_) + interval
-half_of.setParseAction(half_of_action)
-
-asap = utils.caseless_keyword('asap')
-asap.setParseAction(asap_action)
-
-before_after_datetime_object = pyparsing.MatchFirst([
-    (between_ + datetime_spec)('inclusive_start') + (and_ + datetime_spec)('inclusive_end'),
-    (Optional(from_) + datetime_spec)('inclusive_start') +
-    (to_dash_ + datetime_spec)('inclusive_end'),
-    (after_ + datetime_spec)('exclusive_start') + Optional(
-        (before_ + datetime_spec)('exclusive_end')),
-    (before_ + datetime_spec)('exclusive_end') + Optional(
-        (after_ + datetime_spec)('exclusive_start')),
-])
-before_after_datetime_object.setParseAction(before_after_any)
-
-ignore_greetings = 'good' + (morning | afternoon | evening | night)
-
-delta_time = pyparsing.MatchFirst([
-    ignore_greetings.suppress(
-    ),  # Allows multiple refactors related to morning/afternoon/evening/night keywords
-    beginning_end_of,
-    half_of,
-    before_after_datetime_object,
-    datetime_spec,
-    rel_time_spec,
-    last_this_next_interval + pyparsing.NotAny(datetime_spec),
-    named_day_date_spec,
-    now_datetime_spec,
-    last_this_next_part_of_day,
-    ignore_date_ydm.suppress(),  # Required to prevent extracting a fragment of an invalid date
-    interval_quarter,
-    interval_month,
-    interval_year4,
-    asap,
-])
-delta_time.addParseAction(set_datetime)
+# Grammar used to parse different times is defined below. The skeleton is shared by every locale,
+# the vocabulary comes from a locale pack (see kronosparser.lexicon and kronosparser.locales).
+
+
+class Grammar:
+    def __init__(self, locale, elements, productions=()):
+        self.locale = locale
+        self.delta_time = elements['delta_time']
+        self.__dict__.update(elements)
+        # The alternatives of delta_time by name, in the order they are tried
+        self.productions = collections.OrderedDict(productions)
+
+
+def _keyword(words):
+    if not words:
+        return pyparsing.NoMatch()
+    return utils.caseless_keyword_or(list(words))
+
+
+def _canonical_keyword(mapping):
+    return _keyword(mapping).setParseAction(lexicon.resolve_action(mapping))
+
+
+def _table_regex(table, leading=r'\b'):
+    return pyparsing.Regex(lexicon.keyword_pattern(table, leading=leading),
+                           re.IGNORECASE).setParseAction(lexicon.resolve_action(table))
+
+
+def build_grammar(lex):  # pylint: disable=too-many-locals,too-many-statements
+    keywords = lex.KEYWORDS
+
+    the_ = _keyword(keywords['the'])
+    to_dash_ = _keyword(keywords['to'] + ('-', ))
+    at_ = _keyword(keywords['at'])
+    and_ = _keyword(keywords['and'])
+    by_ = _keyword(keywords['by'])
+    around_ = _keyword(keywords['around'])
+    of_ = _keyword(keywords['of'])
+    on_ = _keyword(keywords['on'])
+    of_dash_ = _keyword(keywords['of'] + ('-', ))
+    time_ = _keyword(keywords['time'])
+    o_clock = _keyword(keywords['o_clock'])
+    between_ = _keyword(keywords['between'])
+
+    in_ = _keyword(keywords['in']).setParseAction(
+        pyparsing.replaceWith(1)).setResultsName('dir_abs')
+    from_ = _keyword(keywords['from']).setParseAction(
+        pyparsing.replaceWith(1)).setResultsName('dir_abs')
+    before_ = _keyword(keywords['before']).setParseAction(
+        pyparsing.replaceWith(-1)).setResultsName('dir_abs')
+    after_ = _keyword(keywords['after']).setParseAction(
+        pyparsing.replaceWith(1)).setResultsName('dir_abs')
+    ago_ = _keyword(keywords['ago']).setParseAction(
+        pyparsing.replaceWith(-1)).setResultsName('dir_abs')
+    ago_prefix_ = _keyword(keywords['ago_prefix']).setParseAction(
+        pyparsing.replaceWith(-1)).setResultsName('dir_abs')
+
+    next_ = _keyword(keywords['next']).setParseAction(
+        pyparsing.replaceWith(1)).setResultsName('dir_rel')
+    last_ = _keyword(keywords['last']).setParseAction(
+        pyparsing.replaceWith(-1)).setResultsName('dir_rel')
+    this_ = _keyword(keywords['this']).setParseAction(
+        pyparsing.replaceWith(0)).setResultsName('dir_rel')
+
+    noon_ = _keyword(keywords['noon']).setParseAction(pyparsing.replaceWith('noon'))
+    midnight_ = _keyword(keywords['midnight']).setParseAction(pyparsing.replaceWith('midnight'))
+    now_ = _keyword(keywords['now'])
+
+    dawn = _keyword(keywords['dawn']).setParseAction(lambda tokens: datetime.time(5))
+    sunrise = _keyword(keywords['sunrise']).setParseAction(lambda tokens: datetime.time(6))
+    morning = _keyword(keywords['morning']).setParseAction(lambda tokens: datetime.time(9))
+    AM = pyparsing.Regex(r'a(\. ?)?m\.?',
+                         re.IGNORECASE).setParseAction(lambda tokens: datetime.time(9))
+    afternoon = _keyword(keywords['afternoon']).setParseAction(lambda tokens: datetime.time(14))
+    PM = pyparsing.Regex(r'p(\. ?)?m\.?',
+                         re.IGNORECASE).setParseAction(lambda tokens: datetime.time(14))
+    dusk = _keyword(keywords['dusk']).setParseAction(lambda tokens: datetime.time(17))
+    sunset = _keyword(keywords['sunset']).setParseAction(lambda tokens: datetime.time(18))
+    eod = _keyword(keywords['eod']).setParseAction(lambda tokens: datetime.time(18))
+    evening = _keyword(keywords['evening']).setParseAction(lambda tokens: datetime.time(19))
+    night = _keyword(keywords['night']).setParseAction(lambda tokens: datetime.time(21))
+    tonight = (pyparsing.Empty().setParseAction(pyparsing.replaceWith(0)) +
+               _keyword(keywords['tonight']).setParseAction(lambda tokens: datetime.time(21)))
+
+    def unit(name):
+        return _keyword(lex.UNITS[name]).setParseAction(pyparsing.replaceWith(name))
+
+    year_ = unit('year')
+    quarter_ = unit('quarter')
+    month_ = unit('month')
+    week_ = unit('week')
+    day_ = unit('day')
+    hour_ = unit('hour')
+    minute_ = unit('minute')
+    _second_ = unit('second')
+
+    # TODO: Use some NLP tool to disambiguate some months (e.g. `may` verb or noun)
+    #  if this causes any issues
+    months = _table_regex(lex.MONTH_NAMES)
+    months_no_spaces = _table_regex(lex.MONTH_NAMES, leading='')
+
+    day_name = _table_regex(lex.WEEKDAYS)
+    day_name = day_name.setResultsName('day_name')
+
+    ordinal_day = _table_regex(lex.ORDINAL_DAYS)
+
+    date_separators = ['/', '-', '.']
+
+    couple = (Optional(_keyword(keywords['couple_article'])) + _keyword(keywords['couple']) +
+              Optional(of_))
+    couple.setParseAction(pyparsing.replaceWith(2))
+
+    a_qty = _keyword(lex.QUANTITY_ARTICLES).setParseAction(pyparsing.replaceWith(1))
+
+    # Bounded so that long digit runs fail fast instead of being converted at every offset
+    integer = pyparsing.Regex(r'(?<!\d)\d{1,9}(?!\d)').setParseAction(lambda token: int(token[0]))
+    integer_month = pyparsing.Regex(r'\b(1[012]|0?[1-9])\b')
+    integer_day = pyparsing.Regex(r'\b(3[01]|[1-2]\d|0?[1-9])\b')
+    integer_month_two_digits_no_trailing_space = pyparsing.Regex(r'\b(1[012]|0[1-9])')
+    integer_day_no_trailing_space = pyparsing.Regex(r'\b(3[01]|[1-2]\d|0?[1-9])')
+    integer_day_two_digits_no_leading_space = pyparsing.Regex(r'(3[01]|[1-2]\d|0[1-9])\b')
+    for integer_token in [
+            integer_month, integer_day, integer_month_two_digits_no_trailing_space,
+            integer_day_no_trailing_space, integer_day_two_digits_no_leading_space
+    ]:
+        integer_token.setParseAction(lambda tokens: int(tokens[0]))
+
+    spoken_number = WordNumber(unit_table=lex.NUMBER_UNITS,
+                               tens_table=lex.NUMBER_TENS,
+                               hundred_table=lex.NUMBER_HUNDREDS,
+                               major_table=lex.NUMBER_MAJORS,
+                               articles=lex.NUMBER_ARTICLES,
+                               conjunctions=lex.NUMBER_CONJUNCTIONS)
+
+    qty = integer | couple | spoken_number | a_qty
+    qty = qty.setResultsName('qty')
+
+    year4 = pyparsing.Regex(r'\b\d{4}\b').setResultsName('year')
+    year2 = pyparsing.Regex(r'\b\d{2}\b').setParseAction(process_two_digits_year).setResultsName(
+        'year')
+    year = pyparsing.MatchFirst([year4, year2])
+
+    date_sep = Optional(pyparsing.Regex(r'[/\-\. ]'))
+    year_sep = Optional(pyparsing.Regex(r'[/\-\. ,]'))
+
+    month = pyparsing.MatchFirst([integer_month, months])
+    month = month.setResultsName('month')
+
+    day_spec = pyparsing.MatchFirst([integer_day, ordinal_day])
+    day_spec = day_spec.setResultsName('day')
+
+    date_day = pyparsing.MatchFirst([day_name + Optional(the_),
+                                     the_]) \
+               + ordinal_day('day')
+
+    date_ymd = year4\
+               + pyparsing.MatchFirst([SEP_SYM + month + SEP_SYM for SEP_SYM in date_separators])\
+               + day_spec
+
+    date_mdy = pyparsing.MatchFirst([
+        month + date_sep + Optional(the_) + day_spec +
+        Optional(year_sep + year + pyparsing.NotAny(':')),
+        integer_month_two_digits_no_trailing_space('month') +
+        integer_day_two_digits_no_leading_space('day')
+    ])
+
+    ignore_date_ydm = year4 + pyparsing.MatchFirst(
+        [SEP_SYM + day_spec + SEP_SYM for SEP_SYM in date_separators]) + month
+
+    date_day_month = pyparsing.MatchFirst([
+        day_spec + Optional(of_dash_) + month,
+        integer_day_no_trailing_space('day') + months_no_spaces('month')
+    ])
+
+    date = pyparsing.MatchFirst([
+        Optional(day_name + Optional(',')) +
+        pyparsing.MatchFirst([date_ymd, date_mdy, date_day_month]), date_day
+    ])
+    date.setParseAction(convert_to_date)
+
+    named_day = _canonical_keyword(lex.NAMED_DAYS).setResultsName('name')
+
+    weekday_ref = Optional(Optional(this_).suppress() + last_ | this_ | next_)('dir_rel') + day_name
+    weekday_ref = weekday_ref.setResultsName('weekday_ref')
+
+    day_ref = named_day | weekday_ref
+    day_ref.setParseAction(convert_to_day)
+
+    holiday = _canonical_keyword(lex.HOLIDAYS)('holiday')
+    holiday_ref = Optional(the_) + Optional(last_ | this_ | next_) + holiday
+    holiday_ref.setParseAction(convert_to_holiday)
+
+    week_of_holiday = Optional(the_) + week_ + of_ + holiday_ref
+    week_of_holiday.setParseAction(week_of_action)
+
+    part_of_day = pyparsing.MatchFirst(
+        [morning, dawn, sunrise, AM, afternoon, PM, dusk, sunset, evening, eod, night])
+    part_of_day = part_of_day.setResultsName('part_of_day')
+
+    full_hours = pyparsing.Regex(r'\b(2[0-3]|(1|0?)[0-9])').setResultsName('hour')
+    am_pm_hours = pyparsing.Regex(r'\b(1[0-2]|0?[1-9])').setResultsName('hour')
+    minutes = pyparsing.Regex(r'[0-5][0-9]').setResultsName('minute')
+    seconds = pyparsing.Regex(r'[0-5][0-9]').setResultsName('second')
+
+    am = pyparsing.Regex(r'a(\. ?)?m\.?\b', re.IGNORECASE).setResultsName('am')
+    pm = pyparsing.Regex(r'p(\. ?)?m\.?\b', re.IGNORECASE).setResultsName('pm')
+
+    timezone = utils.caseless_keyword_or([
+        'Eastern', 'Central', 'Mountain', 'Pacific', 'EST', 'CST', 'MST', 'PST', 'EDT', 'CDT',
+        'MDT', 'PDT', 'ET', 'CT', 'MT', 'PT'
+    ])
+
+    full_time = full_hours + ':' + minutes + Optional(':' + seconds)
+    am_pm_time = am_pm_hours + Optional(':' + minutes +
+                                        Optional(':' + seconds)) + pyparsing.MatchFirst([am, pm])
+    am_pm_time.setParseAction(am_pm_time_to_full)
+    o_clock_time = am_pm_hours + o_clock
+    o_clock_time.setParseAction(o_clock_time_to_full)
+
+    hms_time = Optional(at_) + pyparsing.MatchFirst([o_clock_time, am_pm_time, full_time
+                                                     ]) + Optional(timezone)
+
+    this_time = (this_ + time_).setResultsName('this_time')
+
+    time_of_day = pyparsing.MatchFirst([
+        Optional(at_ | around_).suppress() + pyparsing.MatchFirst(
+            [this_time, hms_time, noon_, midnight_, dusk, dawn, sunrise, sunset, night]),
+        Optional(Optional(in_) + the_).suppress() +
+        pyparsing.MatchFirst([morning, afternoon, evening, night]),
+        Optional(by_).suppress() + eod
+    ])
+    time_of_day = time_of_day.setResultsName('time_of_day')
+
+    relative_date_unit = (year_ | month_ | week_ | day_)('time_unit')
+    relative_time_unit = (hour_ | minute_ | _second_)('time_unit')
+    relative_datetime_unit = (relative_date_unit | relative_time_unit)
+
+    now_datetime_spec = pyparsing.MatchFirst([
+        now_,
+        Optional(in_) + qty + relative_time_unit + from_ + now_,
+        qty + relative_time_unit + (ago_ | before_ + now_),
+        in_ + qty + relative_time_unit,
+    ] + ([ago_prefix_ + qty + relative_time_unit] if keywords['ago_prefix'] else []))
+    now_datetime_spec.setParseAction(now_action)
+
+    named_day_date_spec = pyparsing.MatchFirst([
+        Optional(in_) + qty + relative_date_unit + from_ + now_,
+        qty + relative_date_unit + (ago_ | before_ + now_),
+        in_ + qty + relative_date_unit + Optional(time_of_day),
+    ] + ([ago_prefix_ + qty + relative_date_unit] if keywords['ago_prefix'] else []))
+    named_day_date_spec.setParseAction(named_day_action)
+
+    last_this_next_interval = pyparsing.MatchFirst([
+        Optional(Optional(the_) + day_spec('day') + of_) + (last_ | this_ | next_) +
+        (week_ | month_)('time_unit'),
+        Optional(months('month')) + (last_ | this_ | next_) + year_('time_unit')
+    ])
+    last_this_next_interval.setParseAction(convert_to_interval)
+    last_this_next_interval = last_this_next_interval.setResultsName('calculatedTime')
+
+    day_spec_ref = date | holiday_ref | day_ref
+    datetime_spec = Optional(last_this_next_interval) \
+                    + pyparsing.MatchFirst([
+                        time_of_day + Optional(Optional(of_ | on_) + day_spec_ref),
+                        day_spec_ref + Optional(Optional(',') + time_of_day)
+                    ])
+    datetime_spec.setParseAction(convert_to_abs_time, calculate_time)
+
+    rel_time_spec = Optional(in_) + qty + relative_datetime_unit + (from_ | before_
+                                                                    | after_) + datetime_spec
+    rel_time_spec.setParseAction(convert_to_timedelta, calculate_time)
+
+    last_this_next_part_of_day = pyparsing.MatchFirst([
+        tonight,
+        (last_ | this_ | next_) + part_of_day,
+    ])
+    last_this_next_part_of_day.setParseAction(last_this_next_action)
+
+    interval_year = year('year')
+    interval_year.setParseAction(interval_year_action)
+
+    interval_year4 = Optional('$')('datetime_parsing_error') + year4('year')
+    interval_year4.setParseAction(interval_year_action)
+
+    quarter_name = _table_regex(lex.QUARTER_NAMES)
+    quarter_ordinal = _canonical_keyword(lex.QUARTER_ORDINALS)
+    interval_quarter = pyparsing.MatchFirst([
+        pyparsing.MatchFirst([quarter_name('quarter'),
+                              quarter_ordinal('quarter') + quarter_]) + Optional(year),
+        (last_ | this_ | next_)('dir_rel') + quarter_,
+    ])
+    interval_quarter.setParseAction(interval_quarter_action)
+
+    interval_month = months('month') + Optional(Optional(',') + year)
+    interval_month.setParseAction(interval_month_action)
+
+    this_placeholder = pyparsing.Empty()('dir_rel').setParseAction(lambda: 0)
+    interval = pyparsing.MatchFirst([
+        interval_month, interval_quarter, interval_year, last_this_next_interval, named_day,
+        week_of_holiday, (this_placeholder +
+                          relative_date_unit)('calculatedTime').setParseAction(convert_to_interval)
+    ])
+
+    bound = pyparsing.MatchFirst([
+        _canonical_keyword(lex.BOUNDS_OF)('bound') + of_,
+        _canonical_keyword(lex.BOUNDS)('bound'),
+        _canonical_keyword(lex.BOUNDS_DASH)('bound') + Optional(of_dash_)
+    ])
+    beginning_end_of = bound + interval
+    beginning_end_of.setParseAction(beginning_end_of_action)
+
+    half_of = (_canonical_keyword(lex.HALVES)('half')) +\
+              _keyword(keywords['half']) + Optional(of_dash_) + interval
+    half_of.setParseAction(half_of_action)
+
+    asap = _keyword(keywords['asap'])
+    asap.setParseAction(asap_action)
+
+    before_after_datetime_object = pyparsing.MatchFirst([
+        (between_ + datetime_spec)('inclusive_start') + (and_ + datetime_spec)('inclusive_end'),
+        (Optional(from_) + datetime_spec)('inclusive_start') +
+        (to_dash_ + datetime_spec)('inclusive_end'),
+        (after_ + datetime_spec)('exclusive_start') + Optional(
+            (before_ + datetime_spec)('exclusive_end')),
+        (before_ + datetime_spec)('exclusive_end') + Optional(
+            (after_ + datetime_spec)('exclusive_start')),
+    ])
+    before_after_datetime_object.setParseAction(before_after_any)
+
+    business_ = _keyword(keywords['business'])
+    business_suffix_ = _keyword(keywords['business_suffix'])
+    within_ = _keyword(keywords['within']).setParseAction(
+        pyparsing.replaceWith(1)).setResultsName('dir_abs')
+    business_day_ = business_ + day_ | day_ + business_suffix_
+    business_hour_ = business_ + hour_ | hour_ + business_suffix_
+
+    business_day_ref = pyparsing.MatchFirst([
+        (in_ | within_) + qty + business_day_,
+        qty + business_day_ + ago_,
+        (last_ | next_) + business_day_,
+    ])
+    business_day_ref.setParseAction(business_day_action)
+
+    business_day_spec = business_day_ref + Optional(Optional(',') + time_of_day)
+    business_day_spec.setParseAction(business_time_action)
+
+    business_bound = bound + Optional(the_) + business_day_ref
+    business_bound.setParseAction(business_bound_action)
+
+    working_hours_spec = (in_ | within_) + qty + business_hour_
+    working_hours_spec.setParseAction(working_hours_action)
+
+    every_ = _keyword(keywords['every'])
+    other_ = _keyword(keywords['other']).setParseAction(pyparsing.replaceWith(2))('qty')
+    recurrence = every_ + pyparsing.MatchFirst([
+        Optional(other_) + day_name,
+        Optional(other_ | qty) + week_('time_unit') + on_ + day_name,
+        Optional(other_ | qty) + relative_date_unit,
+    ]) + Optional(Optional(',') + time_of_day)
+    recurrence.setParseAction(recurrence_start_action, recurrence_action)
+
+    greeting = pyparsing.MatchFirst([pyparsing.Literal(word) for word in keywords['greeting']])
+    ignore_greetings = greeting + (morning | afternoon | evening | night)
+
+    productions = [
+        # Allows multiple refactors related to morning/afternoon/evening/night keywords
+        ('ignore_greetings', ignore_greetings.suppress()),
+        ('recurrence', recurrence),
+        ('business_bound', business_bound),
+        ('business_day_spec', business_day_spec),
+        ('working_hours_spec', working_hours_spec),
+        ('beginning_end_of', beginning_end_of),
+        ('half_of', half_of),
+        ('before_after_datetime_object', before_after_datetime_object),
+        ('week_of_holiday', week_of_holiday),
+        ('datetime_spec', datetime_spec),
+        ('rel_time_spec', rel_time_spec),
+        ('last_this_next_interval', last_this_next_interval + pyparsing.NotAny(datetime_spec)),
+        ('named_day_date_spec', named_day_date_spec),
+        ('now_datetime_spec', now_datetime_spec),
+        ('last_this_next_part_of_day', last_this_next_part_of_day),
+        # Required to prevent extracting a fragment of an invalid date
+        ('ignore_date_ydm', ignore_date_ydm.suppress()),
+        ('interval_quarter', interval_quarter),
+        ('interval_month', interval_month),
+        ('interval_year4', interval_year4),
+        ('asap', asap),
+    ]
+    delta_time = pyparsing.MatchFirst([  # pylint: disable=redefined-outer-name
+        element for _, element in productions
+    ])
+    delta_time.addParseAction(set_datetime)
+    utils.lean_alternatives(delta_time)
+
+    return Grammar(
+        lex.LOCALE, {
+            name: element
+            for name, element in locals().items() if isinstance(element, pyparsing.ParserElement)
+        }, productions)
+
+
+english = build_grammar(lexicon)
+delta_time = english.delta_time
@@ -1,26 +1,268 @@
+import itertools
 import re
+import time
+import weakref
 from datetime import datetime, timedelta
 
 import pyparsing
 import pytz
 from dateutil import parser as date_parser
+from kronosparser import clock
+from kronosparser.recurrence import Recurrence
 
 
-def find_all(expression, text):
-    matches = []
-    if expression is not None:
-        for match in expression.scanString(text):
-            # TODO(RA, 05-10-2016): prevent suppressed ParseResults objects from ever being created
-            if len(match[0]) > 0:
-                matches.append({
-                    'text': text[match[1]:match[2]],
-                    'parsed': match[0][0],
-                    'start': match[1],
-                    'end': match[2]
-                })
+class MatchList(list):
+    # Set when the text was cut to `max_length` or the deadline stopped the scan early
+    truncated = False
+    # Set when no position of the text could start a match, so that the grammar never ran
+    fast = False
+
+
+class DeadlineExceeded(Exception):
+    pass
+
+
+def find_all(expression, text, max_matches=None, deadline=None, max_length=None, anchored=False):
+    # pylint: disable=too-many-arguments
+    matches = MatchList()
+    if expression is None:
+        return matches
+    if max_length is not None and len(text) > max_length:
+        text = truncate(text, max_length)
+        matches.truncated = True
+    try:
+        for match in itertools.islice(
+                iter_matches(expression, text, deadline, anchored, found=matches), max_matches):
+            matches.append(match)
+    except DeadlineExceeded:
+        matches.truncated = True
     return matches
 
 
+def truncate(text, max_length):
+    # Cut at the last whitespace so that the last expression is not parsed half-way
+    if len(text) <= max_length or text[max_length].isspace():
+        return text[:max_length]
+    cut = max(text.rfind(space, 0, max_length) for space in ' \t\n')
+    return text[:cut] if cut > 0 else text[:max_length]
+
+
+def word_start(text, position):
+    while position > 0 and not text[position - 1].isspace():
+        position -= 1
+    return position
+
+
+def word_end(text, position):
+    while position < len(text) and not text[position].isspace():
+        position += 1
+    return position
+
+
+def get_deadline(max_time=None, deadline=None):
+    # Deadlines are absolute `time.monotonic()` values, `max_time` is relative to now
+    if max_time is not None:
+        budget = time.monotonic() + max_time
+        deadline = budget if deadline is None else min(deadline, budget)
+    return deadline
+
+
+def iter_matches(expression, text, deadline=None, anchored=False, found=None):
+    for tokens, start, end in scan(expression,
+                                   text,
+                                   deadline=deadline,
+                                   anchored=anchored,
+                                   found=found):
+        yield {'text': text[start:end], 'parsed': tokens[0], 'start': start, 'end': end}
+
+
+def has_match(expression, text, accept=None):
+    # Parse actions are skipped, only the shape of the text is checked. With `accept`, each
+    # candidate is parsed again with its actions, and only counts if accept(tokens) is true.
+    if not expression.keepTabs and '\t' in text:
+        text = text.expandtabs()
+    parse = expression._parse  # pylint: disable=protected-access
+    for _, start, _ in scan(expression, text, do_actions=False):
+        if accept is None:
+            return True
+        try:
+            _, tokens = parse(text, start, callPreParse=False)
+        except pyparsing.ParseException:
+            continue
+        if accept(tokens):
+            return True
+    return False
+
+
+def _next_start(trigger, text, loc, found):
+    # First offset from `loc` on where a match can start, None if there is none left
+    hit = trigger.search(text, loc)
+    if hit is None:
+        if loc == 0 and found is not None:
+            found.fast = True
+        return None
+    return hit.start()
+
+
+def scan(expression,
+         text,
+         do_actions=True,
+         deadline=None,
+         anchored=False,
+         found=None,
+         suppressed=False):
+    # pylint: disable=too-many-arguments
+    # Same loop as ParserElement.scanString, except that offsets where no match can start are
+    # skipped with a single regex search (see trigger) instead of a failed parse at each of them,
+    # and that suppressed matches are stepped over without being yielded, unless `suppressed` is
+    # set. `found.fast` (e.g. of a MatchList) is set when that search finds nothing in the whole
+    # text.
+    if not expression.streamlined:
+        expression.streamline()
+    if not expression.keepTabs and '\t' in text:
+        text = text.expandtabs()
+    # An anchored scan only tries the start of the text
+    trigger = None if anchored else get_trigger(expression)
+    preparse = expression.preParse
+    parse = expression._parse  # pylint: disable=protected-access
+    pyparsing.ParserElement.resetCache()
+    loc = 0
+    while loc <= len(text):
+        if deadline is not None and time.monotonic() > deadline:
+            raise DeadlineExceeded()
+        if trigger is not None:
+            loc = _next_start(trigger, text, loc, found)
+            if loc is None:
+                return
+        preloc = preparse(text, loc)
+        try:
+            next_loc, tokens = parse(text, preloc, do_actions, callPreParse=False)
+        except pyparsing.ParseException:
+            loc = preloc + 1
+        else:
+            if next_loc > loc:
+                if tokens or suppressed:
+                    yield tokens, preloc, next_loc
+                loc = next_loc
+            else:
+                loc = preloc + 1
+        if anchored:
+            return
+
+
+class _LeanMatchFirst(pyparsing.MatchFirst):
+    # Same as MatchFirst.parseImpl, except that the furthest failure is no longer referenced by
+    # the frame once it is raised. Otherwise the frame and the exception's traceback form a
+    # cycle, and every failed alternative leaves garbage that only the cyclic GC can free.
+    def parseImpl(self, instring, loc, doActions=True):
+        max_loc = -1
+        max_exception = None
+        try:
+            for expr in self.exprs:
+                try:
+                    return expr._parse(instring, loc, doActions)  # pylint: disable=protected-access
+                except pyparsing.ParseException as err:
+                    if err.loc > max_loc:
+                        max_exception = err
+                        max_loc = err.loc
+                except IndexError:
+                    if len(instring) > max_loc:
+                        max_exception = pyparsing.ParseException(instring, len(instring),
+                                                                 expr.errmsg, self)
+                        max_loc = len(instring)
+            if max_exception is None:
+                raise pyparsing.ParseException(instring, loc, 'no defined alternatives to match',
+                                               self)
+            raise max_exception
+        finally:
+            max_exception = None
+
+
+def walk(expression):
+    # Every element reachable from `expression`, once each
+    stack = [expression]
+    seen = set()  # type: set
+    while stack:
+        element = stack.pop()
+        if id(element) in seen:
+            continue
+        seen.add(id(element))
+        yield element
+        stack.extend(getattr(element, 'exprs', ()))
+        if isinstance(getattr(element, 'expr', None), pyparsing.ParserElement):
+            stack.append(element.expr)
+
+
+def lean_alternatives(expression):
+    # Switches every MatchFirst reachable from `expression` to _LeanMatchFirst
+    for element in walk(expression):
+        if type(element) is pyparsing.MatchFirst:  # pylint: disable=unidiomatic-typecheck
+            element.__class__ = _LeanMatchFirst
+    return expression
+
+
+class _UnknownElement(Exception):
+    pass
+
+
+def _first_patterns(element, seen):  # pylint: disable=too-many-return-statements,too-many-branches
+    # Regexes able to match the first token of `element`, and whether it can match nothing at all
+    if id(element) in seen:
+        raise _UnknownElement(element)
+    seen = seen | {id(element)}
+    if isinstance(element, pyparsing.NoMatch):
+        return set(), False
+    if isinstance(element, (pyparsing.Empty, pyparsing.NotAny, pyparsing.FollowedBy)):
+        return set(), True
+    if isinstance(element, pyparsing.Literal):
+        flags = re.IGNORECASE if isinstance(element, pyparsing.CaselessLiteral) else 0
+        return {(re.escape(element.match), flags)}, False
+    if isinstance(getattr(element, 're', None), type(re.compile(''))):
+        return {(element.re.pattern, element.re.flags & re.IGNORECASE)}, False
+    if isinstance(element, pyparsing.And):
+        patterns = set()  # type: set
+        for expr in element.exprs:
+            expr_patterns, nullable = _first_patterns(expr, seen)
+            patterns |= expr_patterns
+            if not nullable:
+                return patterns, False
+        return patterns, True
+    if isinstance(element, (pyparsing.MatchFirst, pyparsing.Or)):
+        patterns = set()
+        any_nullable = False
+        for expr in element.exprs:
+            expr_patterns, nullable = _first_patterns(expr, seen)
+            patterns |= expr_patterns
+            any_nullable = any_nullable or nullable
+        return patterns, any_nullable
+    if isinstance(element, (pyparsing.Optional, pyparsing.ZeroOrMore)):
+        return _first_patterns(element.expr, seen)[0], True
+    if isinstance(element, (pyparsing.OneOrMore, pyparsing.TokenConverter, pyparsing.Forward)):
+        if element.expr is None:
+            raise _UnknownElement(element)
+        return _first_patterns(element.expr, seen)
+    raise _UnknownElement(element)
+
+
+_triggers = weakref.WeakKeyDictionary()  # type: weakref.WeakKeyDictionary
+
+
+def get_trigger(expression):
+    # A regex matching wherever one of the expression's first tokens could start, or None when
+    # the grammar contains elements it cannot reason about (then every offset is tried)
+    if expression not in _triggers:
+        try:
+            patterns, nullable = _first_patterns(expression, frozenset())
+            if nullable or not patterns:
+                raise _UnknownElement(expression)
+            _triggers[expression] = re.compile('|'.join(
+                '(?{}:{})'.format('i' if flags else '', pattern)
+                for pattern, flags in sorted(patterns)))
+        except (_UnknownElement, re.error):
+            _triggers[expression] = None
+    return _triggers[expression]
+
+
 def caseless_literal_or(values):
     sorted_values = sorted(values, key=lambda x: (-len(x), x))
     return pyparsing.Regex('|'.join(re.escape(value) for value in sorted_values), re.IGNORECASE)
@@ -80,6 +322,23 @@ def structurize(text, parsers):
     return results
 
 
+def resolve_match(match, future=False, interval_to_date=True, tz='US/Pacific'):
+    parsed_output_keys = list(match['parsed'].keys())
+    if 'future' in parsed_output_keys:
+        match['parsed'] = match['parsed']['future' if future else 'past']
+    parsed_output_keys = list(match['parsed'].keys())
+    if interval_to_date and 'interval' in parsed_output_keys:
+        set_date_for_interval(match)
+    set_dates_with_timezone_fixes(match, tz)
+    return match
+
+
+def resolve_all(matches, future=False, interval_to_date=True, tz='US/Pacific'):
+    for match in matches:
+        resolve_match(match, future=future, interval_to_date=interval_to_date, tz=tz)
+    return matches
+
+
 def set_date_for_interval(match):
     match['parsed'] = {'date': match['parsed']['interval']['start']}
     return match
@@ -87,8 +346,12 @@ def set_date_for_interval(match):
 
 def set_dates_with_timezone_fixes(match, timezone):
     tz = pytz.timezone(timezone)
-    now = datetime.now()
-    tz_hours_offset = tz.utcoffset(now).total_seconds() / 60 / 60
+    reference = clock.reference_time()
+    if reference is None:
+        offset = tz.utcoffset(datetime.now())
+    else:
+        offset = pytz.utc.localize(reference).astimezone(tz).utcoffset()
+    tz_hours_offset = offset.total_seconds() / 60 / 60
 
     parsed_output_keys = list(match['parsed'].keys())
     if 'datetime' in parsed_output_keys:
@@ -112,6 +375,10 @@ def set_dates_with_timezone_fixes(match, timezone):
                                                tz_hours_offset))
                 match['parsed']['interval'][boundary] = _datetime
 
+    if 'recurrence' in parsed_output_keys:
+        match['parsed']['recurrence'] = set_timezones_for_recurrence(match['parsed'],
+                                                                     tz_hours_offset)
+
     if 'utc' in parsed_output_keys:
         del match['parsed']['utc']
     if 'tz_threshold' in parsed_output_keys:
@@ -139,6 +406,14 @@ def set_timezones_for_date(match, tz_hours_offset):
     return non_utc_date
 
 
+def set_timezones_for_recurrence(match, tz_hours_offset):
+    recurrence = Recurrence.from_dict(match['recurrence'])
+    if 'tz_threshold' in match:
+        recurrence.start = set_threshold(dict(match, date=match['recurrence']['start']),
+                                         tz_hours_offset, 'date').date()
+    return recurrence.to_dict()
+
+
 def set_threshold(match, tz_hours_offset, date_label):
     matched = date_parser.parse(match[date_label])
     days_delta = match['days_delta']
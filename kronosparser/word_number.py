@@ -5,6 +5,7 @@
 #
 import functools
 import operator
+import re
 
 import pyparsing
 from kronosparser import utils
@@ -93,3 +94,94 @@ word_number = pyparsing.OneOrMore(
 word_number.ignore(pyparsing.Literal('-'))
 word_number.ignore(pyparsing.Literal(','))
 word_number.ignore(pyparsing.CaselessKeyword('and'))
+
+article_definitions = ['a', 'an']
+conjunction_definitions = ['and']
+
+
+class WordNumber(pyparsing.Token):  # pylint: disable=too-many-instance-attributes
+    # Table-driven replacement for the combinator grammar above: a single regex finds the run of
+    # number words and a small state machine folds it into a value. Values are memoized by phrase.
+    def __init__(self,
+                 unit_table=None,
+                 tens_table=None,
+                 hundred_table=None,
+                 major_table=None,
+                 articles=None,
+                 conjunctions=None,
+                 cache_size=4096):
+        # pylint: disable=too-many-arguments
+        super(WordNumber, self).__init__()
+        self.unit_table = unit_definitions if unit_table is None else unit_table
+        self.tens_table = tens_definitions if tens_table is None else tens_table
+        self.hundred_table = hundred_definitions if hundred_table is None else hundred_table
+        self.major_table = major_definitions if major_table is None else major_table
+        self.articles = frozenset(article_definitions if articles is None else articles)
+        if conjunctions is None:
+            conjunctions = conjunction_definitions
+        words = set(self.unit_table) | set(self.tens_table) | set(self.hundred_table) | set(
+            self.major_table) | self.articles
+        word = '|'.join(re.escape(w) for w in sorted(words, key=lambda x: (-len(x), x)))
+        joiner = r'(?:\s*[-,]\s*|\s+(?:(?:{})\s+)?)'.format('|'.join(
+            re.escape(c) for c in conjunctions))
+        self.re = re.compile(
+            r'\b(?:{word})(?:{joiner}(?:{word}))*\b'.format(word=word, joiner=joiner),
+            re.IGNORECASE)
+        self.word_re = re.compile(r'\b(?:{})\b'.format(word), re.IGNORECASE)
+        self.name = 'word number'
+        self.errmsg = 'Expected ' + self.name
+        self.mayReturnEmpty = False
+        self.mayIndexError = False
+        self.evaluate = functools.lru_cache(maxsize=cache_size)(self._evaluate)
+
+    def _evaluate(self, phrase):
+        total = 0
+        group = 0
+        last = None
+        last_major = None
+        value = None
+        end = 0
+        for word_match in self.word_re.finditer(phrase):
+            word = word_match.group()
+            if word in self.articles:
+                if last is not None:
+                    break
+                last = 'article'
+                continue
+            if word in self.unit_table and (last in (None, 'hundred', 'major') or
+                                            (last == 'ten' and 0 < self.unit_table[word] < 10)):
+                if self.unit_table[word] == 0 and last is not None:
+                    break
+                group += self.unit_table[word]
+                last = 'unit'
+            elif word in self.tens_table and last in (None, 'hundred', 'major'):
+                group += self.tens_table[word]
+                last = 'ten'
+            elif word in self.hundred_table and (last in (None, 'article') or
+                                                 (last == 'unit' and 0 < group < 20)):
+                group = (group or 1) * self.hundred_table[word]
+                last = 'hundred'
+            elif word in self.major_table and (last in (None, 'article') or group > 0):
+                scale = self.major_table[word]
+                if last_major is not None and scale >= last_major:
+                    break
+                total += (group or 1) * scale
+                group = 0
+                last = 'major'
+                last_major = scale
+            else:
+                break
+            value = total + group
+            end = word_match.end()
+        return value, end
+
+    def parseImpl(self, instring, loc, doActions=True):
+        match = self.re.match(instring, loc)
+        if match is not None:
+            value, length = self.evaluate(match.group().lower())
+            if value is not None:
+                return loc + length, [value]
+        raise pyparsing.ParseException(instring, loc, self.errmsg, self)
+
+
+spoken_number = WordNumber()
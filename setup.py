@@ -11,4 +11,10 @@ setup(name='kronosparser',
       packages=find_packages(),
       package_data={'': ['README.rst', 'LICENSE']},
       zip_safe=False,
+      entry_points={
+          'console_scripts': [
+              'kronosparser-server=kronosparser.server:main',
+              'kronosparser-profile=kronosparser.profiler:main',
+          ]
+      },
       install_requires=[x.strip() for x in open("requirements.txt").readlines()])
@@ -0,0 +1,25 @@
+import os
+import random
+import unittest
+
+from kronosparser import adversarial
+
+
+class TestAdversarial(unittest.TestCase):
+    def test_growth_exponent(self):
+        self.assertAlmostEqual(adversarial.growth_exponent([1, 2, 4], [3, 6, 12]), 1)
+        self.assertAlmostEqual(adversarial.growth_exponent([1, 2, 4], [1, 4, 16]), 2)
+
+    def test_generators(self):
+        for name, generator in adversarial.CLASSES.items():
+            self.assertEqual(len(generator(random.Random(0), 300)), 300, name)
+
+    @unittest.skipUnless(os.environ.get('KRONOSPARSER_TIMING_TESTS'),
+                         'wall-clock test, set KRONOSPARSER_TIMING_TESTS=1 to run it')
+    def test_linear_worst_case(self):
+        # Small inputs and a loose bound, the full gate is benchmarks/adversarial.py
+        self.assertEqual(
+            adversarial.check(lengths=(150, 300, 600),
+                              samples=1,
+                              max_exponent=1.6,
+                              output=lambda line: None), [])
@@ -0,0 +1,81 @@
+import unittest
+from datetime import datetime
+
+import mock
+import pytz
+from kronosparser import batch, clock, parse_dates
+
+TEXTS = [
+    'see you tomorrow', 'now', 'call me at 5pm', 'next friday', 'in 2 hours', 'nothing here',
+    'by the end of the week'
+]
+
+
+def expected(text, reference_time, tz='US/Pacific', **kwargs):
+    with clock.use_time(reference_time):
+        return parse_dates(text, tz=tz, **kwargs)
+
+
+class TestParseHistory(unittest.TestCase):
+    def test_matches_parse_dates(self):
+        rows = []
+        for text in TEXTS:
+            for reference_time in [
+                    datetime(2019, 3, 10, 1, 30),
+                    datetime(2019, 3, 10, 11, 5),
+                    datetime(2019, 3, 10, 11, 45, 12),
+                    datetime(2020, 2, 29, 23, 59, 59),
+                    pytz.timezone('Asia/Tokyo').localize(datetime(2021, 1, 1, 8)),
+            ]:
+                rows.append((text, reference_time))
+                rows.append((text, reference_time, 'Asia/Tokyo'))
+        results = batch.parse_history(rows, interval_to_date=False)
+        self.assertEqual(len(results), len(rows))
+        for row, result in zip(rows, results):
+            self.assertEqual(result, expected(*row, interval_to_date=False), row)
+
+    def test_reuse(self):
+        rows = [('next friday', datetime(2020, 3, 11, hour)) for hour in range(24)]
+        rows += [('now', datetime(2020, 3, 11, 12, minute)) for minute in range(3)] * 2
+        with mock.patch('kronosparser.batch.find_all', wraps=batch.find_all) as find_all:
+            results = batch.parse_history(rows)
+        # The tz threshold of a date only depends on the hour, "now" on the second
+        self.assertEqual(find_all.call_count, 24 + 3)
+        self.assertEqual(results[-1], expected('now', datetime(2020, 3, 11, 12, 2)))
+        results[24][0]['parsed'] = None
+        self.assertIsNotNone(results[27][0]['parsed'])
+
+
+class TestParseBatch(unittest.TestCase):
+    def test_matches_parse_dates(self):
+        reference_time = datetime(2020, 3, 11, 19, 16, 2)
+        items = []
+        for text in TEXTS:
+            items.append(text)
+            items.append((text, 'Asia/Tokyo'))
+            items.append((text, 'Europe/Madrid', True))
+            items.append((text, None, True, False))
+        results = batch.parse_batch(items, reference_time=reference_time)
+        self.assertEqual(len(results), len(items))
+        for item, result in zip(items, results):
+            text, tz, future, interval_to_date = batch._item(item)  # pylint: disable=protected-access
+            self.assertEqual(
+                result,
+                expected(text,
+                         reference_time,
+                         tz=tz,
+                         future=future,
+                         interval_to_date=interval_to_date), item)
+
+    def test_deduplication(self):
+        items = [('friday', 'US/Eastern', future, False) for future in (True, False)] * 3
+        with mock.patch('kronosparser.batch.find_all', wraps=batch.find_all) as find_all, \
+                mock.patch('kronosparser.batch.resolve_match',
+                           wraps=batch.resolve_match) as resolve_match:
+            results = batch.parse_batch(items, reference_time=datetime(2020, 3, 11, 19))
+        self.assertEqual(find_all.call_count, 1)
+        self.assertEqual(resolve_match.call_count, 2)
+        self.assertEqual(results[0], results[2])
+        self.assertNotEqual(results[0], results[1])
+        results[0][0]['parsed'] = None
+        self.assertIsNotNone(results[2][0]['parsed'])
@@ -0,0 +1,148 @@
+import unittest
+from datetime import date, datetime, time, timedelta
+
+import mock
+from kronosparser import batch, business, parse_dates
+
+
+def utc_now_mock():
+    return datetime(2020, 3, 13, 20, 16, 2)
+
+
+def utc_today_mock():
+    return date(2020, 3, 13)
+
+
+def parsed(text, **kwargs):
+    return [(match['text'], match['parsed']) for match in parse_dates(text, **kwargs)]
+
+
+class TestBusinessCalendar(unittest.TestCase):
+    def setUp(self):
+        self.calendar = business.get_calendar('US')
+
+    def test_business_days(self):
+        self.assertTrue(self.calendar.is_business_day(date(2020, 11, 25)))
+        self.assertFalse(self.calendar.is_business_day(date(2020, 11, 26)))
+        self.assertFalse(self.calendar.is_business_day(date(2020, 11, 28)))
+        self.assertEqual(
+            self.calendar.business_days_between(date(2020, 11, 23), date(2020, 11, 30)), 4)
+
+    def test_observances_are_business_days(self):
+        self.assertTrue(self.calendar.is_business_day(date(2020, 2, 14)))
+        self.assertTrue(self.calendar.is_business_day(date(2020, 12, 24)))
+        self.assertTrue(self.calendar.is_business_day(date(2020, 4, 10)))
+        self.assertEqual(self.calendar.add_business_days(date(2020, 2, 13), 1), date(2020, 2, 14))
+        self.assertTrue(business.get_calendar('UK').is_business_day(date(2019, 10, 31)))
+        self.assertFalse(business.get_calendar('UK').is_business_day(date(2020, 4, 10)))
+
+    def test_observed_holidays(self):
+        # Independence day 2020 is a Saturday, New Year's Day 2022 too, Christmas 2022 a Sunday
+        self.assertFalse(self.calendar.is_business_day(date(2020, 7, 3)))
+        self.assertFalse(self.calendar.is_business_day(date(2021, 12, 31)))
+        self.assertFalse(self.calendar.is_business_day(date(2022, 12, 26)))
+        self.assertEqual(self.calendar.add_business_days(date(2020, 7, 2), 1), date(2020, 7, 6))
+        # Christmas and Boxing Day 2021 fall on a weekend, both are moved to the following days
+        uk = business.get_calendar('UK')
+        self.assertFalse(uk.is_business_day(date(2021, 12, 27)))
+        self.assertFalse(uk.is_business_day(date(2021, 12, 28)))
+        self.assertTrue(uk.is_business_day(date(2021, 12, 29)))
+
+    def test_add_business_days(self):
+        self.assertEqual(self.calendar.add_business_days(date(2020, 11, 25), 1), date(2020, 11, 27))
+        self.assertEqual(self.calendar.add_business_days(date(2020, 11, 28), 1), date(2020, 11, 30))
+        self.assertEqual(self.calendar.add_business_days(date(2020, 11, 28), -1),
+                         date(2020, 11, 27))
+        self.assertEqual(self.calendar.add_business_days(date(2020, 11, 30), -2),
+                         date(2020, 11, 25))
+        self.assertEqual(
+            self.calendar.add_business_days_many(
+                [date(2020, 3, 13), date(2020, 3, 14)], 3),
+            [date(2020, 3, 18), date(2020, 3, 18)])
+
+    def test_working_time(self):
+        self.assertEqual(
+            self.calendar.add_working_time(datetime(2020, 3, 13, 15), timedelta(hours=2)),
+            datetime(2020, 3, 13, 17))
+        self.assertEqual(
+            self.calendar.add_working_time(datetime(2020, 3, 13, 16), timedelta(hours=2)),
+            datetime(2020, 3, 16, 10))
+        self.assertEqual(
+            self.calendar.add_working_time(datetime(2020, 3, 14, 12), timedelta(hours=1)),
+            datetime(2020, 3, 16, 10))
+        self.assertEqual(
+            self.calendar.working_time_between(datetime(2020, 3, 13, 16), datetime(2020, 3, 16,
+                                                                                   10)),
+            timedelta(hours=2))
+
+    def test_custom_hours(self):
+        calendar = business.get_calendar('US', work_start=time(8), work_end=time(12))
+        self.assertEqual(calendar.add_working_time(datetime(2020, 3, 13, 11), timedelta(hours=2)),
+                         datetime(2020, 3, 16, 9))
+        with self.assertRaises(ValueError):
+            business.BusinessCalendar('US', work_start=time(17), work_end=time(9))
+
+    def test_out_of_range(self):
+        with self.assertRaises(ValueError):
+            self.calendar.add_business_days(date(1969, 12, 31), 1)
+
+
+@mock.patch('kronosparser.delta_time_defs.utc_now', utc_now_mock)
+@mock.patch('kronosparser.delta_time_defs.utc_today', utc_today_mock)
+class TestBusinessGrammar(unittest.TestCase):
+    def test_business_days(self):
+        self.assertEqual(parsed('in 3 business days'), [('in 3 business days', {
+            'date': '2020-03-18'
+        })])
+        self.assertEqual(parsed('2 business days ago'), [('2 business days ago', {
+            'date': '2020-03-11'
+        })])
+        self.assertEqual(parsed('in 3 business days at 5pm'), [('in 3 business days at 5pm', {
+            'datetime': '2020-03-18 17:00:00'
+        })])
+
+    def test_end_of_business_day(self):
+        self.assertEqual(parsed('by the end of the next working day'),
+                         [('end of the next working day', {
+                             'datetime': '2020-03-16 17:00:00'
+                         })])
+
+    def test_working_hours(self):
+        self.assertEqual(parsed('within 4 working hours'), [('within 4 working hours', {
+            'datetime': '2020-03-16 09:16:02-07:00'
+        })])
+        self.assertEqual(parsed('within 4 working hours', tz='US/Eastern'),
+                         [('within 4 working hours', {
+                             'datetime': '2020-03-16 12:16:02-04:00'
+                         })])
+
+    def test_locales(self):
+        self.assertEqual(parsed('en 3 días hábiles', locale='es'), [('en 3 días hábiles', {
+            'date': '2020-03-18'
+        })])
+
+    def test_huge_quantities(self):
+        error = {'datetime_parsing_error': True}
+        self.assertEqual(parsed('in 999999 business days, see you tomorrow'),
+                         [('in 999999 business days', error), ('tomorrow', {
+                             'date': '2020-03-14'
+                         })])
+        self.assertEqual(parsed('within 999999 working hours'),
+                         [('within 999999 working hours', error)])
+        self.assertEqual(parsed('by the end of 999999 business days ago'),
+                         [('end of 999999 business days ago', error)])
+
+
+class TestBusinessReferenceTime(unittest.TestCase):
+    def test_outside_of_the_calendar(self):
+        error = {'datetime_parsing_error': True}
+        rows = [(text, datetime(1960, 3, 13, 20)) for text in [
+            'next business day', 'in 3 business days', 'within 4 working hours',
+            'by the end of the next working day'
+        ]]
+        results = batch.parse_history(rows)
+        self.assertEqual([[match['parsed'] for match in result] for result in results],
+                         [[error]] * len(rows))
+        results = batch.parse_history([('next business day, see you tomorrow',
+                                        datetime(1960, 3, 13, 20))])
+        self.assertEqual([match['parsed'] for match in results[0]], [error, {'date': '1960-03-14'}])
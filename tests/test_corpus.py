@@ -0,0 +1,34 @@
+import unittest
+
+from kronosparser import corpus, parse_dates
+
+
+class TestCorpus(unittest.TestCase):
+    def test_reproducible(self):
+        self.assertEqual(list(corpus.generate(20, seed=3)), list(corpus.generate(20, seed=3)))
+        self.assertNotEqual(list(corpus.generate(20, seed=3)), list(corpus.generate(20, seed=4)))
+
+    def test_offsets(self):
+        for sample in corpus.generate(200, seed=0, density=0.8):
+            for expression in sample['expressions']:
+                self.assertEqual(sample['text'][expression['start']:expression['end']],
+                                 expression['text'])
+
+    def test_controls(self):
+        samples = list(corpus.generate(100, density=0, length=(3, 5)))
+        self.assertTrue(all(not sample['expressions'] for sample in samples))
+        self.assertTrue(all(3 <= len(sample['text'].split()) <= 5 for sample in samples))
+        samples = corpus.generate(100, density=0.9, mix={'date_ymd': 1})
+        self.assertEqual(
+            {
+                expression['production']
+                for sample in samples for expression in sample['expressions']
+            }, {'date_ymd'})
+
+    def test_parsed_at_offsets(self):
+        mix = dict.fromkeys(set(corpus.PRODUCTIONS) - {'holiday'}, 1)
+        for sample in corpus.generate(100, seed=2, density=0.7, mix=mix):
+            spans = [(match['start'], match['start'] + len(match['text'].rstrip()))
+                     for match in parse_dates(sample['text'])]
+            self.assertEqual(spans, [(expression['start'], expression['end'])
+                                     for expression in sample['expressions']], sample['text'])
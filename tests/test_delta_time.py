@@ -197,7 +197,7 @@ class TestDeltaTime(ParserTestCase):
         self.assertParsed(kronosparser.delta_time, 'Macbook pro $1999', [invalid])
 
     def test_bad_date(self):
-        data = ('2015-13-12', '2015/20/11')
+        data = ('2015-13-12', '2015/20/11', '2015-02-30', 'april 31st 2020', 'feb 29 2021')
         self.assertParsingError(data)
 
     @mock.patch('kronosparser.delta_time_defs.utc_now', side_effect=utc_now_mock)
@@ -294,6 +294,25 @@ class TestDeltaTime(ParserTestCase):
         )
         self.assertParses(data)
 
+    @mock.patch('kronosparser.delta_time_defs.utc_now', utc_now_mock)
+    @mock.patch('kronosparser.delta_time_defs.utc_today', utc_today_mock)
+    def test_compound_word_quantities(self):
+        hour = utc_now_mock().hour
+        if hour >= 12:
+            flags = {'days_delta': 1, 'tz_threshold': 24 - hour, 'utc': False}
+        else:
+            flags = {'days_delta': -1, 'tz_threshold': -hour - 1, 'utc': False}
+        data = (
+            ('in twenty five minutes', utc_now_mock() + timedelta(minutes=25), {
+                'utc': True
+            }),
+            ('forty-five minutes ago', utc_now_mock() - timedelta(minutes=45), {
+                'utc': True
+            }),
+            ('a hundred and ten days ago', utc_today_mock() - timedelta(days=110), flags),
+        )
+        self.assertParses(data)
+
     @mock.patch('kronosparser.delta_time_defs.utc_now', side_effect=utc_now_mock)
     @mock.patch('kronosparser.delta_time_defs.utc_today', side_effect=utc_today_mock)
     def test_weekday(self, utc_today_mock, utc_now_mock):
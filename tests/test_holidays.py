@@ -0,0 +1,107 @@
+import unittest
+from datetime import date, datetime
+
+import mock
+from kronosparser import holidays, parse_dates
+
+from .utils import parsed
+
+
+def utc_now_mock():
+    return datetime(2020, 3, 11, 12, 16, 2)
+
+
+def utc_today_mock():
+    return date(2020, 3, 11)
+
+
+class TestHolidayIndex(unittest.TestCase):
+    def test_rules(self):
+        index = holidays.get_index('US')
+        self.assertEqual(index.get('thanksgiving', 2020), date(2020, 11, 26))
+        self.assertEqual(index.get('memorial_day', 2021), date(2021, 5, 31))
+        self.assertEqual(index.get('labor_day', 2019), date(2019, 9, 2))
+        self.assertEqual(index.get('easter', 2024), date(2024, 3, 31))
+        self.assertEqual(index.get('good_friday', 2019), date(2019, 4, 19))
+        self.assertEqual(holidays.get_index('CA').get('victoria_day', 2020), date(2020, 5, 18))
+        self.assertEqual(
+            holidays.get_index('UK').get('spring_bank_holiday', 2020), date(2020, 5, 25))
+
+    def test_out_of_range(self):
+        index = holidays.get_index('US')
+        self.assertIsNone(index.get('christmas', holidays.LAST_YEAR + 1))
+        self.assertIsNone(index.get('boxing_day', 2020))
+
+    def test_occurrences(self):
+        index = holidays.get_index('US')
+        self.assertEqual(index.next_occurrence('christmas', date(2020, 12, 25)), date(2021, 12, 25))
+        self.assertEqual(index.next_occurrence('christmas', date(2020, 12, 24)), date(2020, 12, 25))
+        self.assertEqual(index.previous_occurrence('christmas', date(2020, 12, 25)),
+                         date(2019, 12, 25))
+        self.assertEqual(
+            index.dates_between(date(2020, 12, 1), date(2021, 1, 1)),
+            [date(2020, 12, 24),
+             date(2020, 12, 25),
+             date(2020, 12, 31),
+             date(2021, 1, 1)])
+
+    def test_unknown_region(self):
+        with self.assertRaises(ValueError):
+            holidays.get_index('XX')
+        with self.assertRaises(ValueError):
+            parse_dates('christmas', region='XX')
+
+
+@mock.patch('kronosparser.delta_time_defs.utc_now', utc_now_mock)
+@mock.patch('kronosparser.delta_time_defs.utc_today', utc_today_mock)
+class TestHolidayGrammar(unittest.TestCase):
+    def test_before_after(self):
+        self.assertEqual(parsed('after Thanksgiving'), [('after Thanksgiving', {
+            'date': '2020-11-26'
+        })])
+        self.assertEqual(parsed('2 days before christmas'), [('2 days before christmas', {
+            'date': '2020-12-23'
+        })])
+        self.assertEqual(parsed('between thanksgiving and christmas', interval_to_date=False),
+                         [('between thanksgiving and christmas', {
+                             'interval': {
+                                 'start': '2020-11-26',
+                                 'end': '2020-12-25'
+                             }
+                         })])
+
+    def test_relative(self):
+        self.assertEqual(parsed('last thanksgiving'), [('last thanksgiving', {
+            'date': '2019-11-28'
+        })])
+        self.assertEqual(parsed('next christmas at 5pm'), [('next christmas at 5pm', {
+            'datetime': '2020-12-25 17:00:00'
+        })])
+
+    def test_week_of(self):
+        self.assertEqual(parsed('the week of Memorial Day', interval_to_date=False),
+                         [('the week of Memorial Day', {
+                             'interval': {
+                                 'start': '2020-05-25',
+                                 'end': '2020-05-31'
+                             }
+                         })])
+        self.assertEqual(parsed('end of the week of christmas'), [('end of the week of christmas', {
+            'date': '2020-12-27'
+        })])
+
+    def test_regions(self):
+        self.assertEqual(parsed('thanksgiving', region='CA'), [('thanksgiving', {
+            'date': '2020-10-12'
+        })])
+        with holidays.use_region('UK'):
+            self.assertEqual(parsed('boxing day'), [('boxing day', {'date': '2020-12-26'})])
+        self.assertEqual(parsed('boxing day'), [('boxing day', {'datetime_parsing_error': True})])
+
+    def test_locales(self):
+        self.assertEqual(parsed('antes de navidad', locale='es'), [('antes de navidad', {
+            'date': '2020-12-25'
+        })])
+        self.assertEqual(parsed('depois do natal', locale='pt'), [('depois do natal', {
+            'date': '2020-12-25'
+        })])
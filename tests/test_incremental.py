@@ -0,0 +1,85 @@
+import random
+import unittest
+from datetime import date, datetime
+
+import mock
+from kronosparser import parse_dates
+from kronosparser.incremental import IncrementalParser
+
+
+def utc_now_mock():
+    return datetime(2020, 3, 11, 12, 16, 2)
+
+
+def utc_today_mock():
+    return date(2020, 3, 11)
+
+
+SENTENCES = [
+    'I need the report now, by tomorrow noon, or next week. ',
+    'Can we meet next friday at 3pm? ',
+    'The invoice was sent three days ago. ',
+    'I am out between monday and wednesday. ',
+    'Nothing to see in this sentence. ',
+    'Deadline is March 12th, 2020 or Q3 2018. ',
+]
+
+
+@mock.patch('kronosparser.delta_time_defs.utc_now', utc_now_mock)
+@mock.patch('kronosparser.delta_time_defs.utc_today', utc_today_mock)
+class TestIncrementalParser(unittest.TestCase):
+    def assertSameAsFullParse(self, session):
+        self.assertEqual(session.matches, parse_dates(session.text))
+
+    def test_typing_a_sentence(self):
+        session = IncrementalParser()
+        for character in 'see you next friday at 3pm, ok?':
+            session.edit(len(session.text), 0, character)
+        self.assertSameAsFullParse(session)
+        self.assertEqual([match['text'] for match in session.matches], ['next friday at 3pm'])
+
+    def test_edit_shifts_untouched_matches(self):
+        text = ''.join(SENTENCES * 2)
+        session = IncrementalParser(text)
+        session.edit(0, 0, 'Hello! ')
+        self.assertSameAsFullParse(session)
+        session.edit(len(text) // 2, 5, '')
+        self.assertSameAsFullParse(session)
+
+    def test_replacing_a_date(self):
+        session = IncrementalParser('ship it on monday please')
+        offset = session.text.index('monday')
+        session.edit(offset, len('monday'), 'March 3rd')
+        self.assertSameAsFullParse(session)
+        self.assertEqual(session.matches[0]['text'].strip(), 'March 3rd')
+
+    def test_random_edits(self):
+        generator = random.Random(7)
+        session = IncrementalParser(''.join(SENTENCES))
+        for _ in range(15):
+            offset = generator.randint(0, len(session.text))
+            deleted = generator.randint(0, min(10, len(session.text) - offset))
+            inserted = generator.choice(['', ' ', 'x', 'tomorrow ', ' next week', '2020-01-05 '])
+            session.edit(offset, deleted, inserted)
+            self.assertSameAsFullParse(session)
+
+    def test_edits_far_apart(self):
+        session = IncrementalParser(''.join(SENTENCES * 4))
+        for offset in [len(session.text) - 10, 5, len(session.text) // 2, 0, 40]:
+            session.edit(offset, 3, 'tomorrow ')
+            session.edit(offset + 9, 0, 'x')
+        self.assertSameAsFullParse(session)
+        window = session.edit(0, 0, 'today ')
+        self.assertSameAsFullParse(session)
+        self.assertEqual(window, session.matches[:len(window)])
+        self.assertEqual(window[0]['start'], 0)
+
+    def test_timezone_and_region(self):
+        session = IncrementalParser('reply within 4 working hours', tz='Asia/Tokyo', region='UK')
+        session.edit(len(session.text), 0, ', ship it in 3 business days')
+        self.assertEqual(session.matches, parse_dates(session.text, tz='Asia/Tokyo', region='UK'))
+        self.assertEqual(session.matches[0]['parsed'], {'datetime': '2020-03-12 13:00:00+09:00'})
+
+    def test_edit_out_of_range(self):
+        with self.assertRaises(ValueError):
+            IncrementalParser('today').edit(3, 10, '')
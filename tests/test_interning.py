@@ -0,0 +1,54 @@
+import unittest
+from datetime import datetime
+
+from kronosparser import batch, parse_dates
+from kronosparser.interning import InternPool
+from kronosparser.utils import MatchList
+
+
+class TestInternPool(unittest.TestCase):
+    def test_shared_values(self):
+        pool = InternPool()
+        first = pool.value({'interval': {'start': '2020-03-16', 'end': '2020-03-22'}})
+        second = pool.value({'interval': {'end': '2020-03-22', 'start': '2020-03-16'}})
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+        self.assertIs(first['interval']['start'], second['interval']['start'])
+        self.assertIs(pool.value({'date': '2020-03-16'}), pool.value({'date': '2020-03-16'}))
+        self.assertIsNot(pool.value({'a': True}), pool.value({'a': 1}))
+        self.assertEqual(pool.value(['x', ('y', None)]), ['x', ('y', None)])
+
+    def test_matches(self):
+        pool = InternPool()
+        matches = parse_dates('tomorrow or tomorrow')
+        matches.truncated = True
+        interned = pool.matches(matches)
+        self.assertIsInstance(interned, MatchList)
+        self.assertTrue(interned.truncated)
+        self.assertFalse(interned.fast)
+        self.assertEqual(interned, matches)
+        self.assertIs(interned[0]['parsed'], interned[1]['parsed'])
+        self.assertIs(pool.matches(matches)[1], interned[1])
+        interned = pool.matches(parse_dates('nothing to see here'))
+        self.assertTrue(interned.fast)
+        self.assertFalse(interned.truncated)
+
+    def test_maxsize(self):
+        pool = InternPool(maxsize=3)
+        for day in range(1, 10):
+            pool.value('2020-03-0{}'.format(day))
+        self.assertLessEqual(len(pool), 3)
+        pool.clear()
+        self.assertEqual(len(pool), 0)
+
+    def test_batches(self):
+        reference_time = datetime(2020, 3, 11, 19)
+        items = ['see you tomorrow', ('tomorrow', 'Asia/Tokyo'), 'see you tomorrow', 'next week']
+        pool = InternPool()
+        results = batch.parse_batch(items, reference_time=reference_time, pool=pool)
+        self.assertEqual(results, batch.parse_batch(items, reference_time=reference_time))
+        self.assertIs(results[0][0], results[2][0])
+        rows = [('see you tomorrow', reference_time), ('tomorrow', reference_time)]
+        history = batch.parse_history(rows, pool=pool)
+        self.assertEqual(history, batch.parse_history(rows))
+        self.assertIs(history[0][0]['parsed'], history[1][0]['parsed'])
@@ -0,0 +1,92 @@
+import random
+import unittest
+from datetime import date, datetime, timedelta
+
+import mock
+
+from kronosparser import parse_dates
+from kronosparser.interval_index import IntervalIndex
+from kronosparser.time_interval import TimeInterval
+
+
+def utc_now_mock():
+    return datetime(2020, 3, 11, 12, 16, 2)
+
+
+def utc_today_mock():
+    return date(2020, 3, 11)
+
+
+def random_intervals(count, seed):
+    rng = random.Random(seed)
+    origin = datetime(2020, 1, 1)
+    intervals = []
+    for _ in range(count):
+        start = origin + timedelta(hours=rng.randrange(24 * 365))
+        intervals.append(TimeInterval(start, start + timedelta(hours=rng.randrange(1, 24 * 14))))
+    return intervals
+
+
+def brute_force_overlap(intervals, start, end):
+    return sorted(
+        (interval
+         for interval in intervals if interval.get_start() <= end and interval.get_end() >= start),
+        key=lambda interval: (interval.get_start(), interval.get_end()))
+
+
+class TestIntervalIndex(unittest.TestCase):
+    def setUp(self):
+        self.intervals = random_intervals(1000, seed=1)
+
+    def assert_matches_brute_force(self, index, intervals):
+        rng = random.Random(2)
+        for _ in range(200):
+            start = datetime(2020, 1, 1) + timedelta(hours=rng.randrange(-24 * 30, 24 * 400))
+            end = start + timedelta(hours=rng.randrange(0, 24 * 3))
+            self.assertEqual(index.overlap(start, end), brute_force_overlap(intervals, start, end))
+
+    def test_bulk_build(self):
+        self.assert_matches_brute_force(IntervalIndex(self.intervals), self.intervals)
+
+    def test_incremental_insert(self):
+        index = IntervalIndex()
+        for interval in self.intervals:
+            index.add(interval)
+        self.assertEqual(len(index), len(self.intervals))
+        self.assert_matches_brute_force(index, self.intervals)
+
+    def test_stab(self):
+        index = IntervalIndex([(TimeInterval(date(2020, 3, 1), date(2020, 3, 10)), 'march'),
+                               (TimeInterval(datetime(2020, 3, 5, 9), datetime(2020, 3, 5,
+                                                                               10)), 'meeting')])
+        self.assertEqual(index.stab(date(2020, 3, 5)), ['march', 'meeting'])
+        self.assertEqual(index.stab(datetime(2020, 3, 5, 11)), ['march'])
+        self.assertEqual(index.stab(date(2020, 3, 11)), [])
+
+    def test_nearest(self):
+        index = IntervalIndex()
+        for interval in self.intervals:
+            index.add(interval)
+        rng = random.Random(3)
+        for _ in range(200):
+            point = datetime(2020, 1, 1) + timedelta(hours=rng.randrange(-24 * 30, 24 * 400))
+            expected = min(
+                max((interval.get_start() -
+                     point).total_seconds(), (point - interval.get_end()).total_seconds(), 0)
+                for interval in self.intervals)
+            nearest = index.nearest(point)
+            distance = max((nearest.get_start() - point).total_seconds(),
+                           (point - nearest.get_end()).total_seconds(), 0)
+            self.assertEqual(distance, expected)
+        self.assertIsNone(IntervalIndex().nearest(date(2020, 1, 1)))
+
+    @mock.patch('kronosparser.delta_time_defs.utc_now', utc_now_mock)
+    @mock.patch('kronosparser.delta_time_defs.utc_today', utc_today_mock)
+    def test_from_matches(self):
+        matches = parse_dates('free next week, busy on march 17th, good morning',
+                              interval_to_date=False)
+        index = IntervalIndex.from_matches(matches)
+        self.assertEqual(len(index), 2)
+        self.assertEqual([match['text'] for match in index.stab(date(2020, 3, 17))],
+                         ['next week', 'march 17th'])
+        self.assertEqual(index.nearest(date(2020, 3, 30))['text'], 'next week')
@@ -0,0 +1,56 @@
+import json
+import unittest
+from datetime import datetime
+
+from kronosparser import Parser, ir
+
+
+def parsed(matches):
+    return [(match['text'], match['parsed'], match['start']) for match in matches]
+
+
+class TestIR(unittest.TestCase):
+    def test_round_trip(self):
+        nodes = json.loads(json.dumps(ir.compile_ir('see you next friday at 3pm')))
+        self.assertEqual([(node['text'], node['start'], node['end']) for node in nodes],
+                         [('next friday at 3pm', 8, 26)])
+        self.assertEqual(parsed(ir.evaluate(nodes, datetime(2020, 3, 11, 19))),
+                         [('next friday at 3pm', {
+                             'datetime': '2020-03-13 15:00:00'
+                         }, 8)])
+        self.assertEqual(parsed(ir.evaluate(nodes, datetime(2020, 3, 14, 19))),
+                         [('next friday at 3pm', {
+                             'datetime': '2020-03-20 15:00:00'
+                         }, 8)])
+
+    def test_stale_nodes(self):
+        nodes = ir.compile_ir('see you next friday at 3pm')
+        self.assertEqual(nodes[0]['production'], 'datetime_spec')
+        self.assertEqual(nodes[0]['version'], ir.GRAMMAR_VERSION)
+        for key, value in (('version', ir.GRAMMAR_VERSION - 1), ('production', 'no_such_rule')):
+            stale = [dict(nodes[0], **{key: value})]
+            with self.assertRaises(ValueError):
+                ir.evaluate(stale, datetime(2020, 3, 11, 19))
+
+    def test_same_as_parsing(self):
+        texts = [
+            'call me tomorrow at 5pm or next week', 'in 3 business days', 'two weeks ago',
+            'every other monday at noon', 'by the end of the month', 'the week of thanksgiving',
+            'on 2/30/2020', 'at 5', 'nothing here'
+        ]
+        for text in texts:
+            nodes = ir.compile_ir(text)
+            for reference_time in (datetime(2020, 3, 11, 4), datetime(2021, 11, 30, 23, 59)):
+                for tz, future in (('US/Pacific', False), ('Asia/Tokyo', True)):
+                    expected = Parser(future=future, tz=tz,
+                                      cache_size=0).parse(text, reference_time=reference_time)
+                    self.assertEqual(ir.evaluate(nodes, reference_time, future=future, tz=tz),
+                                     list(expected))
+
+    def test_locale(self):
+        nodes = ir.compile_ir('nos vemos mañana a las 3pm', locale='es')
+        self.assertEqual(nodes[0]['locale'], 'es')
+        self.assertEqual(parsed(ir.evaluate(nodes, datetime(2020, 3, 11, 19))),
+                         [('mañana a las 3pm', {
+                             'datetime': '2020-03-12 15:00:00'
+                         }, 10)])
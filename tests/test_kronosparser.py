@@ -1,8 +1,9 @@
+import time
 import unittest
 
 import mock
 from dateutil import parser as date_parser
-from kronosparser import parse_dates
+from kronosparser import first_date, has_date, parse_dates, parse_span, parse_spans
 
 
 def utc_now_mock():
@@ -106,3 +107,109 @@ class TestKronosParserIntervalNotToDate(unittest.TestCase):
             'text': 'friday'
         }]
         self.assertEqual(parsed_date, expected_parse)
+
+
+def utc_today_mock():
+    return utc_now_mock().date()
+
+
+@mock.patch('kronosparser.delta_time_defs.utc_now', utc_now_mock)
+@mock.patch('kronosparser.delta_time_defs.utc_today', utc_today_mock)
+class TestKronosParserEarlyExit(unittest.TestCase):
+    text = 'good morning, the report is due tomorrow noon ' + 'and nothing else ' * 500
+
+    def test_has_date(self):
+        self.assertTrue(has_date(self.text))
+        self.assertFalse(has_date('on february 30th'))
+        self.assertFalse(has_date('$2020'))
+        self.assertTrue(has_date('on february 30th, or march 1st'))
+        self.assertEqual(has_date(self.text), first_date(self.text) is not None)
+        self.assertFalse(has_date('good morning, nothing to see here'))
+        self.assertFalse(has_date(''))
+
+    def test_first_date(self):
+        self.assertEqual(
+            first_date(self.text), {
+                'end': 45,
+                'parsed': {
+                    'datetime': '2020-03-12 12:00:00'
+                },
+                'start': 32,
+                'text': 'tomorrow noon'
+            })
+        self.assertIsNone(first_date('good morning, nothing to see here'))
+
+    def test_max_matches(self):
+        text = 'today, tomorrow or next week'
+        self.assertEqual(parse_dates(text, max_matches=2), parse_dates(text)[:2])
+        self.assertEqual(parse_dates(text, max_matches=0), [])
+
+    def test_max_length(self):
+        matches = parse_dates('today, tomorrow or next week', max_length=12)
+        self.assertEqual([match['text'] for match in matches], ['today'])
+        self.assertTrue(matches.truncated)
+        self.assertFalse(parse_dates('today, tomorrow or next week').truncated)
+
+    def test_max_time(self):
+        text = '1:2:' * 5000
+        start = time.monotonic()
+        matches = parse_dates(text, max_time=0.05)
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertTrue(matches.truncated)
+        self.assertTrue(parse_dates('tomorrow', deadline=time.monotonic() - 1).truncated)
+
+    def test_long_numbers(self):
+        self.assertEqual(parse_dates('9' * 5000), [])
+        # The tail of a longer number is not a quantity
+        self.assertEqual(parse_dates('1234567890 minutes ago'), [])
+        self.assertEqual(parse_dates('in 12345678901234 days'), [])
+
+    def test_huge_quantities(self):
+        # Out of the years datetime supports, which only fails the expression itself
+        for text in [
+                'in 999999999 days', '999999999 weeks ago', 'in 99999 years', '99999 years ago',
+                'in 99999 months', 'in 999999999 hours', '99999 years after friday',
+                '999999999 days before tomorrow'
+        ]:
+            for future in (False, True):
+                self.assertEqual([match['parsed'] for match in parse_dates(text, future=future)],
+                                 [{
+                                     'datetime_parsing_error': True
+                                 }], text)
+        self.assertEqual([match['parsed'] for match in parse_dates('in 99999 years or tomorrow')],
+                         [{
+                             'datetime_parsing_error': True
+                         }, {
+                             'date': '2020-03-12'
+                         }])
+
+
+@mock.patch('kronosparser.delta_time_defs.utc_now', utc_now_mock)
+@mock.patch('kronosparser.delta_time_defs.utc_today', utc_today_mock)
+class TestKronosParserSpans(unittest.TestCase):
+    text = 'I need the report now, by tomorrow noon, or next week'
+
+    def test_parse_span(self):
+        self.assertEqual(parse_span(self.text, 23, 39), [{
+            'end': 39,
+            'parsed': {
+                'datetime': '2020-03-12 12:00:00'
+            },
+            'start': 26,
+            'text': 'tomorrow noon'
+        }])
+        self.assertEqual([match['parsed'] for match in parse_span(self.text, 26, 34)],
+                         [match['parsed'] for match in parse_dates('tomorrow')])
+        self.assertEqual(parse_span(self.text, 23), parse_dates(self.text)[1:])
+
+    def test_anchored(self):
+        self.assertEqual([match['text'] for match in parse_span(self.text, 26, anchored=True)],
+                         ['tomorrow noon'])
+        self.assertEqual(parse_span(self.text, 0, anchored=True), [])
+
+    def test_parse_spans(self):
+        spans = [(match['start'], match['end']) for match in parse_dates(self.text)]
+        self.assertEqual([parse_spans(self.text, spans, anchored=True)],
+                         [[[match] for match in parse_dates(self.text)]])
+        with self.assertRaises(ValueError):
+            parse_spans(self.text, [(40, 30)])
@@ -0,0 +1,30 @@
+import re
+import unittest
+
+from kronosparser import lexicon
+
+
+class TestLexicon(unittest.TestCase):
+    def test_tables_are_frozen(self):
+        with self.assertRaises(TypeError):
+            lexicon.MONTHS['smarch'] = 13
+
+    def test_ordinal_days(self):
+        self.assertEqual(lexicon.ORDINAL_DAYS['1st'], 1)
+        self.assertEqual(lexicon.ORDINAL_DAYS['12th'], 12)
+        self.assertEqual(lexicon.ORDINAL_DAYS['22nd'], 22)
+        self.assertEqual(lexicon.ORDINAL_DAYS['31st'], 31)
+        self.assertNotIn('32nd', lexicon.ORDINAL_DAYS)
+
+    def test_keyword_pattern_prefers_longest(self):
+        pattern = re.compile(lexicon.keyword_pattern(lexicon.MONTH_NAMES), re.IGNORECASE)
+        self.assertEqual(pattern.match('September 5').group(), 'September')
+        self.assertEqual(pattern.match('sept. 5').group(), 'sept')
+        self.assertIsNone(pattern.match('mayday'))
+
+    def test_lookup_ignores_case(self):
+        weekday = lexicon.lookup(lexicon.WEEKDAYS)
+        self.assertEqual(weekday('friday'), 4)
+        self.assertEqual(weekday('Friday'), 4)
+        self.assertEqual(weekday('FRI.'), 4)
+        self.assertEqual(weekday('fRiDaY'), 4)
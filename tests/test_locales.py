@@ -0,0 +1,69 @@
+import subprocess
+import sys
+import unittest
+from datetime import date, datetime
+
+import mock
+from kronosparser import locales, parse_dates
+
+
+def utc_now_mock():
+    return datetime(2020, 3, 11, 12, 16, 2)
+
+
+def utc_today_mock():
+    return date(2020, 3, 11)
+
+
+def parsed(text, locale):
+    return [(match['text'], match['parsed']) for match in parse_dates(text, locale=locale)]
+
+
+class TestLocales(unittest.TestCase):
+    def test_english_process_does_not_build_other_locales(self):
+        output = subprocess.check_output([
+            sys.executable, '-c', 'import sys, kronosparser; kronosparser.parse_dates("today"); '
+            'print(kronosparser.locales.loaded_locales(), "kronosparser.locales.es" in sys.modules)'
+        ])
+        self.assertEqual(output.decode().strip(), "['en'] False")
+
+    def test_grammar_is_cached(self):
+        self.assertIs(locales.get_grammar('es'), locales.get_grammar('es-MX'))
+        self.assertIs(locales.get_grammar('pt_BR'), locales.get_grammar('pt'))
+        self.assertIs(locales.get_grammar(None).delta_time, locales.get_grammar('en').delta_time)
+
+    def test_unsupported_locale(self):
+        with self.assertRaises(ValueError):
+            locales.get_grammar('xx')
+
+    @mock.patch('kronosparser.delta_time_defs.utc_now', utc_now_mock)
+    @mock.patch('kronosparser.delta_time_defs.utc_today', utc_today_mock)
+    def test_spanish(self):
+        self.assertEqual(parsed('nos vemos mañana a las 3pm', 'es'),
+                         [('mañana a las 3pm', {
+                             'datetime': '2020-03-12 15:00:00'
+                         })])
+        self.assertEqual(parsed('llegó hace 3 días', 'es'), [('hace 3 días', {
+            'date': '2020-03-08'
+        })])
+        self.assertEqual(parsed('el próximo lunes', 'es'), [('próximo lunes', {
+            'date': '2020-03-16'
+        })])
+        self.assertEqual(parsed('el 3 de abril', 'es'), [('3 de abril', {'date': '2020-04-03'})])
+        self.assertEqual(parsed('a finales de mayo', 'es'), [('finales de mayo', {
+            'date': '2020-05-31'
+        })])
+
+    @mock.patch('kronosparser.delta_time_defs.utc_now', utc_now_mock)
+    @mock.patch('kronosparser.delta_time_defs.utc_today', utc_today_mock)
+    def test_portuguese(self):
+        self.assertEqual(parsed('até amanhã ao meio-dia', 'pt'), [('amanhã ao meio-dia', {
+            'datetime': '2020-03-12 12:00:00'
+        })])
+        self.assertEqual(parsed('3 dias atrás', 'pt'), [('3 dias atrás', {'date': '2020-03-08'})])
+        self.assertEqual(parsed('na próxima sexta-feira', 'pt'), [('próxima sexta-feira', {
+            'date': '2020-03-13'
+        })])
+        self.assertEqual(parsed('em vinte e cinco dias', 'pt'), [('em vinte e cinco dias', {
+            'date': '2020-04-05'
+        })])
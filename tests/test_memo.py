@@ -0,0 +1,78 @@
+import threading
+import unittest
+from datetime import datetime
+
+from kronosparser import Parser, metrics
+from kronosparser.memo import SpanMemo
+
+
+class TestSpanMemo(unittest.TestCase):
+    def setUp(self):
+        self.memo = SpanMemo()
+        self.reference_time = datetime(2020, 3, 11, 19, 16, 2)
+
+    def test_same_as_parser(self):
+        texts = [
+            'call me tomorrow', 'tomorrow works for me', 'tomorrow at 3pm', 'next friday at 3pm',
+            'see you next friday at 3pm', 'by the end of the month', 'in 2 hours', 'right now',
+            'on 2/30/2020', 'every other monday at noon'
+        ]
+        for tz in ('US/Pacific', 'Asia/Tokyo'):
+            parser = Parser(tz=tz, cache_size=0)
+            for text in texts:
+                self.assertEqual(self.memo.parse(text, self.reference_time, tz=tz),
+                                 parser.parse(text, reference_time=self.reference_time))
+        self.assertEqual(self.memo.hits, 4)
+
+    def test_ignored_spans(self):
+        parser = Parser(cache_size=0)
+        texts = ['good morning', '2015-13-12', '2020/20/11', 'good afternoon, see you tomorrow']
+        for text in texts:
+            self.assertEqual(self.memo.parse(text, self.reference_time),
+                             parser.parse(text, reference_time=self.reference_time))
+        self.assertEqual(
+            self.memo.parse('good afternoon, see you tomorrow', self.reference_time)[0]['parsed'],
+            {'datetime_parsing_error': True})
+
+    def test_reference_time(self):
+        # 'tomorrow' only depends on the hour, 'in 2 hours' on the second
+        self.memo.parse('tomorrow, in 2 hours', self.reference_time)
+        self.memo.parse('tomorrow, in 2 hours', self.reference_time.replace(second=30))
+        self.assertEqual(self.memo.stats()['hits'], 1)
+        matches = self.memo.parse('in 2 hours', datetime(2020, 3, 12, 19, 16, 2))
+        self.assertEqual(matches[0]['parsed'], {'datetime': '2020-03-12 14:16:02-07:00'})
+
+    def test_stats_and_bound(self):
+        memo = SpanMemo(maxsize=2).warm_up(['today', 'tomorrow', 'yesterday'], self.reference_time)
+        self.assertEqual(len(memo), 2)
+        memo.parse('yesterday', self.reference_time)
+        self.assertEqual(memo.stats(), {'hits': 1, 'misses': 3, 'size': 2, 'hit_rate': 0.25})
+        memo.clear()
+        self.assertEqual(memo.stats()['size'], 0)
+
+    def test_metrics(self):
+        registry = metrics.enable()
+        try:
+            self.memo.parse('today or today', self.reference_time)
+        finally:
+            metrics.disable()
+        counters = registry.snapshot()['counters']
+        self.assertEqual(
+            counters['kronosparser_cache_requests_total', (('cache', 'span'), ('result', 'hit'))],
+            1)
+
+    def test_threads(self):
+        expected = Parser(cache_size=0).parse('tomorrow at noon',
+                                              reference_time=self.reference_time)
+        results = []
+
+        def work():
+            for _ in range(5):
+                results.append(self.memo.parse('tomorrow at noon', self.reference_time))
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertTrue(all(result == expected for result in results))
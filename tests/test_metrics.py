@@ -0,0 +1,72 @@
+import unittest
+from datetime import datetime
+
+from kronosparser import Parser, metrics, parse_dates
+from kronosparser.batch import parse_history
+
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self):
+        self.registry = metrics.enable()
+
+    def tearDown(self):
+        metrics.disable()
+
+    def counters(self):
+        return self.registry.snapshot()['counters']
+
+    def test_parse_dates(self):
+        parse_dates('see you tomorrow or on 2/30/2020')
+        parse_dates('nothing to see here')
+        snapshot = self.registry.snapshot()
+        self.assertEqual(
+            snapshot['counters'], {
+                ('kronosparser_parses_total', (('path', 'grammar'), )): 1,
+                ('kronosparser_parses_total', (('path', 'fast'), )): 1,
+                ('kronosparser_parsing_errors_total', ()): 1,
+            })
+        buckets, total, count = snapshot['histograms']['kronosparser_matches', ()]
+        self.assertEqual((buckets[:3], total, count), ([1, 0, 1], 2, 2))
+        self.assertEqual(snapshot['histograms']['kronosparser_text_length_chars', ()][1], 51)
+
+    def test_cache(self):
+        parser = Parser(clock=lambda: datetime(2020, 3, 11, 19, 16, 2))
+        parser.parse('tomorrow')
+        parser.parse('tomorrow')
+        parse_history([('today', datetime(2020, 3, 11, 12))] * 2)
+        counters = self.counters()
+        for cache in ('parser', 'history'):
+            for result in ('hit', 'miss'):
+                self.assertEqual(
+                    counters['kronosparser_cache_requests_total',
+                             (('cache', cache), ('result', result))], 1)
+
+    def test_parser_scan_path(self):
+        parser = Parser(clock=lambda: datetime(2020, 3, 11, 19, 16, 2))
+        for text in ('nothing to see here', 'nothing to see here', 'tomorrow'):
+            parser.parse(text)
+        counters = self.counters()
+        self.assertEqual(counters['kronosparser_parses_total', (('path', 'fast'), )], 2)
+        self.assertEqual(counters['kronosparser_parses_total', (('path', 'grammar'), )], 1)
+
+    def test_exporter(self):
+        observed = []
+        metrics.enable(exporter=lambda name, value, labels: observed.append((name, labels)))
+        parse_dates('today')
+        self.assertIn(('kronosparser_parses_total', {'path': 'grammar'}), observed)
+
+    def test_prometheus(self):
+        parse_dates('today')
+        merged = metrics.merge(self.registry.snapshot(), self.registry.snapshot())
+        text = metrics.prometheus(merged)
+        self.assertIn('# TYPE kronosparser_parse_seconds histogram\n', text)
+        self.assertIn('kronosparser_parses_total{path="grammar"} 2\n', text)
+        self.assertIn('kronosparser_matches_bucket{le="1"} 2\n', text)
+        self.assertIn('kronosparser_matches_bucket{le="+Inf"} 2\n', text)
+        self.assertIn('kronosparser_matches_count 2\n', text)
+
+    def test_disabled(self):
+        metrics.disable()
+        parse_dates('today')
+        self.assertEqual(metrics.prometheus(), '')
+        self.assertEqual(self.counters(), {})
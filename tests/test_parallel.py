@@ -0,0 +1,67 @@
+import random
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+
+import mock
+from kronosparser import parse_dates
+from kronosparser.locales import get_grammar
+from kronosparser.parallel import crosses, parse_document, split_points
+
+
+def utc_now_mock():
+    return datetime(2020, 3, 11, 12, 16, 2)
+
+
+def utc_today_mock():
+    return date(2020, 3, 11)
+
+
+def document(words=1000):
+    rng = random.Random(0)
+    vocabulary = ('we meet tomorrow at 5pm . next friday , march 3rd 2020 the report is late \n by '
+                  'the end of the week every other monday in 3 business days 10:30 am and then a b '
+                  'c 12/03 thanksgiving').split(' ')
+    return ' '.join(rng.choice(vocabulary) for _ in range(words))
+
+
+@mock.patch('kronosparser.delta_time_defs.utc_now', utc_now_mock)
+@mock.patch('kronosparser.delta_time_defs.utc_today', utc_today_mock)
+class TestParallel(unittest.TestCase):
+    def test_crosses(self):
+        expression = get_grammar().delta_time
+        text = 'call me tomorrow\nat 5pm. Thanks!'
+        self.assertTrue(crosses(text, expression, text.index('at')))
+        self.assertFalse(crosses(text, expression, text.index('Thanks')))
+
+    def test_split_points(self):
+        text = document()
+        points = split_points(text, get_grammar().delta_time, chunk_size=300)
+        self.assertGreater(len(points), 5)
+        self.assertEqual(points, sorted(points))
+        for match in parse_dates(text):
+            self.assertFalse(any(match['start'] < point < match['end'] for point in points))
+
+    def test_parse_document(self):
+        text = document()
+        with ThreadPoolExecutor(4) as executor:
+            self.assertEqual(parse_document(text, chunk_size=300, executor=executor),
+                             parse_dates(text))
+        self.assertEqual(parse_document('tomorrow at 5pm'), parse_dates('tomorrow at 5pm'))
+
+    def test_process_pool(self):
+        text = document(500)
+        self.assertEqual(parse_document(text, chunk_size=500, workers=2), parse_dates(text))
+
+
+class TestParallelReferenceTime(unittest.TestCase):
+    def test_pieces_share_the_reference_time(self):
+        text = 'ping me in 5 minutes. ' * 100
+        with ThreadPoolExecutor(4) as executor:
+            matches = parse_document(text,
+                                     chunk_size=300,
+                                     executor=executor,
+                                     reference_time=datetime(2020, 3, 11, 12, 16, 2))
+        self.assertEqual(len(matches), 100)
+        self.assertEqual({match['parsed']['datetime']
+                          for match in matches}, {'2020-03-11 05:21:02-07:00'})
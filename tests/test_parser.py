@@ -0,0 +1,73 @@
+import threading
+import unittest
+from datetime import datetime
+
+import pytz
+from kronosparser import Parser
+
+
+def parsed(matches):
+    return [(match['text'], match['parsed']) for match in matches]
+
+
+class TestParser(unittest.TestCase):
+    def setUp(self):
+        self.parser = Parser(clock=lambda: datetime(2020, 3, 11, 19, 16, 2))
+
+    def test_clock(self):
+        self.assertEqual(parsed(self.parser.parse('tomorrow, or right now')), [
+            ('tomorrow', {
+                'date': '2020-03-12'
+            }),
+            ('now', {
+                'datetime': '2020-03-11 12:16:02-07:00'
+            }),
+        ])
+
+    def test_reference_time(self):
+        reference = pytz.timezone('Europe/Madrid').localize(datetime(2019, 12, 31, 10))
+        self.assertEqual(parsed(self.parser.parse('tomorrow', reference_time=reference)),
+                         [('tomorrow', {
+                             'date': '2020-01-01'
+                         })])
+        self.assertEqual(parsed(Parser(tz='Europe/Madrid').parse('now', reference_time=reference)),
+                         [('now', {
+                             'datetime': '2019-12-31 10:00:00+01:00'
+                         })])
+
+    def test_parse_many(self):
+        self.assertEqual([parsed(matches) for matches in self.parser.parse_many(['today', 'nope'])],
+                         [[('today', {
+                             'date': '2020-03-11'
+                         })], []])
+
+    def test_cache(self):
+        first = self.parser.parse('next friday')
+        first[0]['parsed']['date'] = None
+        self.assertEqual(parsed(self.parser.parse('next friday')), [('next friday', {
+            'date': '2020-03-13'
+        })])
+
+    def test_threads(self):
+        parsers = [
+            Parser(clock=lambda: datetime(2020, 3, 11, 19), cache_size=0),
+            Parser(tz='Asia/Tokyo', clock=lambda: datetime(2021, 6, 1, 20), cache_size=0),
+        ]
+        expected = [
+            parser.parse('tomorrow at 5pm, or within 2 working hours') for parser in parsers
+        ]
+        failures = []
+
+        def work(index):
+            for _ in range(20):
+                if parsers[index].parse(
+                        'tomorrow at 5pm, or within 2 working hours') != expected[index]:
+                    failures.append(index)
+
+        threads = [threading.Thread(target=work, args=(index % 2, )) for index in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertNotEqual(expected[0], expected[1])
+        self.assertEqual(failures, [])
@@ -0,0 +1,42 @@
+import io
+import unittest
+
+import mock
+
+from kronosparser import get_grammar, utils
+from kronosparser.profiler import Profiler, main, read_texts
+
+
+class TestProfiler(unittest.TestCase):
+    def test_stacks(self):
+        profiler = Profiler().run(['see you next friday at 3pm', 'no dates here'])
+        frames = {frame for stack in profiler.stacks for frame in stack.split(';')}
+        self.assertTrue({
+            'scan', 'delta_time', 'weekday_ref', 'time_of_day',
+            'past_future_wrap(tz_decorate(convert_to_day))', 'set_datetime', 'resolve_match',
+            'set_dates_with_timezone_fixes'
+        } <= frames)
+        self.assertTrue(
+            all(
+                line.startswith('scan') or line.startswith('resolve_match')
+                for line in profiler.collapsed()))
+
+    def test_uninstalled(self):
+        expression = get_grammar().delta_time
+        actions = list(expression.parseAction)
+        Profiler().run(['tomorrow'])
+        self.assertNotIn('_parse', vars(expression))
+        self.assertEqual(expression.parseAction, actions)
+        self.assertEqual(utils.set_dates_with_timezone_fixes.__name__,
+                         'set_dates_with_timezone_fixes')
+
+    def test_read_texts(self):
+        stream = io.StringIO('{"text": "tomorrow", "expressions": []}\n\nnext week\n')
+        self.assertEqual(list(read_texts(stream)), ['tomorrow', 'next week'])
+
+    def test_main(self):
+        with mock.patch('sys.stdout', new_callable=io.StringIO) as stdout, \
+                mock.patch('sys.stderr', new_callable=io.StringIO) as stderr:
+            main(['--count', '5', '--top', '3'])
+        self.assertTrue(stdout.getvalue().startswith('resolve_match'))
+        self.assertEqual(len(stderr.getvalue().splitlines()), 3)
@@ -0,0 +1,139 @@
+import itertools
+import unittest
+from datetime import date, datetime, time
+
+import mock
+from kronosparser.recurrence import Recurrence
+
+from .utils import parsed
+
+
+def utc_now_mock():
+    return datetime(2020, 3, 11, 12, 16, 2)
+
+
+def utc_today_mock():
+    return date(2020, 3, 11)
+
+
+class TestRecurrence(unittest.TestCase):
+    def test_iteration_is_lazy(self):
+        every_day = Recurrence(date(2020, 1, 1))
+        self.assertEqual(list(itertools.islice(every_day, 3)),
+                         [date(2020, 1, 1), date(2020, 1, 2),
+                          date(2020, 1, 3)])
+
+    def test_between(self):
+        every_other_monday = Recurrence(date(2020, 1, 6), unit='week', interval=2, time=time(9))
+        self.assertEqual(list(every_other_monday.between(date(2020, 3, 1), date(2020, 3, 31))), [
+            datetime(2020, 3, 2, 9),
+            datetime(2020, 3, 16, 9),
+            datetime(2020, 3, 30, 9),
+        ])
+        self.assertEqual(
+            list(every_other_monday.between(datetime(2020, 3, 2, 10), datetime(2020, 3, 16, 9))),
+            [datetime(2020, 3, 16, 9)])
+        self.assertEqual(list(every_other_monday.between(date(2019, 1, 1), date(2020, 1, 10))),
+                         [datetime(2020, 1, 6, 9)])
+
+    def test_far_future_window(self):
+        every_day = Recurrence(date(2020, 1, 1))
+        self.assertEqual(list(every_day.between(date(9999, 12, 30), date(9999, 12, 31))),
+                         [date(9999, 12, 30), date(9999, 12, 31)])
+
+    def test_iteration_ends_at_year_9999(self):
+        self.assertEqual(
+            list(Recurrence(date(9999, 12, 29))),
+            [date(9999, 12, 29), date(9999, 12, 30),
+             date(9999, 12, 31)])
+        self.assertEqual(list(Recurrence(date(9998, 6, 15), unit='year')),
+                         [date(9998, 6, 15), date(9999, 6, 15)])
+        self.assertEqual(
+            list(
+                Recurrence(date(9999, 11, 1), unit='month').between(date(9999, 1, 1),
+                                                                    datetime.max)),
+            [date(9999, 11, 1), date(9999, 12, 1)])
+
+    def test_month_end(self):
+        monthly = Recurrence(date(2020, 1, 31), unit='month')
+        self.assertEqual(
+            list(monthly.between(date(2020, 2, 1), date(2020, 4, 30))),
+            [date(2020, 2, 29), date(2020, 3, 31),
+             date(2020, 4, 30)])
+
+    def test_dict_round_trip(self):
+        recurrence = Recurrence(date(2020, 3, 13), unit='week', interval=2, time=time(12))
+        self.assertEqual(recurrence.to_dict(), {
+            'start': '2020-03-13',
+            'unit': 'week',
+            'interval': 2,
+            'weekday': 4,
+            'time': '12:00:00'
+        })
+        self.assertEqual(Recurrence.from_dict(recurrence.to_dict()), recurrence)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            Recurrence(date(2020, 1, 1), unit='hour')
+        with self.assertRaises(ValueError):
+            Recurrence(date(2020, 1, 1), interval=0)
+
+
+@mock.patch('kronosparser.delta_time_defs.utc_now', utc_now_mock)
+@mock.patch('kronosparser.delta_time_defs.utc_today', utc_today_mock)
+class TestRecurrenceGrammar(unittest.TestCase):
+    def test_weekdays(self):
+        self.assertEqual(parsed('every Monday'), [('every Monday', {
+            'recurrence': {
+                'start': '2020-03-16',
+                'unit': 'week',
+                'interval': 1,
+                'weekday': 0
+            }
+        })])
+        self.assertEqual(parsed('every other friday at noon'), [('every other friday at noon', {
+            'recurrence': {
+                'start': '2020-03-13',
+                'unit': 'week',
+                'interval': 2,
+                'weekday': 4,
+                'time': '12:00:00'
+            }
+        })])
+        self.assertEqual(parsed('every two weeks on monday'), [('every two weeks on monday', {
+            'recurrence': {
+                'start': '2020-03-16',
+                'unit': 'week',
+                'interval': 2,
+                'weekday': 0
+            }
+        })])
+
+    def test_units(self):
+        self.assertEqual(parsed('every 3 days at 9am'), [('every 3 days at 9am', {
+            'recurrence': {
+                'start': '2020-03-11',
+                'unit': 'day',
+                'interval': 3,
+                'time': '09:00:00'
+            }
+        })])
+        self.assertEqual(parsed('each month'), [('each month', {
+            'recurrence': {
+                'start': '2020-03-11',
+                'unit': 'month',
+                'interval': 1
+            }
+        })])
+
+    def test_locales(self):
+        self.assertEqual(parsed('todos los lunes a las 3pm', locale='es'),
+                         [('todos los lunes a las 3pm', {
+                             'recurrence': {
+                                 'start': '2020-03-16',
+                                 'unit': 'week',
+                                 'interval': 1,
+                                 'weekday': 0,
+                                 'time': '15:00:00'
+                             }
+                         })])
@@ -0,0 +1,144 @@
+import asyncio
+import json
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import unittest
+
+import mock
+from kronosparser import parse_dates
+from kronosparser.client import Client, ParseServerError
+from kronosparser.server import ParseServer
+
+
+class TestParseServer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.mkdtemp()
+        cls.path = os.path.join(cls.directory, 'kronosparser.sock')
+        cls.loop = asyncio.new_event_loop()
+        cls.server = ParseServer(batch_delay=0.005)
+        cls.loop.run_until_complete(cls.server.start_unix(cls.path))
+        cls.thread = threading.Thread(target=cls.loop.run_forever)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        asyncio.run_coroutine_threadsafe(cls.server.close(), cls.loop).result()
+        cls.loop.call_soon_threadsafe(cls.loop.stop)
+        cls.thread.join()
+        cls.loop.close()
+        shutil.rmtree(cls.directory)
+
+    def test_parse_dates(self):
+        with Client(path=self.path) as client:
+            self.assertEqual(client.parse_dates('the report is due 2020-03-12'),
+                             parse_dates('the report is due 2020-03-12'))
+
+    def test_pipelined_requests_keep_order(self):
+        texts = ['March 12th, 2020', 'nothing here', '2019-01-05', 'Q3 2018'] * 50
+        with Client(path=self.path, pipeline_depth=16) as client:
+            self.assertEqual(client.parse_many(texts), [parse_dates(text) for text in texts])
+
+    def test_concurrent_clients(self):
+        results = {}
+
+        def run(index):
+            with Client(path=self.path) as client:
+                results[index] = client.parse_many(['2020-03-{:02d}'.format(index + 1)] * 20)
+
+        threads = [threading.Thread(target=run, args=(i, )) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for index in range(8):
+            expected = [[{
+                'text': '2020-03-{:02d}'.format(index + 1),
+                'parsed': {
+                    'date': '2020-03-{:02d}'.format(index + 1)
+                },
+                'start': 0,
+                'end': 10
+            }]] * 20
+            self.assertEqual(results[index], expected)
+
+    def test_bad_timezone(self):
+        with Client(path=self.path) as client:
+            with self.assertRaises(ParseServerError):
+                client.parse_dates('2020-03-12', tz='Nowhere/Special')
+            self.assertEqual(len(client.parse_dates('2020-03-12')), 1)
+
+    def test_error_drains_pipelined_requests(self):
+        with Client(path=self.path, pipeline_depth=4) as client:
+            with self.assertRaises(ParseServerError):
+                client.parse_many(['2020-03-12', 'Q3 2018'], tz='Nowhere/Special')
+            with self.assertRaises(ParseServerError):
+                client.parse_many(['2020-03-12'] * 10, tz='Nowhere/Special')
+            self.assertEqual(
+                client.parse_many(['2020-03-12', 'Q3 2018']),
+                [parse_dates('2020-03-12'), parse_dates('Q3 2018')])
+
+    def test_raw_requests(self):
+        lines = [b'42', b'"error"', b'[1]', b'{"id": 7, "text": "2020-03-12", "error": 1}']
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.connect(self.path)
+            connection.sendall(b'\n'.join(lines) + b'\n')
+            connection.shutdown(socket.SHUT_WR)
+            with connection.makefile('rb') as reader:
+                responses = [json.loads(line) for line in reader]
+        self.assertEqual(len(responses), 4)
+        for response in responses[:3]:
+            self.assertIsNone(response['id'])
+            self.assertIn('error', response)
+        self.assertEqual(responses[3], {'id': 7, 'matches': parse_dates('2020-03-12')})
+
+
+class TestParseServerClose(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.loop = asyncio.new_event_loop()
+        self.release = threading.Event()
+
+    def tearDown(self):
+        self.release.set()
+        # Lets the server see the connection end
+        self.loop.run_until_complete(
+            asyncio.gather(*asyncio.all_tasks(self.loop), return_exceptions=True))
+        self.loop.close()
+        shutil.rmtree(self.directory)
+
+    async def close_with_outstanding_requests(self):
+        path = os.path.join(self.directory, 'kronosparser.sock')
+        server = ParseServer(batch_size=1)
+        await server.start_unix(path)
+        reader, writer = await asyncio.open_unix_connection(path)
+
+        def handle_batch(requests):
+            self.release.wait()
+            return [{'id': request.get('id'), 'matches': []} for request in requests]
+
+        try:
+            with mock.patch('kronosparser.server.handle_batch', side_effect=handle_batch):
+                # The first request is being parsed when the server closes, the second is queued
+                writer.write(b'{"id": 1, "text": "today"}\n{"id": 2, "text": "tomorrow"}\n')
+                await writer.drain()
+                while server.queue.qsize() != 1:
+                    await asyncio.sleep(0.01)
+                await server.close()
+                return [json.loads(await reader.readline()) for _ in range(2)]
+        finally:
+            writer.close()
+
+    def test_close_answers_outstanding_requests(self):
+        responses = self.loop.run_until_complete(
+            asyncio.wait_for(self.close_with_outstanding_requests(), 5))
+        self.assertEqual(responses, [{
+            'id': 1,
+            'error': 'server closing'
+        }, {
+            'id': 2,
+            'error': 'server closing'
+        }])
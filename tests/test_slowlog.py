@@ -0,0 +1,69 @@
+import io
+import json
+import unittest
+
+from kronosparser import get_grammar, parse_dates, slowlog, utils
+
+
+class TestSlowParseLog(unittest.TestCase):
+    def tearDown(self):
+        slowlog.disable()
+
+    def test_disabled(self):
+        self.assertIsNone(slowlog.recorder)
+        self.assertEqual(len(parse_dates('tomorrow')), 1)
+
+    def test_records(self):
+        recorder = slowlog.enable(threshold=0)
+        matches = parse_dates('see you tomorrow at 5pm')
+        record, = recorder.dump()
+        self.assertEqual(record['text'], 'see you tomorrow at 5pm')
+        self.assertEqual(record['length'], 23)
+        self.assertEqual(record['matches'], len(matches))
+        self.assertFalse(record['truncated'])
+        self.assertGreater(record['actions'], 0)
+        self.assertAlmostEqual(record['scan'] + record['actions'] + record['tz'], record['time'])
+
+    def test_threshold(self):
+        recorder = slowlog.enable(threshold=60)
+        parse_dates('tomorrow')
+        self.assertEqual(recorder.dump(), [])
+
+    def test_ring_buffer(self):
+        recorder = slowlog.enable(threshold=0, capacity=2)
+        for text in ('today', 'tomorrow', 'yesterday'):
+            parse_dates(text)
+        self.assertEqual([record['text'] for record in recorder.dump()], ['tomorrow', 'yesterday'])
+        recorder.clear()
+        self.assertEqual(recorder.dump(), [])
+
+    def test_sampling(self):
+        recorder = slowlog.enable(threshold=0, sample_rate=0)
+        parse_dates('today')
+        self.assertEqual(recorder.dump(), [])
+        with self.assertRaises(ValueError):
+            slowlog.SlowParseRecorder(sample_rate=2)
+
+    def test_redact(self):
+        recorder = slowlog.enable(threshold=0, redact=slowlog.shape)
+        parse_dates('Call Bob on 3/14')
+        stream = io.StringIO()
+        recorder.dump(stream)
+        self.assertEqual(json.loads(stream.getvalue())['text'], 'Aaaa Aaa aa 9/99')
+
+    def test_disable_restores_actions(self):
+        expression = get_grammar().delta_time
+        parse_dates('tomorrow')
+        before = [(element, element.parseAction) for element in utils.walk(expression)]
+        slowlog.enable(threshold=0)
+        parse_dates('tomorrow')
+        timed = slowlog._Timed  # pylint: disable=protected-access
+        self.assertTrue(all(isinstance(action, timed) for action in expression.parseAction))
+        slowlog.disable()
+        for element, actions in before:
+            self.assertIs(element.parseAction, actions)
+        uninstall = slowlog.instrument(expression)
+        self.assertIs(slowlog.instrument(expression), uninstall)
+        uninstall()
+        for element, actions in before:
+            self.assertIs(element.parseAction, actions)
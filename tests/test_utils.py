@@ -1,3 +1,6 @@
+import gc
+
+import pyparsing
 import kronosparser.utils
 
 from .utils import ParserTestCase
@@ -11,3 +14,42 @@ class TestUtils(ParserTestCase):
         self.assertParsed(
             kronosparser.utils.caseless_literal_or(['foo', 'foox', 'fooxyz', 'fooxy']), 'fooxyza',
             'fooxyz')
+
+    def test_scan_matches_scan_string(self):
+        expression = kronosparser.utils.caseless_keyword_or(['at', '@']) + pyparsing.Word(
+            pyparsing.nums) | pyparsing.Literal('good') + pyparsing.Literal('morning')
+        for text in ['meet at 5', 'that5 and @ 7', 'verygood morning', 'nothing', '']:
+            self.assertEqual([(tokens.asList(), start, end)
+                              for tokens, start, end in kronosparser.utils.scan(expression, text)],
+                             [(tokens.asList(), start, end)
+                              for tokens, start, end in expression.scanString(text)])
+
+    def test_trigger(self):
+        trigger = kronosparser.utils.get_trigger(
+            pyparsing.Optional(pyparsing.Literal('$')) + pyparsing.Regex(r'\b\d{4}\b'))
+        self.assertEqual([hit.start() for hit in trigger.finditer('in $2020 or 1999')], [3, 4, 12])
+        self.assertIsNone(kronosparser.utils.get_trigger(pyparsing.Optional('x')))
+
+    def test_find_all_max_matches(self):
+        parser = kronosparser.utils.caseless_literal_or(['foo'])
+        self.assertEqual(
+            [r['start'] for r in kronosparser.utils.find_all(parser, 'foo foo foo', 2)], [0, 4])
+        self.assertTrue(kronosparser.utils.has_match(parser, 'a foo'))
+        self.assertFalse(kronosparser.utils.has_match(parser, 'a bar'))
+
+    def test_truncate(self):
+        self.assertEqual(kronosparser.utils.truncate('next week', 20), 'next week')
+        self.assertEqual(kronosparser.utils.truncate('next week', 4), 'next')
+        self.assertEqual(kronosparser.utils.truncate('next week', 7), 'next')
+        self.assertEqual(kronosparser.utils.truncate('tomorrow', 4), 'tomo')
+
+    def test_no_cyclic_garbage(self):
+        text = 'good morning! I need the report now, by tomorrow noon, or next week'
+        kronosparser.parse_dates(text)
+        gc.collect()
+        gc.disable()
+        try:
+            kronosparser.parse_dates(text)
+            self.assertEqual(gc.collect(), 0)
+        finally:
+            gc.enable()
@@ -0,0 +1,59 @@
+from kronosparser.word_number import WordNumber, spoken_number
+
+from .utils import ParserTestCase
+
+
+class TestWordNumber(ParserTestCase):
+    def test_units_and_tens(self):
+        self.assertParsed(spoken_number, 'seven', 7)
+        self.assertParsed(spoken_number, 'twenty five', 25)
+        self.assertParsed(spoken_number, 'forty-five', 45)
+        self.assertParsed(spoken_number, 'Fourty Two', 42)
+
+    def test_hundreds_and_majors(self):
+        self.assertParsed(spoken_number, 'a hundred and ten', 110)
+        self.assertParsed(spoken_number, 'nineteen hundred and ninety nine', 1999)
+        self.assertParsed(spoken_number, 'two million, three hundred thousand and one', 2300001)
+
+    def test_stops_at_invalid_sequence(self):
+        self.assertFind(spoken_number, 'five six', [{
+            'text': 'five',
+            'parsed': 5,
+            'start': 0,
+            'end': 4
+        }, {
+            'text': 'six',
+            'parsed': 6,
+            'start': 5,
+            'end': 8
+        }])
+        self.assertFind(spoken_number, 'twenty and', {
+            'text': 'twenty',
+            'parsed': 20,
+            'start': 0,
+            'end': 6
+        })
+
+    def test_article_needs_multiplier(self):
+        self.assertParsed(spoken_number, 'a day', [])
+        self.assertParsed(spoken_number, 'an hour', [])
+        self.assertParsed(spoken_number, 'a thousand', 1000)
+
+    def test_custom_tables(self):
+        parser = WordNumber(unit_table={
+            'uno': 1,
+            'dos': 2
+        },
+                            tens_table={'veinte': 20},
+                            hundred_table={'cien': 100},
+                            major_table={'mil': 1000},
+                            articles=['un'],
+                            conjunctions=['y'])
+        self.assertParsed(parser, 'veinte y dos', 22)
+        self.assertParsed(parser, 'dos mil', 2000)
+
+    def test_memoized(self):
+        parser = WordNumber()
+        self.assertParsed(parser, 'twenty five or thirty five', [25, 35])
+        self.assertParsed(parser, 'TWENTY FIVE', 25)
+        self.assertEqual(parser.evaluate.cache_info().hits, 1)
@@ -1,6 +1,11 @@
 import unittest
 
 import kronosparser.utils
+from kronosparser import parse_dates
+
+
+def parsed(text, **kwargs):
+    return [(match['text'], match['parsed']) for match in parse_dates(text, **kwargs)]
 
 
 class ParserTestCase(unittest.TestCase):